@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Performance Benchmark Script
+Measures hot paths of the bot against throwaway local databases (no network needed)
+"""
+
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from io import BytesIO
+
+import aiosqlite
+
+from user_database import UserDatabase, current_week
+
+
+async def create_user_db(user_count):
+    """Fresh UserDatabase in a temp directory with user_count registered users"""
+    db = UserDatabase()
+    db.db_path = os.path.join(tempfile.mkdtemp(), 'benchmark.db')
+    await db.init_database()
+    await db.db.executemany('INSERT INTO users (user_id, first_name) VALUES (?, ?)',
+                            [(str(i), f'user{i}') for i in range(user_count)])
+    await db.db.commit()
+    return db
+
+
+async def legacy_signal_receipts(db, user_ids):
+    """Previous per-user path: UPDATE + SELECT + UPDATE/INSERT + INSERT for every recipient"""
+    week_start, week_end = current_week()
+    for user_id in user_ids:
+        await db.db.execute('''
+            UPDATE users SET
+                total_signals_received = total_signals_received + 1,
+                last_activity_date = datetime('now')
+            WHERE user_id = ?
+        ''', (user_id,))
+        cursor = await db.db.execute('''
+            SELECT activity_count FROM weekly_usage
+            WHERE user_id = ? AND week_start_date = ?
+        ''', (user_id, week_start))
+        if await cursor.fetchone():
+            await db.db.execute('''
+                UPDATE weekly_usage SET
+                    activity_count = activity_count + 1,
+                    last_activity = datetime('now')
+                WHERE user_id = ? AND week_start_date = ?
+            ''', (user_id, week_start))
+        else:
+            await db.db.execute('''
+                INSERT INTO weekly_usage (user_id, week_start_date, week_end_date, activity_count, last_activity)
+                VALUES (?, ?, ?, 1, datetime('now'))
+            ''', (user_id, week_start, week_end))
+        await db.db.execute('''
+            INSERT INTO user_activity (user_id, activity_type, activity_data)
+            VALUES (?, ?, ?)
+        ''', (user_id, 'signal_received', json.dumps({'timestamp': datetime.now().isoformat()})))
+        await db.db.commit()
+    await db.db.commit()
+
+
+async def snapshot(db):
+    cursor = await db.db.execute('SELECT SUM(total_signals_received) FROM users')
+    signals = (await cursor.fetchone())[0]
+    cursor = await db.db.execute('SELECT SUM(activity_count) FROM weekly_usage')
+    weekly = (await cursor.fetchone())[0]
+    cursor = await db.db.execute('SELECT COUNT(*) FROM user_activity')
+    activity = (await cursor.fetchone())[0]
+    return signals, weekly, activity
+
+
+async def benchmark_signal_receipts(user_count=10000, broadcasts=2):
+    """Per-user UPDATE loop vs set-based update_user_signals_received"""
+    print(f"📊 Signal receipt accounting: {user_count} recipients x {broadcasts} broadcasts")
+    user_ids = [str(i) for i in range(user_count)]
+    results = {}
+
+    for name in ('legacy loop', 'set-based'):
+        db = await create_user_db(user_count)
+        start = time.perf_counter()
+        for _ in range(broadcasts):
+            if name == 'legacy loop':
+                await legacy_signal_receipts(db, user_ids)
+            else:
+                await db.update_user_signals_received(user_ids)
+        elapsed = (time.perf_counter() - start) / broadcasts
+        results[name] = (elapsed, await snapshot(db))
+        await db.close()
+        print(f"   {name:<12} {elapsed * 1000:9.1f} ms per broadcast")
+
+    legacy_time, legacy_rows = results['legacy loop']
+    bulk_time, bulk_rows = results['set-based']
+    print(f"   {'✅' if legacy_rows == bulk_rows else '❌'} Same resulting counters: {bulk_rows}")
+    print(f"   ⚡ Speedup: {legacy_time / bulk_time:.1f}x\n")
+
+
+LEGACY_PROFILES_QUERY = '''
+    SELECT
+        u.*,
+        COALESCE(w.activity_count, 0) as current_week_activity,
+        COALESCE(w.last_activity, u.last_activity_date) as last_week_activity,
+        (SELECT COUNT(*) FROM user_activity WHERE user_id = u.user_id) as total_activities
+    FROM users u
+    LEFT JOIN weekly_usage w ON u.user_id = w.user_id
+        AND w.week_start_date = ?
+    ORDER BY u.last_activity_date DESC
+'''
+
+
+async def seed_activity(db, user_count, activity_per_user, weeks=12):
+    """Fill users, weekly_usage and user_activity with a few months of history"""
+    week_start, _ = current_week()
+    start = datetime.fromisoformat(week_start)
+    await db.db.executemany('''
+        INSERT INTO users (user_id, first_name, user_type, last_activity_date) VALUES (?, ?, ?, ?)
+    ''', [(str(i), f'user{i}', 'premium' if i % 10 == 0 else 'free',
+           (datetime.utcnow() - timedelta(hours=i % 48, minutes=30)).strftime('%Y-%m-%d %H:%M:%S'))
+          for i in range(user_count)])
+    await db.db.executemany('''
+        INSERT INTO weekly_usage (user_id, week_start_date, week_end_date, activity_count) VALUES (?, ?, ?, ?)
+    ''', [(str(i), (start - timedelta(weeks=w)).date().isoformat(),
+           (start - timedelta(weeks=w) + timedelta(days=6)).date().isoformat(), i % 7 + 1)
+          for i in range(user_count) for w in range(weeks)])
+    await db.db.executemany('''
+        INSERT INTO user_activity (user_id, activity_type, activity_data) VALUES (?, 'command_used', '{}')
+    ''', [(str(i % user_count),) for i in range(user_count * activity_per_user)])
+    await db.db.commit()
+
+
+async def timed(label, coroutine_factory, repeats=3):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        result = await coroutine_factory()
+    elapsed = (time.perf_counter() - start) / repeats
+    print(f"   {label:<28} {elapsed * 1000:9.1f} ms")
+    return elapsed, result
+
+
+async def benchmark_user_queries(user_count=2000, activity_per_user=25):
+    """Admin/stat queries on the original schema vs the migrated one (WAL, indexes, activity counter)"""
+    print(f"📊 User queries: {user_count} users, {user_count * activity_per_user} activity rows")
+    week_start, _ = current_week()
+
+    # Original schema: tables only, default pragmas, correlated COUNT(*) per user
+    before = UserDatabase()
+    before.db_path = os.path.join(tempfile.mkdtemp(), 'before.db')
+    before.db = await aiosqlite.connect(before.db_path)
+    await before.create_tables()
+    await seed_activity(before, user_count, activity_per_user)
+
+    async def legacy_profiles():
+        cursor = await before.db.execute(LEGACY_PROFILES_QUERY, (week_start,))
+        return [(row[0], row[17], row[19]) for row in await cursor.fetchall()]
+
+    print("   before:")
+    before_profiles = await timed('all users with profiles', legacy_profiles)
+    before_stats = await timed('user stats', before.get_user_stats)
+    before_weekly = await timed('weekly active users', before.get_weekly_active_users)
+    await before.db.close()
+
+    # Migrated schema: same data, then migrate() backfills the counter and builds the indexes
+    after = UserDatabase()
+    after.db_path = os.path.join(tempfile.mkdtemp(), 'after.db')
+    after.db = await aiosqlite.connect(after.db_path)
+    await after.create_tables()
+    await seed_activity(after, user_count, activity_per_user)
+    await after.apply_pragmas()
+    start = time.perf_counter()
+    await after.migrate()
+    print(f"   migration (one-off)          {(time.perf_counter() - start) * 1000:9.1f} ms")
+
+    async def profiles():
+        return [(u['user_id'], u['current_week_activity'], u['total_activities'])
+                for u in await after.get_all_users_with_profiles()]
+
+    print("   after:")
+    after_profiles = await timed('all users with profiles', profiles)
+    after_stats = await timed('user stats', after.get_user_stats)
+    after_weekly = await timed('weekly active users', after.get_weekly_active_users)
+    await after.close()
+
+    same = (sorted(before_profiles[1]) == sorted(after_profiles[1]) and before_stats[1] == after_stats[1]
+            and before_weekly[1] == after_weekly[1])
+    print(f"   {'✅' if same else '❌'} Same results before and after")
+    for name, old, new in (('profiles', before_profiles, after_profiles), ('stats', before_stats, after_stats),
+                           ('weekly active', before_weekly, after_weekly)):
+        print(f"   ⚡ {name}: {old[0] / new[0]:.1f}x")
+    print()
+
+
+def legacy_render_chart(symbol, timestamps, closes, ema20, dpi=150):
+    """The previous renderer: a fresh pyplot figure, tight_layout and a tight bbox on every chart"""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.dates as mdates
+    import matplotlib.pyplot as plt
+    import numpy as np
+
+    plt.style.use('dark_background')
+    times = np.array(timestamps, dtype='datetime64[ms]')
+    close = np.asarray(closes, dtype=float)
+    ema = np.asarray(ema20, dtype=float)
+    fig, ax = plt.subplots(1, 1, figsize=(10, 6))
+    fig.patch.set_facecolor('#0f1419')
+    ax.plot(times, close, color='#00d4aa', linewidth=2.5, label='Price')
+    ax.plot(times, ema, color='#ff6b35', linewidth=2, label='EMA20')
+    ax.fill_between(times, close, ema, where=close > ema, alpha=0.2, color='green')
+    ax.set_title(f"{symbol.replace('USDT', '')}/USDT", color='white', fontsize=18, fontweight='bold', pad=20)
+    ax.legend(loc='upper left', fontsize=12)
+    ax.grid(True, alpha=0.2)
+    ax.set_facecolor('#0f1419')
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
+    ax.tick_params(colors='white', labelsize=10)
+    ax.annotate(f'${close[-1]:.4f}', xy=(times[-1], close[-1]), xytext=(10, 10), textcoords='offset points',
+                bbox=dict(boxstyle='round,pad=0.3', facecolor='#00d4aa', alpha=0.8),
+                color='white', fontsize=11, fontweight='bold')
+    plt.tight_layout()
+    buffer = BytesIO()
+    plt.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight', facecolor='#0f1419', edgecolor='none')
+    plt.close()
+    return buffer.getvalue()
+
+
+def benchmark_chart_rendering(renders=20):
+    """Per-render time and size of the chart renderer, in-process (one worker's view)"""
+    from chart_service import render_trading_chart
+
+    print(f"📊 Chart rendering: {renders} charts of 48 hourly candles per variant")
+    random.seed(1)
+    start_ms = 1_700_000_000_000
+    charts = []
+    for n in range(renders):
+        closes = [95000 + random.uniform(-500, 300) + max(0, i - 40) * 200 for i in range(48)]
+        ema20 = [sum(closes[max(0, i - 19):i + 1]) / len(closes[max(0, i - 19):i + 1]) for i in range(48)]
+        timestamps = [start_ms + (n * 48 + i) * 3_600_000 for i in range(48)]
+        charts.append(('BTCUSDT', timestamps, closes, ema20))
+
+    variants = (
+        ('pyplot per chart (before)', lambda chart: legacy_render_chart(*chart)),
+        ('template PNG @150 dpi', lambda chart: render_trading_chart(*chart, dpi=150, image_format='png')[0]),
+        ('template PNG @100 dpi', lambda chart: render_trading_chart(*chart, dpi=100, image_format='png')[0]),
+        ('template WebP @150 dpi', lambda chart: render_trading_chart(*chart, dpi=150, image_format='webp')[0]),
+    )
+    baseline = None
+    for label, render in variants:
+        render(charts[0])  # First call builds the figure/template and loads fonts
+        start = time.perf_counter()
+        sizes = [len(render(chart)) for chart in charts]
+        elapsed = (time.perf_counter() - start) / renders
+        baseline = baseline or elapsed
+        print(f"   {label:<28} {elapsed * 1000:7.1f} ms/render {sum(sizes) / len(sizes) / 1024:7.1f} KB"
+              f"   {baseline / elapsed:4.1f}x")
+    print()
+
+
+def import_time(statement, repeats=3):
+    """Best-of-N total seconds `python -X importtime` reports for a statement"""
+    best = None
+    for _ in range(repeats):
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                                cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True)
+        total = 0
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:') or 'cumulative' in line:
+                continue
+            _, cumulative, name = line[len('import time:'):].split('|')
+            if not name.startswith('  '):  # Top-level imports only; nested ones are in their parent's total
+                total += int(cumulative) / 1_000_000
+        best = total if best is None else min(best, total)
+    return best
+
+
+def benchmark_startup():
+    """Import cost of the bot entry point, with the heavy modules deferred vs loaded up front"""
+    from simple_bot import DEFERRED_MODULES
+
+    print("📊 Startup imports (python -X importtime, best of 3)")
+    eager_modules = ', '.join(DEFERRED_MODULES + ('aiohttp.web', 'tradingview_integration'))
+    deferred_total = import_time('import main')
+    eager_total = import_time(f'import main, {eager_modules}')
+    print(f"   {'import main (deferred)':<28} {deferred_total * 1000:9.1f} ms")
+    print(f"   {'+ analysis/webhook modules':<28} {eager_total * 1000:9.1f} ms  (what startup used to pay)")
+    print(f"   ⚡ {eager_total / deferred_total:.1f}x less import work before the first update\n")
+
+
+async def main():
+    user_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    print("🚀 Starting Performance Benchmarks\n")
+    benchmark_startup()
+    await benchmark_signal_receipts(user_count)
+    await benchmark_user_queries()
+    benchmark_chart_rendering()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
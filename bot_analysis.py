@@ -0,0 +1,445 @@
+import time
+
+
+class SignalAnalysis:
+    """Breakout strategy: indicators, entry criteria, screening and signal messages (mixed into SimpleCryptoBot)"""
+
+    def calculate_rsi(self, prices, period=14):
+        """Calculate RSI indicator with Wilder smoothing"""
+        delta = prices.diff()
+        gain = (delta.where(delta > 0, 0)).ewm(alpha=1 / period, min_periods=period, adjust=False).mean()
+        loss = (-delta.where(delta < 0, 0)).ewm(alpha=1 / period, min_periods=period, adjust=False).mean()
+        rs = gain / loss
+        return 100 - (100 / (1 + rs))
+    
+    def calculate_signal_strength(self, price_data, volume_data):
+        """Calculate signal strength and recommendation based on multiple factors"""
+        import pandas as pd
+        try:
+            # Convert to DataFrame for analysis
+            df = pd.DataFrame({
+                'close': [float(x[4]) for x in price_data],
+                'volume': [float(x[5]) for x in price_data]
+            })
+            
+            # Calculate indicators
+            df['ema20'] = self.calculate_ema(df['close'])
+            df['volume_ma'] = df['volume'].rolling(window=20).mean()
+            df['rsi'] = self.calculate_rsi(df['close'])
+            
+            current_price = df['close'].iloc[-1]
+            current_ema20 = df['ema20'].iloc[-1]
+            current_volume = df['volume'].iloc[-1]
+            avg_volume = df['volume_ma'].iloc[-1]
+            current_rsi = df['rsi'].iloc[-1]
+            
+            # Calculate strength factors
+            strength_score = 0
+            
+            # EMA20 breakout strength (0-30 points)
+            price_above_ema = ((current_price - current_ema20) / current_ema20) * 100
+            if price_above_ema > 2:
+                strength_score += 30
+            elif price_above_ema > 1:
+                strength_score += 25
+            elif price_above_ema > 0.5:
+                strength_score += 20
+            elif price_above_ema > 0:
+                strength_score += 15
+            
+            # Volume confirmation (0-25 points)
+            volume_ratio = current_volume / avg_volume if avg_volume > 0 else 1
+            if volume_ratio > 2:
+                strength_score += 25
+            elif volume_ratio > 1.5:
+                strength_score += 20
+            elif volume_ratio > 1.2:
+                strength_score += 15
+            elif volume_ratio > 1:
+                strength_score += 10
+            
+            # RSI momentum (0-20 points)
+            if 50 <= current_rsi <= 70:
+                strength_score += 20
+            elif 45 <= current_rsi <= 75:
+                strength_score += 15
+            elif 40 <= current_rsi <= 80:
+                strength_score += 10
+            elif current_rsi < 80:
+                strength_score += 5
+            
+            # Trend consistency (0-15 points)
+            recent_closes = df['close'].tail(5)
+            uptrend = sum(recent_closes.diff().dropna() > 0) / 4
+            strength_score += int(uptrend * 15)
+            
+            # Volume trend (0-10 points)
+            recent_volumes = df['volume'].tail(3)
+            if len(recent_volumes) >= 2:
+                volume_increasing = recent_volumes.iloc[-1] > recent_volumes.iloc[-2]
+                if volume_increasing:
+                    strength_score += 10
+                else:
+                    strength_score += 5
+            
+            # Calculate simple breakout confirmations for recommendation
+            ema_breakout_confirmed = price_above_ema > 0  # Price above EMA20
+            volume_confirmed = volume_ratio >= 1.5  # High volume
+            strong_momentum = current_rsi >= 50 and current_rsi <= 75  # Good RSI range
+            
+            # Flexible recommendation system based on signal strength
+            if strength_score >= 85 and ema_breakout_confirmed and volume_confirmed:
+                recommendation = "STRONG BUY"
+                confidence = "EXTREMELY HIGH"
+                emoji = "🚀🚀🚀"
+                visual_strength = "🟢🟢🟢🟢🟢"
+            elif strength_score >= 70 and (ema_breakout_confirmed or volume_confirmed):
+                recommendation = "BUY"
+                confidence = "HIGH"
+                emoji = "🚀🚀"
+                visual_strength = "🟢🟢🟢🟢⚪"
+            elif strength_score >= 55 or ema_breakout_confirmed or volume_confirmed:
+                recommendation = "CONSIDER"
+                confidence = "MODERATE"
+                emoji = "🚀"
+                visual_strength = "🟢🟢🟢⚪⚪"
+            elif strength_score >= 55:
+                recommendation = "WEAK BUY"
+                confidence = "LOW"
+                emoji = "📈"
+                visual_strength = "🟢🟢⚪⚪⚪"
+            else:
+                recommendation = "HOLD"
+                confidence = "VERY LOW"
+                emoji = "⚠️"
+                visual_strength = "🟢⚪⚪⚪⚪"
+            
+            return {
+                'recommendation': recommendation,
+                'confidence': confidence,
+                'emoji': emoji,
+                'visual_strength': visual_strength,
+                'score': strength_score,
+                'price_above_ema': price_above_ema,
+                'volume_ratio': volume_ratio,
+                'rsi': current_rsi,
+                'trend_strength': uptrend * 100,
+                'ema20_series': df['ema20'].tolist()  # Reused by create_trading_chart
+            }
+            
+        except Exception as e:
+            print(f"❌ Error calculating signal strength: {e}")
+            return {
+                'recommendation': "BUY",
+                'confidence': "MODERATE",
+                'emoji': "🚀",
+                'visual_strength': "🟢🟢🟢⚪⚪",
+                'score': 70,
+                'price_above_ema': 1.0,
+                'volume_ratio': 1.5,
+                'rsi': 60,
+                'trend_strength': 70
+            }
+    
+    def calculate_ema(self, prices, period=20):
+        """Calculate EMA"""
+        return prices.ewm(span=period, adjust=False).mean()
+    
+    def calculate_sma(self, prices, period=200):
+        """Calculate Simple Moving Average"""
+        return prices.rolling(window=period).mean()
+    
+    def is_bullish_candle(self, df):
+        """Check if the last candle is bullish"""
+        if len(df) < 1:
+            return False
+        last_candle = df.iloc[-1]
+        return last_candle['close'] > last_candle['open']
+    
+    def check_breakout(self, df):
+        """Check for EMA20 breakout - price must break AND close above EMA20"""
+        if len(df) < 2:
+            return False
+        
+        current_candle = df.iloc[-1]
+        previous_candle = df.iloc[-2]
+        
+        # Current criteria: 
+        # 1. Current candle closes above EMA20
+        # 2. Previous candle was below or at EMA20 (this is the "break")
+        # 3. Current candle also breaks above EMA20 during the session (high > EMA20)
+        
+        breakout_condition = (
+            current_candle['close'] > current_candle['ema20'] and  # Close above EMA20
+            previous_candle['close'] <= previous_candle['ema20'] and  # Previous was below/at EMA20 
+            current_candle['high'] > current_candle['ema20']  # Price broke above EMA20 during session
+        )
+        
+        return breakout_condition
+    
+    def is_high_volume(self, df):
+        """Check for high volume (1.5x average) - improved calculation"""
+        if len(df) < 20:
+            return False
+        
+        # Use rolling average of last 20 periods excluding current candle
+        avg_volume = df['volume'].iloc[-21:-1].mean() if len(df) >= 21 else df['volume'].iloc[:-1].mean()
+        current_volume = df['volume'].iloc[-1]
+        
+        volume_ratio = current_volume / avg_volume if avg_volume > 0 else 0
+        
+        # High volume threshold: 1.5x average
+        return volume_ratio >= 1.5
+    
+    def is_very_high_volume(self, df):
+        """Check for very high volume (2x average) - optional criteria"""
+        if len(df) < 20:
+            return False
+        
+        avg_volume = df['volume'].iloc[:-1].mean()
+        last_volume = df['volume'].iloc[-1]
+        
+        return last_volume > avg_volume * 2.0
+    
+    def check_optional_criteria(self, df_4h, df_1d, ind_4h=None, ind_1d=None):
+        """Check optional criteria and return status (ind_* are IndicatorEngine snapshots)"""
+        optional_signals = {}
+        
+        # RSI > 50 on 4H timeframe
+        rsi_4h = ind_4h.get('rsi') if ind_4h else None
+        if rsi_4h is None and len(df_4h) >= 14:
+            rsi_4h = self.calculate_rsi(df_4h['close']).iloc[-1]
+        if rsi_4h is not None:
+            optional_signals['rsi_bullish'] = rsi_4h > 50
+            optional_signals['rsi_value'] = round(rsi_4h, 1)
+        else:
+            optional_signals['rsi_bullish'] = False
+            optional_signals['rsi_value'] = 0
+        
+        # Volume is 2x average (instead of 1.5x)
+        optional_signals['volume_2x'] = self.is_very_high_volume(df_4h)
+        
+        # Price above 200 SMA on daily timeframe
+        sma_200 = ind_1d.get('sma200') if ind_1d else None
+        if sma_200 is None and len(df_1d) >= 200:
+            sma_200 = self.calculate_sma(df_1d['close'], 200).iloc[-1]
+        if sma_200 is not None:
+            current_price = df_1d['close'].iloc[-1]
+            optional_signals['above_200sma'] = current_price > sma_200
+            optional_signals['sma200_distance'] = round(((current_price - sma_200) / sma_200) * 100, 1)
+        else:
+            optional_signals['above_200sma'] = False
+            optional_signals['sma200_distance'] = 0
+        
+        # Bullish candle pattern on 4H
+        optional_signals['bullish_candle'] = self.is_bullish_candle(df_4h)
+        
+        return optional_signals
+    
+    def klines_to_df(self, klines, indicators):
+        """Build the analysis DataFrame for one timeframe"""
+        import pandas as pd
+        df = pd.DataFrame(klines)
+        
+        # Set column names if data exists
+        columns = ['open_time', 'open', 'high', 'low', 'close', 'volume',
+                  'close_time', 'quote_asset_volume', 'trades',
+                  'taker_base_vol', 'taker_quote_vol', 'ignore']
+        if len(df.columns) >= 12:
+            df.columns = columns
+        else:
+            df.columns = columns[:len(df.columns)]
+        
+        for column in ['open', 'high', 'low', 'close', 'volume']:
+            df[column] = df[column].astype(float)
+        df['ema20'] = indicators['ema20_series']
+        return df
+    
+    def screen_symbols(self, symbol_data):
+        """Evaluate the precise criteria for all symbols at once with the vectorized screener"""
+        timeframes = {interval: {'klines': {}, 'ema20': {}} for interval in ('4h', '1d')}
+        for symbol, frames in symbol_data.items():
+            if not frames:
+                continue
+            for interval, (klines, indicators) in frames.items():
+                timeframes[interval]['klines'][symbol] = klines
+                timeframes[interval]['ema20'][symbol] = indicators['ema20_series']
+        
+        # PRECISE CRITERIA per timeframe: close above EMA20 + EMA20 rising + resistance breakout
+        # + 1.5-2x volume surge + close above resistance + 70%+ body momentum candle
+        if self.screener is None:
+            from screener import CrossSectionalScreener
+            self.screener = CrossSectionalScreener()
+        start = time.perf_counter()
+        report = self.screener.screen(timeframes)
+        screen_time = time.perf_counter() - start
+        print(f"🧮 Screened {len(report['symbols'])} symbols x 2 timeframes in {screen_time * 1000:.1f}ms")
+        
+        results = {}
+        for index, symbol in enumerate(report['symbols']):
+            hourly_signal = bool(report['timeframes']['4h']['mask'][index])  # Using 4H as proxy for 1H
+            daily_signal = bool(report['timeframes']['1d']['mask'][index])
+            
+            # Signal when EITHER hourly OR daily meets ALL criteria (or both for strongest signals)
+            precise_signal = hourly_signal or daily_signal
+            both_timeframes_precise = hourly_signal and daily_signal
+            
+            # Debug information for major pairs
+            if symbol in ['BTCUSDT', 'ETHUSDT', 'XRPUSDT', 'LDOUSDT']:
+                breakdown = self.screener.breakdown(report, symbol)
+                print(f"🔍 {symbol} Analysis (PRECISE CRITERIA):")
+                for label, interval in (('1H', '4h'), ('1D', '1d')):
+                    checks = breakdown[interval]
+                    print(f"   {label}: EMA20 above={checks['close_above_ema']}, Rising={checks['ema_rising']}, "
+                          f"Resistance={checks['resistance_breakout']}")
+                    print(f"       Volume={checks['volume_surge']}, Close above={checks['close_above_resistance']}, "
+                          f"Momentum={checks['momentum_candle']}")
+                print(f"   Hourly Signal: {hourly_signal}, Daily Signal: {daily_signal}")
+                if precise_signal:
+                    signal_strength = "BOTH TIMEFRAMES" if both_timeframes_precise else "SINGLE TIMEFRAME"
+                    print(f"   ✅ SIGNAL GENERATED: {signal_strength} meets all precise criteria")
+                else:
+                    print(f"   ❌ NO SIGNAL: Precise criteria not met on any timeframe")
+            
+            if not precise_signal:
+                results[symbol] = (False, None, None, None)
+                continue
+            
+            # DataFrames are only built for the few symbols that passed the screen
+            try:
+                klines_4h, ind_4h = symbol_data[symbol]['4h']
+                klines_1d, ind_1d = symbol_data[symbol]['1d']
+                df_4h = self.klines_to_df(klines_4h, ind_4h)
+                df_1d = self.klines_to_df(klines_1d, ind_1d)
+                
+                criteria_4h = report['timeframes']['4h']['criteria']
+                criteria_1d = report['timeframes']['1d']['criteria']
+                
+                # Enhanced optional criteria with timeframe information
+                optional_criteria = self.check_optional_criteria(df_4h, df_1d, ind_4h, ind_1d)
+                optional_criteria['timeframe_info'] = {
+                    'hourly_signal': hourly_signal,
+                    'daily_signal': daily_signal,
+                    'both_timeframes': both_timeframes_precise,
+                    'signal_strength': 'extremely_strong' if both_timeframes_precise else 'strong',
+                    'ema_rising_1h': bool(criteria_4h['ema_rising'][index]),
+                    'ema_rising_1d': bool(criteria_1d['ema_rising'][index]),
+                    'resistance_breakout': bool(criteria_4h['resistance_breakout'][index] or
+                                                criteria_1d['resistance_breakout'][index]),
+                    'momentum_candle': bool(criteria_4h['momentum_candle'][index] or
+                                            criteria_1d['momentum_candle'][index])
+                }
+                criteria_met = "BOTH TIMEFRAMES" if both_timeframes_precise else "SINGLE TIMEFRAME"
+                print(f"✅ PRECISE CRITERIA MET for {symbol}: {criteria_met} - EMA rising + resistance breakout + volume surge + momentum")
+                results[symbol] = (True, optional_criteria, df_4h, df_1d)
+            except Exception as e:
+                print(f"Error analyzing {symbol}: {e}")
+                results[symbol] = (False, None, None, None)
+        
+        return results
+    
+    async def analyze_symbol(self, session, symbol):
+        """Analyze symbol for trading signals with optional criteria"""
+        try:
+            symbol_data = await self.fetch_symbol_klines(session, symbol)
+            if not symbol_data:
+                return False, None, None, None
+            
+            return self.screen_symbols({symbol: symbol_data}).get(symbol, (False, None, None, None))
+            
+        except Exception as e:
+            print(f"Error analyzing {symbol}: {e}")
+            return False, None, None, None
+    
+    def calculate_trading_levels(self, current_price, df_4h, df_1d, optional_criteria):
+        """Calculate entry, take profit, and stop loss levels"""
+        try:
+            # Get recent price data
+            recent_high = df_4h['high'].tail(10).max()
+            recent_low = df_4h['low'].tail(10).min()
+            
+            # Entry point (current price)
+            entry_price = current_price
+            
+            # Calculate signal strength (0-4)
+            signal_strength = sum([
+                optional_criteria['rsi_bullish'],
+                optional_criteria['volume_2x'],
+                optional_criteria['above_200sma'],
+                optional_criteria['bullish_candle']
+            ])
+            
+            # Adjust risk based on signal strength (4 = strongest, 0 = weakest)
+            risk_multiplier = 1.0 + (signal_strength * 0.2)  # 1.0x to 1.8x
+            
+            # Stop loss (2-3% below entry or below recent support)
+            stop_loss_pct = 2.5 / risk_multiplier  # Tighter stops for stronger signals
+            stop_loss = max(entry_price * (1 - stop_loss_pct/100), recent_low * 0.995)
+            
+            # Take profit levels
+            tp1_pct = 4.0 * risk_multiplier  # 4-7.2% 
+            tp2_pct = 8.0 * risk_multiplier  # 8-14.4%
+            tp3_pct = 15.0 * risk_multiplier  # 15-27%
+            
+            tp1 = entry_price * (1 + tp1_pct/100)
+            tp2 = entry_price * (1 + tp2_pct/100)
+            tp3 = entry_price * (1 + tp3_pct/100)
+            
+            # Risk warning level (when to be cautious)
+            risk_warning = tp2  # After TP2, higher risk
+            
+            return {
+                'entry': entry_price,
+                'stop_loss': stop_loss,
+                'tp1': tp1,
+                'tp2': tp2,
+                'tp3': tp3,
+                'risk_warning': risk_warning,
+                'signal_strength': signal_strength,
+                'risk_reward_ratio': (tp1 - entry_price) / (entry_price - stop_loss) if entry_price > stop_loss else 0
+            }
+            
+        except Exception as e:
+            print(f"Error calculating trading levels: {e}")
+            return None
+    
+    async def create_enhanced_signal_message(self, symbol, optional_criteria, df_4h, df_1d, session):
+        """Create clean, concise trading signal for long position entry"""
+        try:
+            # Get current price from data
+            current_price = float(df_4h['close'].iloc[-1])
+            coin_name = symbol.replace('USDT', '')
+            
+            # Get signal strength
+            timeframe_info = optional_criteria.get('timeframe_info', {})
+            both_tf = timeframe_info.get('both_timeframes', False)
+            h4_breakout = timeframe_info.get('4h_breakout', False)
+            d1_breakout = timeframe_info.get('1d_breakout', False)
+            
+            # Determine signal strength
+            if both_tf:
+                signal = "🚀 STRONG BUY"
+            elif h4_breakout or d1_breakout:
+                signal = "📈 BUY"
+            else:
+                signal = "⚡ CONSIDER"
+            
+            # Calculate trading levels
+            entry = current_price
+            stop_loss = current_price * 0.975  # 2.5% stop loss
+            tp1 = current_price * 1.06  # 6% profit
+            tp2 = current_price * 1.12  # 12% profit
+            
+            # Create clean message
+            message = f"{signal} {coin_name}/USDT\n\n"
+            message += f"💰 Entry: ${entry:.4f}\n"
+            message += f"🛑 Stop: ${stop_loss:.4f} (-2.5%)\n"
+            message += f"🎯 TP1: ${tp1:.4f} (+6%)\n"
+            message += f"🎯 TP2: ${tp2:.4f} (+12%)\n\n"
+            message += "✅ EMA20 Breakout Confirmed"
+            
+            return message
+            
+        except Exception as e:
+            print(f"Error creating signal: {e}")
+            return f"🚀 BUY {symbol.replace('USDT', '')}/USDT\n\nEMA20 Breakout Detected"
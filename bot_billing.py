@@ -0,0 +1,383 @@
+from datetime import datetime
+
+
+class Billing:
+    """Free tier, premium subscriptions and crypto payments (mixed into SimpleCryptoBot)"""
+
+    def is_user_premium(self, user_id):
+        """Check if user has premium access - first 100 users get PERMANENT access, then paid only"""
+        user_id = str(user_id)
+        
+        # Admin always has access
+        if self.is_admin(user_id):
+            return True
+        
+        # First 100 users get PERMANENT premium access (grandfathered forever)
+        if user_id in self.free_users:
+            return True
+        
+        # Paid users always have access
+        if user_id in self.paid_users:
+            return True
+        
+        # New users after 100 free users need to pay
+        return False
+    
+    def can_add_free_user(self):
+        """Check if we can add more free users"""
+        return len(self.free_users) < self.max_free_users
+    
+    def add_free_user(self, user_id):
+        """Add user to free tier if under limit"""
+        user_id = str(user_id)
+        if self.can_add_free_user() and user_id not in self.free_users and user_id not in self.paid_users:
+            self.state.add_free_user(user_id)
+            print(f"✅ Added free tier access for user: {user_id} ({len(self.free_users)}/{self.max_free_users})")
+            return True
+        return False
+    
+    def add_premium_user(self, user_id, plan_days=30):
+        """Add user to premium subscribers with expiry tracking"""
+        user_id = str(user_id)
+        
+        # Set subscription expiry date
+        import datetime
+        expiry_date = datetime.datetime.now() + datetime.timedelta(days=plan_days)
+        self.state.set_premium(user_id, expiry_date)
+        
+        print(f"✅ Added premium access for user: {user_id} (expires: {expiry_date.strftime('%Y-%m-%d')})")
+    
+    async def handle_subscription_event(self, event, user_id, expiry_date):
+        """Expire a subscription or send its renewal reminder when the scheduler fires"""
+        if event == 'expire':
+            self.state.remove_premium(user_id)
+            print(f"⏰ Subscription expired for user: {user_id}")
+        elif event == 'reminder':
+            days_left = max(1, -(-(expiry_date - datetime.now()).total_seconds() // 86400))
+            lang = self.get_user_language(user_id)
+            message = self.messages[lang]['subscription_reminder'].format(
+                days=int(days_left), date=expiry_date.strftime('%Y-%m-%d'))
+            await self.send_message(message, target_chat_id=user_id)
+            print(f"🔔 Renewal reminder sent to user {user_id} ({int(days_left)} days left)")
+    
+    def verify_payment(self, user_id, payment_method, amount):
+        """Verify payment and grant premium access"""
+        # This would integrate with real payment verification system
+        # For now, admin can manually verify payments
+        user_id = str(user_id)
+        payment_info = {
+            'method': payment_method,
+            'amount': amount,
+            'status': 'pending'
+        }
+        self.state.set_pending_payment(user_id, payment_info)
+        print(f"💳 Payment verification needed for user {user_id}: {payment_method} ${amount}")
+        return True
+    
+    async def send_subscription_menu(self, user_id, message_id, chat_id):
+        """Send subscription plans keyboard"""
+        lang = self.get_user_language(user_id)
+        
+        # Precomputed plans keyboard and localized subscription menu content
+        keyboard = self.messages.keyboard(lang, 'subscription')
+        messages = self.messages[lang]
+        text = f"{messages['subscription_menu']}\n\n{messages['subscription_plans']}"
+        
+        await self.send_keyboard_message(text, keyboard, message_id, chat_id)
+    
+    async def handle_subscription_selection(self, user_id, plan, callback_id):
+        """Handle subscription plan selection - show plan details and payment methods"""
+        try:
+            await self.answer_callback_query(callback_id)
+            
+            plan_info = self.subscription_plans.get(plan)
+            if not plan_info:
+                return
+                
+            # Store the selected plan for this user
+            self.user_selected_plan = getattr(self, 'user_selected_plan', {})
+            self.user_selected_plan[user_id] = plan
+            
+            lang = self.get_user_language(user_id)
+            
+            # Plan details and the precomputed payment method keyboard for this plan
+            messages = self.messages[lang]
+            message = messages['plan_details'].format(plan_name=messages.get(f'plan_{plan}', plan_info['description']),
+                                                      price=plan_info['price'], days=plan_info['days'])
+            keyboard = self.messages.keyboard(lang, f'payment_{plan}')
+            
+            await self.send_keyboard_message(message, keyboard, target_chat_id=user_id)
+            
+        except Exception as e:
+            print(f"❌ Error handling subscription selection: {e}")
+    
+    async def handle_payment_address(self, user_id, plan, method, callback_id):
+        """Show individual payment address for easy copying"""
+        try:
+            await self.answer_callback_query(callback_id)
+            
+            # Get plan info for amount
+            plan_info = self.subscription_plans.get(plan)
+            if not plan_info:
+                return
+            
+            lang = self.get_user_language(user_id)
+            
+            # Create clean payment address message based on method
+            if method == 'btc':
+                if lang == 'en':
+                    message = f"₿ **Bitcoin (BTC) Payment**\n\n"
+                    message += f"💰 **Amount:** ${plan_info['price']} USD equivalent\n\n"
+                    message += "**Payment Address:**\n"
+                elif lang == 'es':
+                    message = f"₿ **Pago Bitcoin (BTC)**\n\n"
+                    message += f"💰 **Cantidad:** ${plan_info['price']} USD equivalente\n\n"
+                    message += "**Dirección de Pago:**\n"
+                elif lang == 'fr':
+                    message = f"₿ **Paiement Bitcoin (BTC)**\n\n"
+                    message += f"💰 **Montant:** ${plan_info['price']} USD équivalent\n\n"
+                    message += "**Adresse de Paiement:**\n"
+                elif lang == 'de':
+                    message = f"₿ **Bitcoin (BTC) Zahlung**\n\n"
+                    message += f"💰 **Betrag:** ${plan_info['price']} USD Äquivalent\n\n"
+                    message += "**Zahlungsadresse:**\n"
+                elif lang == 'ru':
+                    message = f"₿ **Оплата Bitcoin (BTC)**\n\n"
+                    message += f"💰 **Сумма:** ${plan_info['price']} USD эквивалент\n\n"
+                    message += "**Адрес для оплаты:**\n"
+                else:
+                    message = f"₿ **Bitcoin (BTC) Payment**\n\n"
+                    message += f"💰 **Amount:** ${plan_info['price']} USD equivalent\n\n"
+                    message += "**Payment Address:**\n"
+                
+                # Add address in monospace
+                await self.send_message(message, target_chat_id=user_id)
+                
+                # Send address as separate message for easy copying
+                await self.send_message("12avETUACYneRXng9fno38XRktKZFC8yxZ", target_chat_id=user_id)
+                
+                # Send instructions
+                if lang == 'en':
+                    instructions = "📧 After payment, send proof to @avie_support\n"
+                    instructions += f"Include your Telegram ID: {user_id}\n\n"
+                    instructions += "⚡ Activation within 1 hour"
+                elif lang == 'es':
+                    instructions = "📧 Después del pago, envía comprobante a @avie_support\n"
+                    instructions += f"Incluye tu ID de Telegram: {user_id}\n\n"
+                    instructions += "⚡ Activación en 1 hora"
+                elif lang == 'fr':
+                    instructions = "📧 Après paiement, envoyez preuve à @avie_support\n"
+                    instructions += f"Incluez votre ID Telegram: {user_id}\n\n"
+                    instructions += "⚡ Activation sous 1 heure"
+                elif lang == 'de':
+                    instructions = "📧 Nach Zahlung, senden Sie Nachweis an @avie_support\n"
+                    instructions += f"Ihre Telegram ID: {user_id}\n\n"
+                    instructions += "⚡ Aktivierung innerhalb 1 Stunde"
+                elif lang == 'ru':
+                    instructions = "📧 После оплаты отправьте подтверждение @avie_support\n"
+                    instructions += f"Укажите ваш Telegram ID: {user_id}\n\n"
+                    instructions += "⚡ Активация в течение 1 часа"
+                else:
+                    instructions = "📧 After payment, send proof to @avie_support\n"
+                    instructions += f"Include your Telegram ID: {user_id}\n\n"
+                    instructions += "⚡ Activation within 1 hour"
+                
+                keyboard = self.create_back_to_menu_keyboard(lang)
+                await self.send_keyboard_message(instructions, keyboard, target_chat_id=user_id)
+                
+            elif method == 'eth':
+                if lang == 'en':
+                    message = f"⟠ **Ethereum (ETH) Payment**\n\n"
+                    message += f"💰 **Amount:** ${plan_info['price']} USD equivalent\n\n"
+                    message += "**Payment Address:**\n"
+                elif lang == 'es':
+                    message = f"⟠ **Pago Ethereum (ETH)**\n\n"
+                    message += f"💰 **Cantidad:** ${plan_info['price']} USD equivalente\n\n"
+                    message += "**Dirección de Pago:**\n"
+                elif lang == 'fr':
+                    message = f"⟠ **Paiement Ethereum (ETH)**\n\n"
+                    message += f"💰 **Montant:** ${plan_info['price']} USD équivalent\n\n"
+                    message += "**Adresse de Paiement:**\n"
+                elif lang == 'de':
+                    message = f"⟠ **Ethereum (ETH) Zahlung**\n\n"
+                    message += f"💰 **Betrag:** ${plan_info['price']} USD Äquivalent\n\n"
+                    message += "**Zahlungsadresse:**\n"
+                elif lang == 'ru':
+                    message = f"⟠ **Оплата Ethereum (ETH)**\n\n"
+                    message += f"💰 **Сумма:** ${plan_info['price']} USD эквивалент\n\n"
+                    message += "**Адрес для оплаты:**\n"
+                else:
+                    message = f"⟠ **Ethereum (ETH) Payment**\n\n"
+                    message += f"💰 **Amount:** ${plan_info['price']} USD equivalent\n\n"
+                    message += "**Payment Address:**\n"
+                
+                await self.send_message(message, target_chat_id=user_id)
+                await self.send_message("0x570a6177046ed1f4683762693ec4a2a43c47c56f", target_chat_id=user_id)
+                
+                # Send instructions
+                if lang == 'en':
+                    instructions = "📧 After payment, send proof to @avie_support\n"
+                    instructions += f"Include your Telegram ID: {user_id}\n\n"
+                    instructions += "⚡ Activation within 1 hour"
+                elif lang == 'es':
+                    instructions = "📧 Después del pago, envía comprobante a @avie_support\n"
+                    instructions += f"Incluye tu ID de Telegram: {user_id}\n\n"
+                    instructions += "⚡ Activación en 1 hora"
+                elif lang == 'fr':
+                    instructions = "📧 Après paiement, envoyez preuve à @avie_support\n"
+                    instructions += f"Incluez votre ID Telegram: {user_id}\n\n"
+                    instructions += "⚡ Activation sous 1 heure"
+                elif lang == 'de':
+                    instructions = "📧 Nach Zahlung, senden Sie Nachweis an @avie_support\n"
+                    instructions += f"Ihre Telegram ID: {user_id}\n\n"
+                    instructions += "⚡ Aktivierung innerhalb 1 Stunde"
+                elif lang == 'ru':
+                    instructions = "📧 После оплаты отправьте подтверждение @avie_support\n"
+                    instructions += f"Укажите ваш Telegram ID: {user_id}\n\n"
+                    instructions += "⚡ Активация в течение 1 часа"
+                else:
+                    instructions = "📧 After payment, send proof to @avie_support\n"
+                    instructions += f"Include your Telegram ID: {user_id}\n\n"
+                    instructions += "⚡ Activation within 1 hour"
+                
+                keyboard = self.create_back_to_menu_keyboard(lang)
+                await self.send_keyboard_message(instructions, keyboard, target_chat_id=user_id)
+                
+            elif method == 'usdt':
+                if lang == 'en':
+                    message = f"💚 **USDT (TRC20) Payment**\n\n"
+                    message += f"💰 **Amount:** ${plan_info['price']} USDT\n\n"
+                    message += "**Payment Address:**\n"
+                elif lang == 'es':
+                    message = f"💚 **Pago USDT (TRC20)**\n\n"
+                    message += f"💰 **Cantidad:** ${plan_info['price']} USDT\n\n"
+                    message += "**Dirección de Pago:**\n"
+                elif lang == 'fr':
+                    message = f"💚 **Paiement USDT (TRC20)**\n\n"
+                    message += f"💰 **Montant:** ${plan_info['price']} USDT\n\n"
+                    message += "**Adresse de Paiement:**\n"
+                elif lang == 'de':
+                    message = f"💚 **USDT (TRC20) Zahlung**\n\n"
+                    message += f"💰 **Betrag:** ${plan_info['price']} USDT\n\n"
+                    message += "**Zahlungsadresse:**\n"
+                elif lang == 'ru':
+                    message = f"💚 **Оплата USDT (TRC20)**\n\n"
+                    message += f"💰 **Сумма:** ${plan_info['price']} USDT\n\n"
+                    message += "**Адрес для оплаты:**\n"
+                else:
+                    message = f"💚 **USDT (TRC20) Payment**\n\n"
+                    message += f"💰 **Amount:** ${plan_info['price']} USDT\n\n"
+                    message += "**Payment Address:**\n"
+                
+                await self.send_message(message, target_chat_id=user_id)
+                await self.send_message("TFAmy3TRqvisPWCa8V7jynAM6tmoFsTh3Y", target_chat_id=user_id)
+                
+                # Send instructions
+                if lang == 'en':
+                    instructions = "📧 After payment, send proof to @avie_support\n"
+                    instructions += f"Include your Telegram ID: {user_id}\n\n"
+                    instructions += "⚡ Activation within 1 hour"
+                elif lang == 'es':
+                    instructions = "📧 Después del pago, envía comprobante a @avie_support\n"
+                    instructions += f"Incluye tu ID de Telegram: {user_id}\n\n"
+                    instructions += "⚡ Activación en 1 hora"
+                elif lang == 'fr':
+                    instructions = "📧 Après paiement, envoyez preuve à @avie_support\n"
+                    instructions += f"Incluez votre ID Telegram: {user_id}\n\n"
+                    instructions += "⚡ Activation sous 1 heure"
+                elif lang == 'de':
+                    instructions = "📧 Nach Zahlung, senden Sie Nachweis an @avie_support\n"
+                    instructions += f"Ihre Telegram ID: {user_id}\n\n"
+                    instructions += "⚡ Aktivierung innerhalb 1 Stunde"
+                elif lang == 'ru':
+                    instructions = "📧 После оплаты отправьте подтверждение @avie_support\n"
+                    instructions += f"Укажите ваш Telegram ID: {user_id}\n\n"
+                    instructions += "⚡ Активация в течение 1 часа"
+                else:
+                    instructions = "📧 After payment, send proof to @avie_support\n"
+                    instructions += f"Include your Telegram ID: {user_id}\n\n"
+                    instructions += "⚡ Activation within 1 hour"
+                
+                keyboard = self.create_back_to_menu_keyboard(lang)
+                await self.send_keyboard_message(instructions, keyboard, target_chat_id=user_id)
+                
+            elif method == 'bank':
+                if lang == 'en':
+                    message = f"🏦 **Bank Transfer Payment**\n\n"
+                    message += f"💰 **Amount:** ${plan_info['price']} USD\n\n"
+                    message += "📞 Contact @avie_support for:\n"
+                    message += "• Bank account details\n"
+                    message += "• Wire transfer instructions\n"
+                    message += "• International transfer options\n\n"
+                    message += f"Include your Telegram ID: {user_id}\n\n"
+                    message += "⚡ Processing within 24 hours"
+                elif lang == 'es':
+                    message = f"🏦 **Pago por Transferencia Bancaria**\n\n"
+                    message += f"💰 **Cantidad:** ${plan_info['price']} USD\n\n"
+                    message += "📞 Contacta @avie_support para:\n"
+                    message += "• Detalles de cuenta bancaria\n"
+                    message += "• Instrucciones de transferencia\n"
+                    message += "• Opciones de transferencia internacional\n\n"
+                    message += f"Incluye tu ID de Telegram: {user_id}\n\n"
+                    message += "⚡ Procesamiento en 24 horas"
+                elif lang == 'fr':
+                    message = f"🏦 **Paiement par Virement Bancaire**\n\n"
+                    message += f"💰 **Montant:** ${plan_info['price']} USD\n\n"
+                    message += "📞 Contactez @avie_support pour:\n"
+                    message += "• Détails du compte bancaire\n"
+                    message += "• Instructions de virement\n"
+                    message += "• Options de transfert international\n\n"
+                    message += f"Incluez votre ID Telegram: {user_id}\n\n"
+                    message += "⚡ Traitement sous 24 heures"
+                elif lang == 'de':
+                    message = f"🏦 **Zahlung per Banküberweisung**\n\n"
+                    message += f"💰 **Betrag:** ${plan_info['price']} USD\n\n"
+                    message += "📞 Kontaktieren Sie @avie_support für:\n"
+                    message += "• Bankkontodetails\n"
+                    message += "• Überweisungsanweisungen\n"
+                    message += "• Internationale Übertragungsoptionen\n\n"
+                    message += f"Ihre Telegram ID: {user_id}\n\n"
+                    message += "⚡ Bearbeitung innerhalb 24 Stunden"
+                elif lang == 'ru':
+                    message = f"🏦 **Оплата Банковским Переводом**\n\n"
+                    message += f"💰 **Сумма:** ${plan_info['price']} USD\n\n"
+                    message += "📞 Обратитесь к @avie_support за:\n"
+                    message += "• Реквизиты банковского счета\n"
+                    message += "• Инструкции по переводу\n"
+                    message += "• Международные варианты перевода\n\n"
+                    message += f"Укажите ваш Telegram ID: {user_id}\n\n"
+                    message += "⚡ Обработка в течение 24 часов"
+                else:
+                    message = f"🏦 **Bank Transfer Payment**\n\n"
+                    message += f"💰 **Amount:** ${plan_info['price']} USD\n\n"
+                    message += "📞 Contact @avie_support for:\n"
+                    message += "• Bank account details\n"
+                    message += "• Wire transfer instructions\n"
+                    message += "• International transfer options\n\n"
+                    message += f"Include your Telegram ID: {user_id}\n\n"
+                    message += "⚡ Processing within 24 hours"
+                
+                keyboard = self.create_back_to_menu_keyboard(lang)
+                await self.send_keyboard_message(message, keyboard, target_chat_id=user_id)
+                
+            else:
+                # Unknown payment method
+                if lang == 'en':
+                    message = "❌ Unknown payment method. Please contact @avie_support for assistance."
+                elif lang == 'es':
+                    message = "❌ Método de pago desconocido. Contacta @avie_support para asistencia."
+                elif lang == 'fr':
+                    message = "❌ Méthode de paiement inconnue. Contactez @avie_support pour assistance."
+                elif lang == 'de':
+                    message = "❌ Unbekannte Zahlungsmethode. Kontaktieren Sie @avie_support für Hilfe."
+                elif lang == 'ru':
+                    message = "❌ Неизвестный способ оплаты. Обратитесь к @avie_support за помощью."
+                else:
+                    message = "❌ Unknown payment method. Please contact @avie_support for assistance."
+                
+                keyboard = self.create_back_to_menu_keyboard(lang)
+                await self.send_keyboard_message(message, keyboard, target_chat_id=user_id)
+
+            
+        except Exception as e:
+            print(f"❌ Error handling payment method: {e}")
@@ -0,0 +1,43 @@
+from io import BytesIO
+
+from chart_cache import chart_key
+from config import CHART_STYLE, CHART_DPI, CHART_FORMAT
+
+
+class ChartRendering:
+    """Signal charts: cache lookup and rendering through the chart worker pool (mixed into SimpleCryptoBot)"""
+
+    def get_chart_key(self, symbol, price_data, interval='1h'):
+        """Cache key of a chart: it only changes when a new candle opens or the chart style changes"""
+        return chart_key(symbol, interval, price_data[-1][0], f"{CHART_STYLE}@{CHART_DPI}.{CHART_FORMAT}")
+    
+    async def create_trading_chart(self, symbol, price_data, signal_data, interval='1h'):
+        """Create simple clean trading chart (rendered in the chart worker pool, cached per candle)"""
+        try:
+            png = await self.chart_cache.get_or_create(
+                self.get_chart_key(symbol, price_data, interval),
+                lambda: self.render_trading_chart(symbol, price_data, signal_data))
+            return BytesIO(png) if png else None
+            
+        except Exception as e:
+            print(f"❌ Error creating chart: {e}")
+            return None
+    
+    async def render_trading_chart(self, symbol, price_data, signal_data):
+        """Image bytes of the price/EMA20 chart, or None when it could not be rendered"""
+        import pandas as pd
+        # Simple data preparation
+        df = pd.DataFrame(price_data)
+        if len(df.columns) >= 6:
+            df.columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume'] + list(df.columns[6:])
+        df['close'] = pd.to_numeric(df['close'])
+        
+        # Reuse EMA20 from the signal analysis instead of recomputing it
+        ema20_series = (signal_data or {}).get('ema20_series')
+        if ema20_series is not None and len(ema20_series) == len(df):
+            df['ema20'] = ema20_series
+        else:
+            df['ema20'] = self.calculate_ema(df['close'])
+        
+        return await self.chart_service.render(symbol, df['timestamp'].astype('int64').tolist(),
+                                               df['close'].tolist(), df['ema20'].tolist())
@@ -0,0 +1,100 @@
+import json
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set
+
+SIGNAL_HISTORY_SIZE = 5  # Signals kept for /history
+
+
+class BotState:
+    """Subscription, language and signal state held in memory and written through to the user store"""
+
+    def __init__(self, storage, admin_ids: Iterable[str] = (), expiry_scheduler=None):
+        self.storage = storage
+        self.expiry_scheduler = expiry_scheduler  # Told about every expiry change, if given
+        # These containers are the hot cache - the bot reads them directly and they are only
+        # mutated through the methods below, which queue the matching database write
+        self.paid_users: Set[str] = set(admin_ids)  # Admins get premium access without a stored row
+        self.free_users: Set[str] = set()
+        self.subscription_expiry: Dict[str, datetime] = {}
+        self.pending_payments: Dict[str, Dict] = {}
+        self.user_languages: Dict[str, str] = {}
+        self.signal_cooldowns: Dict[str, datetime] = {}
+        self.signal_history: List[Dict] = []
+        self.loaded = False
+
+    async def load(self) -> bool:
+        """Warm the cache from the store in one query; changes made before loading are kept"""
+        try:
+            rows = await self.storage.load_state()
+        except Exception as e:
+            print(f"❌ Error loading bot state: {e}")
+            return False
+
+        for kind, key, value in rows:
+            if kind == 'premium':
+                if key not in self.paid_users:
+                    self.paid_users.add(key)
+                    if value:
+                        self.subscription_expiry[key] = datetime.fromisoformat(value)
+                        if self.expiry_scheduler:
+                            self.expiry_scheduler.schedule(key, self.subscription_expiry[key])
+            elif kind == 'free':
+                self.free_users.add(key)
+            elif kind == 'payment':
+                self.pending_payments.setdefault(key, json.loads(value))
+            elif kind == 'language':
+                self.user_languages.setdefault(key, value)
+            elif kind == 'cooldown':
+                self.signal_cooldowns.setdefault(key, datetime.fromisoformat(value))
+            elif kind == 'signals' and not self.signal_history:
+                self.signal_history.extend(json.loads(value))
+
+        self.loaded = True
+        print(f"✅ Bot state loaded: {len(self.paid_users)} premium, {len(self.free_users)} free, "
+              f"{len(self.user_languages)} languages, {len(self.signal_cooldowns)} cooldowns")
+        return True
+
+    def add_free_user(self, user_id: str):
+        self.free_users.add(user_id)
+        self.storage.set_state('free', user_id, '', urgent=True)
+
+    def remove_free_user(self, user_id: str):
+        self.free_users.discard(user_id)
+        self.storage.set_state('free', user_id, None, urgent=True)
+
+    def set_premium(self, user_id: str, expiry_date: Optional[datetime]):
+        self.paid_users.add(user_id)
+        if expiry_date:
+            self.subscription_expiry[user_id] = expiry_date
+            if self.expiry_scheduler:
+                self.expiry_scheduler.schedule(user_id, expiry_date)
+        self.storage.set_state('premium', user_id, expiry_date.isoformat() if expiry_date else '', urgent=True)
+
+    def remove_premium(self, user_id: str):
+        self.paid_users.discard(user_id)
+        self.subscription_expiry.pop(user_id, None)
+        if self.expiry_scheduler:
+            self.expiry_scheduler.cancel(user_id)
+        self.storage.set_state('premium', user_id, None, urgent=True)
+
+    def set_pending_payment(self, user_id: str, payment_info: Dict):
+        self.pending_payments[user_id] = payment_info
+        self.storage.set_state('payment', user_id, json.dumps(payment_info), urgent=True)
+
+    def set_language(self, user_id: str, lang_code: str):
+        self.user_languages[user_id] = lang_code
+        self.storage.set_state('language', user_id, lang_code)
+
+    def set_cooldown(self, symbol: str, sent_at: datetime):
+        self.signal_cooldowns[symbol] = sent_at
+        self.storage.set_state('cooldown', symbol, sent_at.isoformat())
+
+    def clear_cooldown(self, symbol: str):
+        self.signal_cooldowns.pop(symbol, None)
+        self.storage.set_state('cooldown', symbol, None)
+
+    def add_signal(self, signal_data: Dict):
+        """Newest first, keeping the last SIGNAL_HISTORY_SIZE"""
+        self.signal_history.insert(0, signal_data)
+        del self.signal_history[SIGNAL_HISTORY_SIZE:]
+        self.storage.set_state('signals', 'recent', json.dumps(self.signal_history))
@@ -0,0 +1,470 @@
+import asyncio
+import hashlib
+
+from config import UPDATE_MODE, WEBHOOK_URL
+from update_intake import UpdateDispatcher, WebhookServer
+
+# Bad Request descriptions meaning a cached file_id can no longer be used
+INVALID_FILE_ID_ERRORS = ('wrong file identifier', 'wrong remote file identifier', 'file_id', 'file not found',
+                          'file reference')
+
+
+class TelegramTransport:
+    """Telegram Bot API calls: sending, editing and deleting messages, and receiving updates (mixed into SimpleCryptoBot)"""
+
+    async def setup_bot_commands(self):
+        """Set up persistent bot commands in Telegram menu"""
+        url = f"{self.base_url}/setMyCommands"
+        commands = [
+            {
+                "command": "start",
+                "description": "🏠 Main Menu - Show bot menu"
+            },
+            {
+                "command": "menu", 
+                "description": "🏠 Main Menu - Show bot menu"
+            },
+            {
+                "command": "status",
+                "description": "📊 Bot Status - Check current status"
+            },
+            {
+                "command": "help",
+                "description": "📚 Help - Complete feature guide"
+            }
+        ]
+        
+        data = {"commands": commands}
+        
+        session = self.http.session
+        try:
+            async with session.post(url, json=data) as response:
+                if response.status == 200:
+                    print("✅ Persistent bot menu commands set up successfully")
+                    return True
+                else:
+                    print(f"❌ Failed to set up bot commands: {response.status}")
+                    return False
+        except Exception as e:
+            print(f"❌ Error setting up bot commands: {e}")
+            return False
+    
+    async def send_message(self, text, reply_to_message_id=None, target_chat_id=None, parse_mode=None):
+        """Send message using direct HTTP API"""
+        url = f"{self.base_url}/sendMessage"
+        data = {
+            'chat_id': target_chat_id,  # Must specify target chat ID
+            'text': text
+        }
+        
+        if parse_mode:
+            data['parse_mode'] = parse_mode
+            
+        if reply_to_message_id:
+            data['reply_to_message_id'] = reply_to_message_id
+        
+        await self.rate_limiter.acquire('telegram')
+        session = self.http.session
+        try:
+            async with session.post(url, data=data) as response:
+                if response.status == 200:
+                    print(f"✅ Message sent: {text[:50]}...")
+                    result = await response.json()
+                    return result['result']['message_id']
+                else:
+                    response_text = await response.text()
+                    print(f"❌ Failed to send message: {response.status} - {response_text}")
+                    return False
+        except Exception as e:
+            print(f"❌ Error sending message: {e}")
+            return False
+    
+    async def broadcast_signal_to_premium_users(self, signal_text):
+        """Send trading signal to all users until 100 user limit reached"""
+        all_users = self.paid_users.union(self.free_users)
+        total_users = len(all_users)
+        
+        if not all_users:
+            print("⚠️ No users to send signals to")
+            return 0
+        
+        # Everyone gets premium access until 100 users reached
+        if total_users <= self.max_free_users:
+            # All users get signals (true freemium model)
+            report = await self.broadcaster.broadcast(all_users, signal_text)
+            print(f"📊 Signal sent to {report['sent']}/{total_users} users (All premium until 100 users)")
+        else:
+            # After 100 users, only paid users get signals
+            report = await self.broadcaster.broadcast(self.paid_users, signal_text)
+            print(f"📊 Signal sent to {report['sent']}/{len(self.paid_users)} paid users (Over 100 user limit)")
+        
+        for failure in report['dead_letters']:
+            print(f"❌ Failed to send signal to user {failure['chat_id']}: {failure['error']}")
+            
+        return report['sent']
+    
+    async def get_updates(self, offset=0, timeout=10):
+        """Get updates from Telegram"""
+        url = f"{self.base_url}/getUpdates"
+        params = {'offset': offset, 'timeout': timeout}
+        
+        session = self.http.session
+        try:
+            async with session.get(url, params=params) as response:
+                if response.status == 200:
+                    return await response.json()
+                return None
+        except Exception as e:
+            print(f"❌ Error getting updates: {e}")
+            return None
+    
+    async def send_keyboard_message(self, text, keyboard, message_id=None, chat_id=None, target_chat_id=None):
+        """Send message with inline keyboard (a dict, or reply_markup JSON precomputed by the message catalog)"""
+        import json
+        url = f"{self.base_url}/sendMessage"
+        
+        # Use target_chat_id if provided, otherwise fall back to chat_id
+        chat_target = target_chat_id if target_chat_id else chat_id
+        
+        data = {
+            'chat_id': chat_target,
+            'text': text,
+            'reply_markup': keyboard if isinstance(keyboard, str) else json.dumps(keyboard),
+            'parse_mode': 'Markdown'
+        }
+        
+        if message_id:
+            data['reply_to_message_id'] = message_id
+        
+        await self.rate_limiter.acquire('telegram')
+        session = self.http.session
+        try:
+            async with session.post(url, data=data) as response:
+                if response.status == 200:
+                    return True
+                return False
+        except Exception as e:
+            print(f"❌ Error sending keyboard message: {e}")
+            return False
+    
+    async def send_photo_with_message(self, photo_buffer, caption, chat_id, chart_key=None):
+        """Send photo with signal message combined as caption (chart_key links it to its chart cache entry)"""
+        try:
+            url = f"{self.base_url}/sendPhoto"
+            
+            # Reset buffer position
+            photo_buffer.seek(0)
+            photo_bytes = photo_buffer.getvalue()
+            
+            # Telegram caption limit is 1024 characters, so we need to keep it concise
+            # For longer messages, we'll send chart + shortened caption, then full message
+            short_caption = caption[:1000] + "..." if len(caption) > 1000 else caption
+            
+            data = {
+                'chat_id': str(chat_id),
+                'caption': short_caption,
+                'parse_mode': 'Markdown'
+            }
+            
+            # Charts already uploaded once are re-sent by Telegram file_id (no upload)
+            photo_key = chart_key or hashlib.sha1(photo_bytes).hexdigest()
+            file_id = self.chart_cache.get_file_id(photo_key)
+            
+            status, result = await self.upload_photo(url, data, photo_bytes, file_id)
+            if status == 400 and file_id and self.is_invalid_file_id_error(result):
+                # Cached file_id no longer accepted - upload the bytes again (other 400s, e.g. a bad
+                # caption, would fail the same way and only waste an upload)
+                self.chart_cache.set_file_id(photo_key, None)
+                file_id = None
+                status, result = await self.upload_photo(url, data, photo_bytes, file_id)
+            
+            if status == 200:
+                if not file_id and isinstance(result, dict):
+                    photo_sizes = result.get('result', {}).get('photo', [])
+                    if photo_sizes:
+                        self.chart_cache.set_file_id(photo_key, photo_sizes[-1]['file_id'])
+                print(f"✅ Chart with signal message sent successfully ({'file_id' if file_id else 'uploaded'})")
+                
+                # If the original message was truncated, send the full message as a follow-up
+                if len(caption) > 1000:
+                    await self.send_message(caption, target_chat_id=chat_id)
+                
+                return True
+            else:
+                print(f"❌ Failed to send photo: {status}")
+                print(f"Response: {result}")
+                # Fallback to text message
+                await self.send_message(caption, target_chat_id=chat_id)
+                return False
+                        
+        except Exception as e:
+            print(f"❌ Error sending photo: {e}")
+            # Fallback to text message
+            await self.send_message(caption, target_chat_id=chat_id)
+            return False
+    
+    @staticmethod
+    def is_invalid_file_id_error(result):
+        """True when Telegram rejected a send because the file_id is invalid or its file is gone"""
+        description = result.get('description', '') if isinstance(result, dict) else str(result)
+        description = description.lower()
+        return any(reason in description for reason in INVALID_FILE_ID_ERRORS)
+    
+    async def upload_photo(self, url, data, photo_bytes, file_id=None):
+        """Post a photo as multipart upload, or by file_id when Telegram already has it"""
+        await self.rate_limiter.acquire('telegram')
+        if file_id:
+            return await self.http.post_multipart(url, {**data, 'photo': file_id})
+        
+        # Charts are PNG unless CHART_FORMAT selects WebP (RIFF....WEBP header)
+        if photo_bytes[:4] == b'RIFF' and photo_bytes[8:12] == b'WEBP':
+            files = {'photo': ('signal_chart.webp', photo_bytes, 'image/webp')}
+        else:
+            files = {'photo': ('signal_chart.png', photo_bytes, 'image/png')}
+        return await self.http.post_multipart(url, data, files)
+    
+    async def answer_callback_query(self, callback_query_id):
+        """Answer callback query"""
+        url = f"{self.base_url}/answerCallbackQuery"
+        data = {'callback_query_id': callback_query_id}
+        
+        session = self.http.session
+        try:
+            async with session.post(url, json=data) as response:
+                return response.status == 200
+        except Exception as e:
+            print(f"❌ Error answering callback: {e}")
+            return False
+    
+    async def edit_message(self, message_id, text, chat_id):
+        """Edit existing message"""
+        url = f"{self.base_url}/editMessageText"
+        data = {
+            'chat_id': chat_id,
+            'message_id': message_id,
+            'text': text
+        }
+        
+        session = self.http.session
+        try:
+            async with session.post(url, json=data) as response:
+                return response.status == 200
+        except Exception as e:
+            print(f"❌ Error editing message: {e}")
+            return False
+    
+    async def process_update(self, update):
+        """Route one Telegram update to its handler"""
+        if 'message' in update:
+            # Respond to all users (public bot)
+            await self.handle_command(update['message'])
+        
+        elif 'callback_query' in update:
+            # Handle callbacks from all users
+            await self.handle_callback_query(update['callback_query'])
+    
+    async def delete_webhook(self):
+        """Remove any registered webhook so getUpdates polling works"""
+        session = self.http.session
+        try:
+            async with session.post(f"{self.base_url}/deleteWebhook") as response:
+                return response.status == 200
+        except Exception as e:
+            print(f"❌ Error deleting webhook: {e}")
+            return False
+    
+    async def check_for_commands(self):
+        """Check for incoming commands (getUpdates polling mode)"""
+        last_update_id = 0
+        await self.delete_webhook()  # getUpdates is rejected while a webhook is set
+        
+        # Different chats are handled in parallel, each chat's updates in arrival order
+        dispatcher = UpdateDispatcher(self.process_update)
+        self.update_dispatcher = dispatcher
+        stop_wait = asyncio.ensure_future(self.stop_event.wait())
+        try:
+            while not self.restart_requested:
+                try:
+                    # Long polling waits for new updates, so no extra sleep between batches;
+                    # a shutdown abandons the pending poll instead of waiting for it to time out
+                    poll = asyncio.ensure_future(self.get_updates(last_update_id + 1))
+                    await asyncio.wait({poll, stop_wait}, return_when=asyncio.FIRST_COMPLETED)
+                    if not poll.done():
+                        poll.cancel()
+                        break
+                    updates = poll.result()
+                    
+                    if updates and updates.get('ok'):
+                        for update in updates.get('result', []):
+                            last_update_id = update['update_id']
+                            await dispatcher.submit(update)
+                    else:
+                        await asyncio.sleep(2)
+                    
+                except Exception as e:
+                    print(f"❌ Error checking commands: {e}")
+                    await asyncio.sleep(5)
+        finally:
+            stop_wait.cancel()
+            await dispatcher.stop()
+            # Confirm handled updates so the next instance does not receive them again
+            if last_update_id:
+                await self.get_updates(last_update_id + 1, timeout=0)
+    
+    async def run_webhook(self):
+        """Receive updates through a webhook; returns False if it could not be set up"""
+        dispatcher = UpdateDispatcher(self.process_update)
+        self.update_dispatcher = dispatcher
+        server = WebhookServer(self.http, self.base_url, dispatcher, WEBHOOK_URL)
+        if not await server.start():
+            return False
+        
+        try:
+            await self.stop_event.wait()
+        finally:
+            await server.stop()
+            print(f"✅ Webhook stopped ({dispatcher.stats['handled']} updates handled, "
+                  f"{dispatcher.stats['errors']} errors)")
+        return True
+    
+    async def receive_updates(self, mode=None):
+        """Take updates via webhook when configured, otherwise (or on failure) via polling"""
+        mode = mode or UPDATE_MODE
+        if mode == 'webhook':
+            if not WEBHOOK_URL:
+                print("⚠️ WEBHOOK_URL is not set, falling back to polling")
+            elif await self.run_webhook():
+                return
+            else:
+                print("⚠️ Webhook setup failed, falling back to polling")
+        
+        await self.check_for_commands()
+    
+    async def delete_message(self, message_id, chat_id=None):
+        """Delete a message by ID"""
+        target_chat = chat_id or self.admin_chat_id
+        url = f"{self.base_url}/deleteMessage"
+        data = {
+            'chat_id': target_chat,
+            'message_id': message_id
+        }
+        
+        await self.rate_limiter.acquire('telegram')
+        session = self.http.session
+        try:
+            async with session.post(url, data=data) as response:
+                if response.status == 200:
+                    return True
+                else:
+                    return False
+        except Exception as e:
+            return False
+    
+    async def delete_all_user_messages(self, user_id):
+        """Delete all bot messages for a specific user - show confirmation first"""
+        lang = self.get_user_language(user_id)
+        
+        try:
+            # Send confirmation message with localized Yes/No buttons
+            keyboard = self.messages.keyboard(lang, 'delete_confirm')
+            
+            confirm_text = self.messages[lang]['delete_messages_confirm']
+            await self.send_keyboard_message(confirm_text, keyboard, chat_id=user_id)
+            
+        except Exception as e:
+            print(f"❌ Error sending delete confirmation to {user_id}: {e}")
+    
+    async def perform_message_deletion(self, user_id):
+        """Perform actual message deletion for user - LIMITED and SAFE version"""
+        lang = self.get_user_language(user_id)
+        
+        try:
+            print(f"🗑️ DELETION REQUESTED by user {user_id}")
+            deleted_count = 0
+            failed_count = 0
+            
+            # Send status message first
+            status_msg_url = f"{self.base_url}/sendMessage"
+            status_data = {'chat_id': user_id, 'text': '⏳ Deleting recent bot messages...'}
+            
+            session = self.http.session
+            async with session.post(status_msg_url, data=status_data) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    current_msg_id = result['result']['message_id']
+                    
+                    # Delete the status message first
+                    await asyncio.sleep(2)  # Give user time to see the message
+                    await self.delete_message(current_msg_id, user_id)
+                    
+                    # MUCH MORE LIMITED deletion - only try last 25 messages instead of 200
+                    # This is safer and less aggressive
+                    max_attempts = 25
+                    consecutive_failures = 0
+                    
+                    for msg_id in range(current_msg_id - 1, max(1, current_msg_id - max_attempts), -1):
+                        try:
+                            success = await self.delete_message(msg_id, user_id)
+                            if success:
+                                deleted_count += 1
+                                consecutive_failures = 0
+                            else:
+                                failed_count += 1
+                                consecutive_failures += 1
+                            
+                            # Stop if too many consecutive failures (likely hit user messages)
+                            if consecutive_failures >= 10:
+                                print(f"🛑 Stopping deletion after {consecutive_failures} consecutive failures")
+                                break
+                            
+                        except Exception as e:
+                            failed_count += 1
+                            consecutive_failures += 1
+                            print(f"❌ Failed to delete message {msg_id}: {e}")
+                            continue
+            
+            # Send result message
+            if deleted_count > 0:
+                if lang == 'ru':
+                    response = f"✅ Удалено {deleted_count} сообщений бота"
+                elif lang == 'es':
+                    response = f"✅ Eliminados {deleted_count} mensajes del bot"
+                elif lang == 'fr':
+                    response = f"✅ Supprimés {deleted_count} messages du bot"
+                elif lang == 'de':
+                    response = f"✅ {deleted_count} Bot-Nachrichten gelöscht"
+                else:
+                    response = f"✅ Deleted {deleted_count} bot messages"
+            else:
+                if lang == 'ru':
+                    response = "❌ Не найдено сообщений для удаления"
+                elif lang == 'es':
+                    response = "❌ No se encontraron mensajes para eliminar"
+                elif lang == 'fr':
+                    response = "❌ Aucun message trouvé à supprimer"
+                elif lang == 'de':
+                    response = "❌ Keine Nachrichten zum Löschen gefunden"
+                else:
+                    response = "❌ No messages found to delete"
+            
+            await self.send_message(response, target_chat_id=user_id)
+            print(f"🗑️ Completed deletion for user {user_id}: {deleted_count} deleted, {failed_count} failed")
+            
+        except Exception as e:
+            if lang == 'ru':
+                error_msg = "❌ Ошибка при удалении сообщений"
+            elif lang == 'es':
+                error_msg = "❌ Error al eliminar mensajes"
+            elif lang == 'fr':
+                error_msg = "❌ Erreur lors de la suppression des messages"
+            elif lang == 'de':
+                error_msg = "❌ Fehler beim Löschen von Nachrichten"
+            else:
+                error_msg = "❌ Error deleting messages"
+            await self.send_message(error_msg, target_chat_id=user_id)
+            print(f"❌ Error during message deletion for {user_id}: {e}")
+    
+    async def schedule_message_deletion(self, message_id):
+        """Schedule message deletion after 5 minutes"""
+        await asyncio.sleep(300)  # 5 minutes
+        await self.delete_message(message_id)
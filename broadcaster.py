@@ -0,0 +1,154 @@
+import asyncio
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from config import (BROADCAST_WORKERS, BROADCAST_MAX_RETRIES, BROADCAST_PER_CHAT_INTERVAL,
+                    BROADCAST_RETRY_BACKOFF)
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100.0 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+class Broadcaster:
+    """Fans a message out to many chats with Telegram-aware flood control"""
+
+    def __init__(self, http, base_url: str, rate_limiter, workers: int = BROADCAST_WORKERS,
+                 max_retries: int = BROADCAST_MAX_RETRIES,
+                 per_chat_interval: float = BROADCAST_PER_CHAT_INTERVAL):
+        self.http = http
+        self.base_url = base_url
+        self.rate_limiter = rate_limiter  # 'telegram' bucket enforces the global ~30 msg/s
+        self.workers = workers
+        self.max_retries = max_retries
+        self.per_chat_interval = per_chat_interval
+
+        self.last_sent_per_chat: Dict[str, float] = {}
+        self.paused_until = 0.0  # Set from retry_after when Telegram answers 429
+        self.dead_letters: List[Dict[str, Any]] = []
+        self.last_report: Dict[str, Any] = {}
+
+    async def _wait_for_chat(self, chat_id: str):
+        """Respect Telegram's per-chat limit (about one message per second)"""
+        last_sent = self.last_sent_per_chat.get(chat_id)
+        if last_sent is not None:
+            wait_time = last_sent + self.per_chat_interval - time.monotonic()
+            if wait_time > 0:
+                await asyncio.sleep(wait_time)
+
+    def _prune_chat_times(self):
+        """Forget chats whose per-chat interval has passed - they can be messaged immediately anyway"""
+        cutoff = time.monotonic() - self.per_chat_interval
+        self.last_sent_per_chat = {chat_id: sent_at for chat_id, sent_at in self.last_sent_per_chat.items()
+                                   if sent_at > cutoff}
+
+    async def _wait_for_flood_pause(self):
+        wait_time = self.paused_until - time.monotonic()
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+    async def send_once(self, chat_id: str, text: str, parse_mode: Optional[str] = None):
+        """Single sendMessage attempt; returns (status, retry_after, description)"""
+        await self._wait_for_flood_pause()
+        await self._wait_for_chat(chat_id)
+        await self.rate_limiter.acquire('telegram')
+
+        data = {'chat_id': chat_id, 'text': text}
+        if parse_mode:
+            data['parse_mode'] = parse_mode
+
+        self.last_sent_per_chat[chat_id] = time.monotonic()
+        async with self.http.session.post(f"{self.base_url}/sendMessage", data=data) as response:
+            if response.status == 200:
+                return 200, None, None
+            try:
+                payload = await response.json(content_type=None)
+            except Exception:
+                payload = {}
+            retry_after = (payload.get('parameters') or {}).get('retry_after')
+            return response.status, retry_after, payload.get('description', '')
+
+    async def _deliver(self, chat_id: str, text: str, parse_mode: Optional[str], latencies: List[float]):
+        """Send to one chat with retries; returns None on success or an error description"""
+        error = None
+        for attempt in range(1, self.max_retries + 1):
+            started = time.monotonic()
+            try:
+                status, retry_after, description = await self.send_once(chat_id, text, parse_mode)
+            except Exception as e:
+                status, retry_after, description = None, None, str(e)
+            latencies.append(time.monotonic() - started)
+
+            if status == 200:
+                return None
+
+            error = f"{status}: {description}" if status else description
+            if status == 429:
+                # Flood limit applies to the whole bot - pause every worker
+                pause = float(retry_after or 1)
+                self.paused_until = max(self.paused_until, time.monotonic() + pause)
+                print(f"⏳ Telegram flood control: pausing broadcast for {pause:.0f}s")
+                continue
+            if status is not None and 400 <= status < 500:
+                # Blocked bot, deleted account, bad chat id - retrying will not help
+                break
+            await asyncio.sleep(BROADCAST_RETRY_BACKOFF * attempt)
+
+        self.dead_letters.append({'chat_id': chat_id, 'error': error, 'timestamp': time.time()})
+        if len(self.dead_letters) > 1000:
+            self.dead_letters = self.dead_letters[-1000:]  # Keep only the most recent failures
+        return error
+
+    async def broadcast(self, chat_ids: Iterable[str], text: str,
+                        parse_mode: Optional[str] = None) -> Dict[str, Any]:
+        """Deliver text to every chat with a worker pool and return delivery metrics"""
+        queue: asyncio.Queue = asyncio.Queue()
+        for chat_id in chat_ids:
+            queue.put_nowait(str(chat_id))
+        total = queue.qsize()
+
+        latencies: List[float] = []
+        failures: List[Dict[str, Any]] = []
+        sent = 0
+        start = time.perf_counter()
+
+        async def worker():
+            nonlocal sent
+            while True:
+                try:
+                    chat_id = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                error = await self._deliver(chat_id, text, parse_mode, latencies)
+                if error is None:
+                    sent += 1
+                else:
+                    failures.append({'chat_id': chat_id, 'error': error})
+
+        await asyncio.gather(*(worker() for _ in range(min(self.workers, total))))
+        self._prune_chat_times()
+
+        duration = time.perf_counter() - start
+        ordered = sorted(latencies)
+        report = {
+            'total': total,
+            'sent': sent,
+            'failed': len(failures),
+            'dead_letters': failures,
+            'duration': duration,
+            'throughput': sent / duration if duration > 0 else 0.0,
+            'latency_p50': percentile(ordered, 50),
+            'latency_p95': percentile(ordered, 95),
+            'latency_p99': percentile(ordered, 99)
+        }
+        self.last_report = report
+
+        print(f"📣 Broadcast: {sent}/{total} delivered in {duration:.2f}s "
+              f"({report['throughput']:.1f} msg/s, p50 {report['latency_p50'] * 1000:.0f}ms, "
+              f"p95 {report['latency_p95'] * 1000:.0f}ms, p99 {report['latency_p99'] * 1000:.0f}ms, "
+              f"{len(failures)} dead-lettered)")
+        return report
@@ -0,0 +1,235 @@
+import asyncio
+import time
+import aiosqlite
+from typing import Dict, List, Optional, Set, Tuple
+
+from config import BINANCE_KLINES_ENDPOINT, CANDLE_DB_PATH, CANDLE_MIN_REFRESH
+from http_client import http_client as shared_http_client
+from rate_limiter import provider_rate_limiter
+
+BINANCE_MAX_KLINES = 1000  # Binance caps klines per request
+
+
+class CandleStore:
+    """Persistent (symbol, interval) candle history with incremental Binance fetch"""
+
+    def __init__(self, db_path: str = CANDLE_DB_PATH, http_client=None, rate_limiter=None,
+                 min_refresh: float = CANDLE_MIN_REFRESH):
+        self.db_path = db_path
+        self.db = None
+        self.http = http_client or shared_http_client
+        self.rate_limiter = rate_limiter or provider_rate_limiter
+        self.min_refresh = min_refresh  # Seconds before the same series is synced again
+        self.last_sync: Dict[Tuple[str, str], float] = {}
+        self.locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        self.db_lock = asyncio.Lock()  # One statement/commit at a time on the shared connection
+        self.live: Set[Tuple[str, str]] = set()  # Series kept current by the kline stream
+        self.stats = {'hits': 0, 'incremental_fetches': 0, 'full_fetches': 0, 'candles_fetched': 0}
+
+    async def init(self) -> bool:
+        """Open the candle database and create the table"""
+        async with self.db_lock:  # Concurrent first calls must not open several connections
+            if self.db:
+                return True
+            try:
+                self.db = await aiosqlite.connect(self.db_path)
+                await self.db.execute('''
+                    CREATE TABLE IF NOT EXISTS candles (
+                        symbol TEXT NOT NULL,
+                        interval TEXT NOT NULL,
+                        open_time INTEGER NOT NULL,
+                        open REAL,
+                        high REAL,
+                        low REAL,
+                        close REAL,
+                        volume REAL,
+                        close_time INTEGER,
+                        quote_asset_volume REAL,
+                        trades INTEGER,
+                        taker_base_vol REAL,
+                        taker_quote_vol REAL,
+                        PRIMARY KEY (symbol, interval, open_time)
+                    ) WITHOUT ROWID
+                ''')
+                await self.db.commit()
+                return True
+            except Exception as e:
+                print(f"❌ Candle store initialization failed: {e}")
+                self.db = None
+                return False
+
+    async def get_last_open_time(self, symbol: str, interval: str) -> Optional[int]:
+        async with self.db_lock:
+            cursor = await self.db.execute(
+                'SELECT MAX(open_time) FROM candles WHERE symbol = ? AND interval = ?', (symbol, interval))
+            row = await cursor.fetchone()
+        return row[0] if row else None
+
+    async def get_first_open_time(self, symbol: str, interval: str) -> Optional[int]:
+        async with self.db_lock:
+            cursor = await self.db.execute(
+                'SELECT MIN(open_time) FROM candles WHERE symbol = ? AND interval = ?', (symbol, interval))
+            row = await cursor.fetchone()
+        return row[0] if row else None
+
+    async def count(self, symbol: str, interval: str) -> int:
+        async with self.db_lock:
+            cursor = await self.db.execute(
+                'SELECT COUNT(*) FROM candles WHERE symbol = ? AND interval = ?', (symbol, interval))
+            row = await cursor.fetchone()
+        return row[0] if row else 0
+
+    async def get_candles(self, symbol: str, interval: str, limit: int) -> List[List]:
+        """Latest `limit` stored candles in Binance kline layout, oldest first"""
+        async with self.db_lock:
+            cursor = await self.db.execute('''
+                SELECT open_time, open, high, low, close, volume, close_time,
+                       quote_asset_volume, trades, taker_base_vol, taker_quote_vol
+                FROM candles WHERE symbol = ? AND interval = ?
+                ORDER BY open_time DESC LIMIT ?
+            ''', (symbol, interval, limit))
+            rows = await cursor.fetchall()
+        return [list(row) + [0] for row in reversed(rows)]
+
+    async def upsert_candles(self, symbol: str, interval: str, klines: List[List]):
+        """Insert or refresh candles (the still-open last candle is overwritten)"""
+        if not klines:
+            return
+        rows = [
+            (symbol, interval, int(k[0]), float(k[1]), float(k[2]), float(k[3]), float(k[4]),
+             float(k[5]), int(k[6]), float(k[7]), int(k[8]), float(k[9]), float(k[10]))
+            for k in klines
+        ]
+        async with self.db_lock:
+            await self.db.executemany('''
+                INSERT OR REPLACE INTO candles (
+                    symbol, interval, open_time, open, high, low, close, volume,
+                    close_time, quote_asset_volume, trades, taker_base_vol, taker_quote_vol
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+            await self.db.commit()
+
+    async def fetch_binance_klines(self, symbol: str, interval: str, limit: int,
+                                   start_time: Optional[int] = None,
+                                   end_time: Optional[int] = None) -> Optional[List[List]]:
+        """Fetch raw klines from Binance; None when the request fails"""
+        params = {'symbol': symbol, 'interval': interval, 'limit': min(limit, BINANCE_MAX_KLINES)}
+        if start_time is not None:
+            params['startTime'] = start_time
+        if end_time is not None:
+            params['endTime'] = end_time
+
+        if not await self.rate_limiter.acquire('binance'):
+            return None
+        try:
+            async with self.http.session.get(BINANCE_KLINES_ENDPOINT, params=params) as response:
+                if response.status != 200:
+                    print(f"⚠️ Binance klines for {symbol} {interval} returned {response.status}")
+                    return None
+                data = await response.json()
+                self.stats['candles_fetched'] += len(data)
+                return data
+        except Exception as e:
+            print(f"⚠️ Binance klines error for {symbol} {interval}: {e}")
+            return None
+
+    async def sync(self, symbol: str, interval: str, limit: int) -> bool:
+        """Bring stored history up to date, fetching only candles newer than the last open_time"""
+        last_open = await self.get_last_open_time(symbol, interval)
+
+        if last_open is None:
+            klines = await self.fetch_binance_klines(symbol, interval, limit)
+            if not klines:
+                return False
+            await self.upsert_candles(symbol, interval, klines)
+            self.stats['full_fetches'] += 1
+            return True
+
+        # Refetch from the last stored candle so it is replaced once it closes
+        start_time = last_open
+        while True:
+            klines = await self.fetch_binance_klines(symbol, interval, BINANCE_MAX_KLINES, start_time=start_time)
+            if klines is None:
+                return False
+            await self.upsert_candles(symbol, interval, klines)
+            if len(klines) < BINANCE_MAX_KLINES:
+                break
+            start_time = int(klines[-1][0]) + 1  # Large gap - keep paging forward
+        self.stats['incremental_fetches'] += 1
+
+        # Backfill older history if callers now want more candles than stored
+        stored = await self.count(symbol, interval)
+        if stored < limit:
+            first_open = await self.get_first_open_time(symbol, interval)
+            older = await self.fetch_binance_klines(symbol, interval, limit - stored, end_time=first_open - 1)
+            if older:
+                await self.upsert_candles(symbol, interval, older)
+        return True
+
+    async def get_klines(self, symbol: str, interval: str, limit: int) -> Optional[List[List]]:
+        """Serve the latest candles from the store, syncing incrementally when stale"""
+        if not await self.init():
+            return None
+
+        key = (symbol, interval)
+        lock = self.locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            try:
+                fresh = key in self.live or time.monotonic() - self.last_sync.get(key, float('-inf')) < self.min_refresh
+                if fresh and await self.count(symbol, interval) >= limit:
+                    self.stats['hits'] += 1
+                elif await self.sync(symbol, interval, limit):
+                    self.last_sync[key] = time.monotonic()
+                elif await self.count(symbol, interval) == 0:
+                    return None
+
+                return await self.get_candles(symbol, interval, limit)
+            except Exception as e:
+                print(f"❌ Candle store error for {symbol} {interval}: {e}")
+                return None
+
+    def set_live(self, keys, live: bool = True):
+        """Mark series as streamed (served without REST polling) or back to polled"""
+        for key in keys:
+            if live:
+                self.live.add(key)
+            else:
+                self.live.discard(key)
+
+    async def apply_stream_kline(self, symbol: str, interval: str, kline: List) -> bool:
+        """Store one candle pushed by the kline stream"""
+        if not await self.init():
+            return False
+        try:
+            await self.upsert_candles(symbol, interval, [kline])
+            self.last_sync[(symbol, interval)] = time.monotonic()
+            return True
+        except Exception as e:
+            print(f"❌ Candle store error for {symbol} {interval}: {e}")
+            return False
+
+    async def backfill(self, symbol: str, interval: str, limit: int) -> bool:
+        """Fetch candles missed while the stream was down (incremental REST sync)"""
+        if not await self.init():
+            return False
+        key = (symbol, interval)
+        async with self.locks.setdefault(key, asyncio.Lock()):
+            try:
+                if await self.sync(symbol, interval, limit):
+                    self.last_sync[key] = time.monotonic()
+                    return True
+                return False
+            except Exception as e:
+                print(f"❌ Candle backfill error for {symbol} {interval}: {e}")
+                return False
+
+    async def close(self):
+        """Close candle database connection"""
+        if self.db:
+            await self.db.close()
+            self.db = None
+            print("✅ Candle store closed")
+
+
+# Global instance
+candle_store = CandleStore()
@@ -0,0 +1,149 @@
+import asyncio
+import hashlib
+import os
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional
+
+from config import CHART_CACHE_SIZE, CHART_CACHE_DIR, CHART_CACHE_DISK_SIZE
+
+
+def chart_key(symbol: str, interval: str, last_open_time: int, style: str) -> str:
+    """Content address of a chart: same symbol, interval, last candle and style render the same image"""
+    return hashlib.sha1(f"{symbol}|{interval}|{int(last_open_time)}|{style}".encode()).hexdigest()
+
+
+class ChartCache:
+    """Rendered chart images in an in-memory LRU backed by a disk tier, with the Telegram file_id of each upload"""
+
+    def __init__(self, max_entries: int = CHART_CACHE_SIZE, directory: str = CHART_CACHE_DIR,
+                 max_disk_entries: int = CHART_CACHE_DISK_SIZE):
+        self.max_entries = max_entries
+        self.directory = directory
+        self.max_disk_entries = max_disk_entries
+        self.entries: OrderedDict[str, bytes] = OrderedDict()  # key -> image bytes, least recently used first
+        self.file_ids: Dict[str, str] = {}  # key -> Telegram file_id of the uploaded chart
+        self.in_flight: Dict[str, asyncio.Future] = {}  # Renders other requests for the same key wait on
+        self.stats = {'hits': 0, 'disk_hits': 0, 'misses': 0, 'evictions': 0}
+
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.directory, f"{key}.{suffix}")
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Cached image from memory, then disk; None on a miss"""
+        image = self.entries.get(key)
+        if image is not None:
+            self.entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return image
+
+        image = await asyncio.to_thread(self._read_disk, key)
+        if image is not None:
+            self.stats['disk_hits'] += 1
+            self._remember(key, image)
+        return image
+
+    async def put(self, key: str, image: bytes):
+        """Keep the image in memory and write it through to disk so it survives eviction and restarts"""
+        self._remember(key, image)
+        try:
+            await asyncio.to_thread(self._write_disk, key, image)
+        except Exception as e:
+            print(f"⚠️ Could not spill chart {key[:8]} to disk: {e}")
+
+    async def get_or_create(self, key: str, create: Callable[[], Awaitable[Optional[bytes]]]) -> Optional[bytes]:
+        """Cached image, or render it once - concurrent requests for the same key share one render"""
+        image = await self.get(key)
+        if image is not None:
+            return image
+
+        pending = self.in_flight.get(key)
+        if pending:
+            self.stats['hits'] += 1
+            return await asyncio.shield(pending)
+
+        self.stats['misses'] += 1
+        future = self.in_flight[key] = asyncio.get_running_loop().create_future()
+        image = None
+        try:
+            image = await create()
+            if image is not None:
+                await self.put(key, image)
+            return image
+        finally:
+            # Waiters get None if the render failed or was cancelled and fall back like any failed chart
+            future.set_result(image)
+            self.in_flight.pop(key, None)
+
+    def get_file_id(self, key: str) -> Optional[str]:
+        file_id = self.file_ids.get(key)
+        if file_id is None and os.path.exists(self._path(key, 'fid')):
+            try:
+                with open(self._path(key, 'fid')) as f:
+                    file_id = self.file_ids[key] = f.read().strip() or None
+            except OSError:
+                return None
+        return file_id
+
+    def set_file_id(self, key: str, file_id: Optional[str]):
+        """Remember (or with None forget) the Telegram file_id an entry was uploaded as"""
+        try:
+            if file_id:
+                self.file_ids[key] = file_id
+                if os.path.exists(self._path(key, 'img')):
+                    with open(self._path(key, 'fid'), 'w') as f:
+                        f.write(file_id)
+            else:
+                self.file_ids.pop(key, None)
+                if os.path.exists(self._path(key, 'fid')):
+                    os.remove(self._path(key, 'fid'))
+        except OSError as e:
+            print(f"⚠️ Could not store file_id for chart {key[:8]}: {e}")
+
+    def _remember(self, key: str, image: bytes):
+        self.entries[key] = image
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            evicted, _ = self.entries.popitem(last=False)
+            self.file_ids.pop(evicted, None)  # Reloaded from disk with the image if needed again
+            self.stats['evictions'] += 1
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        try:
+            with open(self._path(key, 'img'), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write_disk(self, key: str, image: bytes):
+        os.makedirs(self.directory, exist_ok=True)
+        temp_path = self._path(key, 'tmp')
+        with open(temp_path, 'wb') as f:
+            f.write(image)
+        os.replace(temp_path, self._path(key, 'img'))  # Readers never see a half-written chart
+        self._prune_disk()
+
+    def _prune_disk(self):
+        """Drop the oldest spilled charts once the disk tier is over its size"""
+        charts = [entry for entry in os.scandir(self.directory) if entry.name.endswith('.img')]
+        if len(charts) <= self.max_disk_entries:
+            return
+        charts.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in charts[:len(charts) - self.max_disk_entries]:
+            key = entry.name[:-len('.img')]
+            for suffix in ('img', 'fid'):
+                try:
+                    os.remove(self._path(key, suffix))
+                except OSError:
+                    pass
+
+    def get_metrics(self) -> Dict[str, int]:
+        lookups = self.stats['hits'] + self.stats['disk_hits'] + self.stats['misses']
+        return {
+            **self.stats,
+            'entries': len(self.entries),
+            'hit_rate': (self.stats['hits'] + self.stats['disk_hits']) / lookups if lookups else 0.0
+        }
+
+
+# Global chart cache instance
+chart_cache = ChartCache()
@@ -0,0 +1,197 @@
+import asyncio
+import multiprocessing
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from broadcaster import percentile
+from config import CHART_WORKERS, CHART_QUEUE_LIMIT, CHART_DPI, CHART_FORMAT
+
+BACKGROUND = '#0f1419'
+WEBP_QUALITY = 85
+MS_PER_DAY = 86_400_000
+
+_templates: Dict[int, 'ChartTemplate'] = {}  # Per worker process, keyed by DPI
+
+
+class ChartTemplate:
+    """Pre-styled figure built once per worker; renders only swap the line data, fill, title and price label"""
+
+    def __init__(self, dpi: int):
+        import matplotlib.dates as mdates
+        from matplotlib import style
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        # Styles are read when artists are created, so the context only has to cover construction
+        with style.context('dark_background'):
+            self.figure = Figure(figsize=(10, 6), dpi=dpi, facecolor=BACKGROUND)
+            self.canvas = FigureCanvasAgg(self.figure)
+            # Fixed margins instead of a tight_layout/bbox_inches='tight' pass on every render
+            self.figure.subplots_adjust(left=0.07, right=0.87, top=0.89, bottom=0.07)
+            self.ax = self.figure.add_subplot(1, 1, 1)
+            self.ax.set_facecolor(BACKGROUND)
+
+            self.price_line, = self.ax.plot([], [], color='#00d4aa', linewidth=2.5, label='Price')
+            self.ema_line, = self.ax.plot([], [], color='#ff6b35', linewidth=2, label='EMA20')
+            self.breakout_fill = None
+
+            # Clean chart styling
+            self.title = self.ax.set_title('', color='white', fontsize=18, fontweight='bold', pad=20)
+            self.ax.legend(loc='upper left', fontsize=12)
+            self.ax.grid(True, alpha=0.2)
+            self.ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+            self.ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
+            self.ax.tick_params(colors='white', labelsize=10)
+
+            # Current price annotation, moved to the last candle on each render
+            self.price_label = self.ax.annotate('', xy=(0, 0), xytext=(10, 10), textcoords='offset points',
+                                                bbox=dict(boxstyle='round,pad=0.3', facecolor='#00d4aa', alpha=0.8),
+                                                color='white', fontsize=11, fontweight='bold', annotation_clip=False)
+
+    def render(self, symbol: str, timestamps: List[int], closes: List[float], ema20: List[float],
+               image_format: str = 'png') -> bytes:
+        import numpy as np
+
+        times = np.asarray(timestamps, dtype=float) / MS_PER_DAY  # Matplotlib date numbers (days since epoch)
+        close = np.asarray(closes, dtype=float)
+        ema = np.asarray(ema20, dtype=float)
+
+        self.price_line.set_data(times, close)
+        self.ema_line.set_data(times, ema)
+
+        # Fill area above EMA20 (breakout zone)
+        if self.breakout_fill is not None:
+            self.breakout_fill.remove()
+        self.breakout_fill = self.ax.fill_between(times, close, ema, where=close > ema, alpha=0.2, color='green')
+
+        self.title.set_text(f"{symbol.replace('USDT', '')}/USDT")
+        self.price_label.set_text(f'${close[-1]:.4f}')
+        self.price_label.xy = (times[-1], close[-1])
+
+        self.ax.relim()
+        self.ax.autoscale_view()
+
+        buffer = BytesIO()
+        pil_kwargs = {'quality': WEBP_QUALITY} if image_format == 'webp' else None
+        self.figure.savefig(buffer, format=image_format, facecolor=BACKGROUND, edgecolor='none',
+                            pil_kwargs=pil_kwargs)
+        return buffer.getvalue()
+
+
+def _init_worker(dpi: int = CHART_DPI):
+    """Runs once per worker process: pay for the matplotlib import and figure setup up front"""
+    import matplotlib
+    matplotlib.use('Agg')
+    _templates[dpi] = ChartTemplate(dpi)
+
+
+def _warm_worker(dpi: int = CHART_DPI, image_format: str = CHART_FORMAT) -> bool:
+    """Render a throwaway chart so fonts and the image encoder are loaded before the first real request"""
+    render_trading_chart('WARMUP', [0, 3_600_000], [1.0, 2.0], [1.0, 1.5], dpi=dpi, image_format=image_format)
+    return True
+
+
+def render_trading_chart(symbol: str, timestamps: List[int], closes: List[float], ema20: List[float],
+                         dpi: int = CHART_DPI, image_format: str = CHART_FORMAT) -> Tuple[bytes, float]:
+    """Price/EMA20 breakout chart as image bytes plus the seconds spent rendering (runs in a worker)"""
+    started = time.perf_counter()
+    template = _templates.get(dpi)
+    if template is None:
+        template = _templates[dpi] = ChartTemplate(dpi)
+    return template.render(symbol, timestamps, closes, ema20, image_format), time.perf_counter() - started
+
+
+class ChartService:
+    """Renders charts in a pool of pre-warmed worker processes so the event loop never blocks on matplotlib"""
+
+    def __init__(self, workers: int = CHART_WORKERS, queue_limit: int = CHART_QUEUE_LIMIT,
+                 dpi: int = CHART_DPI, image_format: str = CHART_FORMAT):
+        self.workers = workers
+        self.dpi = dpi
+        self.image_format = image_format  # 'png' or 'webp'
+        self.queue_limit = queue_limit  # Renders queued or running before new requests are refused
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.start_lock = asyncio.Lock()
+        self.pending = 0
+        self.render_times: Deque[float] = deque(maxlen=500)  # Seconds inside the worker
+        self.latencies: Deque[float] = deque(maxlen=500)  # Seconds from request to bytes, queueing included
+        self.stats = {'rendered': 0, 'rejected': 0, 'errors': 0, 'restarts': 0}
+
+    async def start(self):
+        """Start the worker processes and warm each one"""
+        async with self.start_lock:
+            if self.executor:
+                return
+            started = time.perf_counter()
+            # Workers come from a forkserver: forking the bot itself while the preload thread holds the
+            # import lock leaves them deadlocked, and the pool then also blocks interpreter exit
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                                initargs=(self.dpi,),
+                                                mp_context=multiprocessing.get_context('forkserver'))
+            loop = asyncio.get_running_loop()
+            try:
+                await asyncio.gather(*(loop.run_in_executor(self.executor, _warm_worker, self.dpi, self.image_format)
+                                       for _ in range(self.workers)))
+                print(f"🎨 Chart service ready: {self.workers} workers warmed in "
+                      f"{time.perf_counter() - started:.1f}s")
+            except Exception as e:
+                print(f"⚠️ Chart worker warm-up failed: {e}")
+
+    async def render(self, symbol: str, timestamps: List[int], closes: List[float],
+                     ema20: List[float]) -> Optional[bytes]:
+        """Image bytes for the chart, or None when the queue is full or rendering failed"""
+        if self.pending >= self.queue_limit:
+            self.stats['rejected'] += 1
+            print(f"⚠️ Chart queue full ({self.pending}), skipping chart for {symbol}")
+            return None
+
+        self.pending += 1
+        requested = time.perf_counter()
+        try:
+            await self.start()
+            loop = asyncio.get_running_loop()
+            image, render_seconds = await loop.run_in_executor(
+                self.executor, render_trading_chart, symbol, timestamps, closes, ema20, self.dpi, self.image_format)
+            self.render_times.append(render_seconds)
+            self.latencies.append(time.perf_counter() - requested)
+            self.stats['rendered'] += 1
+            return image
+        except BrokenProcessPool as e:
+            # A worker died - replace the pool so the next request gets fresh workers
+            self.stats['errors'] += 1
+            self.stats['restarts'] += 1
+            print(f"❌ Chart worker crashed, restarting pool: {e}")
+            await self.stop()
+            return None
+        except Exception as e:
+            self.stats['errors'] += 1
+            print(f"❌ Error rendering chart for {symbol}: {e}")
+            return None
+        finally:
+            self.pending -= 1
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Queue depth and render time percentiles"""
+        render_times = sorted(self.render_times)
+        latencies = sorted(self.latencies)
+        return {
+            **self.stats,
+            'queue_depth': self.pending,
+            'render_p50': percentile(render_times, 50),
+            'render_p95': percentile(render_times, 95),
+            'latency_p50': percentile(latencies, 50),
+            'latency_p95': percentile(latencies, 95)
+        }
+
+    async def stop(self):
+        if self.executor:
+            executor, self.executor = self.executor, None
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Global chart service instance
+chart_service = ChartService()
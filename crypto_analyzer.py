@@ -1,17 +1,21 @@
 import pandas as pd
 import aiohttp
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from config import BINANCE_KLINES_ENDPOINT, BINANCE_EXCHANGE_INFO_ENDPOINT, EMA_PERIOD, KLINES_LIMIT
+from http_client import HTTPClient, http_client as shared_http_client
+from candle_store import candle_store as shared_candle_store
 
 
 class CryptoAnalyzer:
     """Handles cryptocurrency market analysis and signal detection"""
     
-    def __init__(self):
-        self.session = None
+    def __init__(self, http_client: Optional[HTTPClient] = None):
+        self.http = http_client or shared_http_client
+        self.candle_store = shared_candle_store
     
-    async def get_all_usdt_pairs(self, session: aiohttp.ClientSession) -> List[str]:
+    async def get_all_usdt_pairs(self, session: Optional[aiohttp.ClientSession] = None) -> List[str]:
         """Fetch all active USDT trading pairs from Binance"""
+        session = session or self.http.session
         try:
             async with session.get(BINANCE_EXCHANGE_INFO_ENDPOINT) as response:
                 if response.status != 200:
@@ -30,9 +34,15 @@ class CryptoAnalyzer:
             print(f"Error getting USDT pairs: {e}")
             return []
     
-    async def fetch_klines(self, session: aiohttp.ClientSession, symbol: str, 
+    async def fetch_klines(self, session: Optional[aiohttp.ClientSession], symbol: str, 
                           interval: str, limit: int = KLINES_LIMIT) -> List[List]:
         """Fetch candlestick data for a given symbol and timeframe"""
+        # Served from the shared candle store; direct request only if the store is unavailable
+        klines = await self.candle_store.get_klines(symbol, interval, limit)
+        if klines:
+            return klines
+        
+        session = session or self.http.session
         params = {
             'symbol': symbol,
             'interval': interval,
@@ -104,8 +114,9 @@ class CryptoAnalyzer:
         # Current volume should be at least 1.5x the average
         return current_volume > (avg_volume * 1.5)
     
-    async def analyze_symbol(self, session: aiohttp.ClientSession, symbol: str) -> bool:
+    async def analyze_symbol(self, session: Optional[aiohttp.ClientSession], symbol: str) -> bool:
         """Analyze a symbol for EMA20 breakout with volume confirmation"""
+        session = session or self.http.session
         try:
             # Fetch data for both timeframes
             klines_4h = await self.fetch_klines(session, symbol, '4h')
@@ -0,0 +1,103 @@
+import asyncio
+import heapq
+import itertools
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from config import EXPIRY_REMINDER_DAYS, EXPIRING_SOON_DAYS
+
+MAX_SLEEP = 3600  # Re-check at least hourly so wall-clock jumps cannot delay an event for long
+
+
+class ExpiryScheduler:
+    """Min-heap of subscription events: pre-expiry reminders, 'expiring soon' entry and expiry itself"""
+
+    def __init__(self, reminder_days: List[int] = EXPIRY_REMINDER_DAYS, soon_days: int = EXPIRING_SOON_DAYS):
+        self.reminder_days = sorted(reminder_days, reverse=True)
+        self.soon_window = timedelta(days=soon_days)
+        self.heap: List[Tuple[datetime, int, str, str, datetime]] = []  # (fire_at, seq, event, user_id, expiry)
+        self.sequence = itertools.count()
+        self.expiry: Dict[str, datetime] = {}  # Current expiry per user; heap entries for older ones are stale
+        self.expiring_soon: Dict[str, datetime] = {}  # Precomputed view for the admin dashboard
+        self.wakeup = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+        self.running = False
+        self.stats = {'scheduled': 0, 'expired': 0, 'reminders': 0}
+
+    def schedule(self, user_id: str, expiry_date: datetime, now: Optional[datetime] = None):
+        """(Re)schedule a subscription - O(log n); events for a previous expiry are dropped lazily"""
+        now = now or datetime.now()
+        self.expiry[user_id] = expiry_date
+        self.expiring_soon.pop(user_id, None)
+        self._push(expiry_date, 'expire', user_id, expiry_date)
+        self._push(max(expiry_date - self.soon_window, now), 'soon', user_id, expiry_date)
+        for days in self.reminder_days:
+            fire_at = expiry_date - timedelta(days=days)
+            if fire_at > now:
+                self._push(fire_at, 'reminder', user_id, expiry_date)
+        self.stats['scheduled'] += 1
+        self.wakeup.set()
+
+    def cancel(self, user_id: str):
+        """Forget a subscription; its heap entries are skipped when they surface"""
+        self.expiry.pop(user_id, None)
+        self.expiring_soon.pop(user_id, None)
+
+    def _push(self, fire_at: datetime, event: str, user_id: str, expiry_date: datetime):
+        heapq.heappush(self.heap, (fire_at, next(self.sequence), event, user_id, expiry_date))
+
+    def pop_due(self, now: Optional[datetime] = None) -> List[Tuple[str, str, datetime]]:
+        """Due (event, user_id, expiry_date) entries in firing order; 'soon' entries only update the view"""
+        now = now or datetime.now()
+        due = []
+        while self.heap and self.heap[0][0] <= now:
+            _, _, event, user_id, expiry_date = heapq.heappop(self.heap)
+            if self.expiry.get(user_id) != expiry_date:
+                continue  # Renewed or cancelled since this entry was pushed
+            if event == 'soon':
+                self.expiring_soon[user_id] = expiry_date
+                continue
+            if event == 'expire':
+                self.cancel(user_id)
+                self.stats['expired'] += 1
+            else:
+                self.stats['reminders'] += 1
+            due.append((event, user_id, expiry_date))
+        return due
+
+    def next_fire_at(self) -> Optional[datetime]:
+        return self.heap[0][0] if self.heap else None
+
+    def get_expiring_soon(self) -> List[Tuple[str, datetime]]:
+        """Subscriptions inside the 'expiring soon' window, soonest first"""
+        return sorted(self.expiring_soon.items(), key=lambda item: item[1])
+
+    def start(self, handler: Callable[[str, str, datetime], Awaitable[None]]):
+        if self.task is None or self.task.done():
+            self.running = True
+            self.task = asyncio.create_task(self._run(handler))
+
+    async def stop(self):
+        if self.task:
+            # Flag and wake rather than cancel - a cancel can be lost inside wait_for
+            self.running = False
+            self.wakeup.set()
+            await asyncio.gather(self.task, return_exceptions=True)
+            self.task = None
+
+    async def _run(self, handler: Callable[[str, str, datetime], Awaitable[None]]):
+        """Sleep until the earliest event, fire everything due, repeat; schedule() wakes it early"""
+        while self.running:
+            self.wakeup.clear()
+            for event, user_id, expiry_date in self.pop_due():
+                try:
+                    await handler(event, user_id, expiry_date)
+                except Exception as e:
+                    print(f"❌ Error handling subscription {event} for user {user_id}: {e}")
+
+            next_fire = self.next_fire_at()
+            timeout = MAX_SLEEP if next_fire is None else (next_fire - datetime.now()).total_seconds()
+            try:
+                await asyncio.wait_for(self.wakeup.wait(), timeout=min(max(timeout, 0), MAX_SLEEP))
+            except asyncio.TimeoutError:
+                pass
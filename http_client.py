@@ -0,0 +1,100 @@
+import asyncio
+import json
+import aiohttp
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from config import (HTTP_POOL_LIMIT, HTTP_POOL_LIMIT_PER_HOST, HTTP_DNS_CACHE_TTL,
+                    HTTP_KEEPALIVE_TIMEOUT, HTTP_REQUEST_TIMEOUT, HTTP_CONNECT_TIMEOUT)
+
+
+class HTTPClient:
+    """Long-lived pooled aiohttp session shared by the bot, analyzers and data feeds"""
+
+    def __init__(self, limit: int = HTTP_POOL_LIMIT, limit_per_host: int = HTTP_POOL_LIMIT_PER_HOST,
+                 dns_cache_ttl: int = HTTP_DNS_CACHE_TTL, keepalive_timeout: float = HTTP_KEEPALIVE_TIMEOUT):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._startup_hooks: List[Callable[[aiohttp.ClientSession], Awaitable[None]]] = []
+        self._shutdown_hooks: List[Callable[[], Awaitable[None]]] = []
+
+    def on_startup(self, hook: Callable[[aiohttp.ClientSession], Awaitable[None]]):
+        """Register a coroutine called with the session right after it is opened"""
+        self._startup_hooks.append(hook)
+
+    def on_shutdown(self, hook: Callable[[], Awaitable[None]]):
+        """Register a coroutine called just before the session is closed"""
+        self._shutdown_hooks.append(hook)
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.dns_cache_ttl,
+            use_dns_cache=True,
+            keepalive_timeout=self.keepalive_timeout
+        )
+        timeout = aiohttp.ClientTimeout(total=HTTP_REQUEST_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT)
+        return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Shared session, opened lazily on first use inside the running event loop"""
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+        return self._session
+
+    async def start(self) -> aiohttp.ClientSession:
+        """Open the session eagerly and run startup hooks"""
+        session = self.session
+        for hook in self._startup_hooks:
+            try:
+                await hook(session)
+            except Exception as e:
+                print(f"❌ HTTP client startup hook failed: {e}")
+        print(f"✅ HTTP client ready (pool {self.limit}, {self.limit_per_host} per host)")
+        return session
+
+    async def close(self):
+        """Run shutdown hooks and close the pooled connections"""
+        for hook in self._shutdown_hooks:
+            try:
+                await hook()
+            except Exception as e:
+                print(f"❌ HTTP client shutdown hook failed: {e}")
+
+        if self._session and not self._session.closed:
+            await self._session.close()
+            # Give the connector a moment to close SSL transports cleanly
+            await asyncio.sleep(0.25)
+            print("✅ HTTP client closed")
+        self._session = None
+
+    async def post_multipart(self, url: str, fields: Dict[str, Any],
+                             files: Optional[Dict[str, Tuple[str, bytes, str]]] = None) -> Tuple[int, Any]:
+        """POST multipart/form-data without blocking the loop; files map field -> (filename, bytes, content type)"""
+        form = aiohttp.FormData()
+        for name, value in fields.items():
+            form.add_field(name, str(value))
+        for name, (filename, content, content_type) in (files or {}).items():
+            form.add_field(name, content, filename=filename, content_type=content_type)
+
+        async with self.session.post(url, data=form) as response:
+            body = await response.text()
+            try:
+                return response.status, json.loads(body)
+            except ValueError:
+                return response.status, body
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+
+# Global instance
+http_client = HTTPClient()
@@ -0,0 +1,58 @@
+import importlib
+import json
+from typing import Dict, Iterator, Tuple
+
+from i18n import keyboards
+from i18n.keyboards import ALL_TIERS
+
+SUPPORTED_LANGUAGES: Tuple[str, ...] = ('en', 'es', 'fr', 'de', 'ru')
+DEFAULT_LANGUAGE = 'en'
+
+
+class MessageCatalog(dict):
+    """Message tables per language; each language module is imported the first time it is looked up"""
+
+    def __init__(self, languages: Tuple[str, ...] = SUPPORTED_LANGUAGES):
+        super().__init__()
+        self.languages = languages
+        self.keyboards: Dict[Tuple[str, str, str], str] = {}  # (language, menu, tier) -> reply_markup JSON
+
+    def __contains__(self, lang: str) -> bool:
+        return lang in self.languages
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.languages)
+
+    def __missing__(self, lang: str) -> Dict[str, str]:
+        # Only reached on the first lookup of a language, later ones are plain dict hits
+        if lang not in self.languages:
+            raise KeyError(lang)
+        messages = self[lang] = importlib.import_module(f'i18n.{lang}').MESSAGES
+        return messages
+
+    def keyboard(self, lang: str, menu: str, tier: str = ALL_TIERS) -> str:
+        """Serialized reply_markup of a menu, built on first use and reused for every later message"""
+        if lang not in self.languages:
+            lang = DEFAULT_LANGUAGE
+        key = (lang, menu, tier)
+        markup = self.keyboards.get(key)
+        if markup is None:
+            labels = importlib.import_module(f'i18n.{lang}').BUTTONS
+            markup = self.keyboards[key] = json.dumps({
+                "inline_keyboard": [[{"text": labels[label], "callback_data": callback_data}
+                                     for label, callback_data in row]
+                                    for row in keyboards.LAYOUTS[menu, tier]]
+            })
+        return markup
+
+    def reload(self):
+        """Re-read the language modules and layouts already loaded (used by hot restart)"""
+        for lang in set(self.keys()) | {lang for lang, _, _ in self.keyboards}:
+            importlib.reload(importlib.import_module(f'i18n.{lang}'))
+        importlib.reload(keyboards)
+        self.clear()
+        self.keyboards.clear()
+
+
+# Global message catalog instance
+message_catalog = MessageCatalog()
@@ -0,0 +1,119 @@
+# German messages
+MESSAGES = {
+    'select_language': "🌍 Bitte wählen Sie Ihre Sprache:\n\n🇺🇸 English\n🇪🇸 Español\n🇫🇷 Français\n🇩🇪 Deutsch\n🇷🇺 Русский",
+    'bot_intro': (
+        "🤖 Crypto EMA20 Breakout Bot\n\n"
+        "✅ Bot funktioniert und überwacht!\n\n"
+        "📊 Derzeit verfolgt: 50 USDT-Paare\n"
+        "🔍 Analyse umfasst:\n"
+        "• EMA20-Ausbrüche (4H & 1D)\n"
+        "• Volumenbestätigung\n"
+        "• RSI-Momentum\n"
+        "• 200 SMA-Trend\n"
+        "• Bullische Kerzenmuster\n\n"
+        "📈 Sie erhalten Signale bei Ausbrüchen\n"
+        "⏰ Scan alle 5 Minuten\n\n"
+        "🎯 TRADING-FUNKTIONEN:\n"
+        "• Einstiegspunkte mit aktuellen Preisen\n"
+        "• Gewinnmitnahme-Level (TP1, TP2, TP3)\n"
+        "• Stop-Loss-Berechnungen\n"
+        "• Risiko-/Gewinnverhältnisse\n"
+        "• Signalstärke-Indikatoren\n"
+        "• Positionsgrößen-Empfehlungen\n"
+        "• Gefahrenzone-Warnungen\n\n"
+        "Befehle:\n"
+        "/start - Diesen Status anzeigen\n"
+        "/status - Schnelle Statusprüfung\n\n"
+        "⚠️ Dies ist keine Finanzberatung!"
+    ),
+    'status_report': (
+        "📊 Bot-Statusbericht\n\n"
+        "✅ Überwachung: 50 Krypto-Paare\n"
+        "📈 Heute gesendete Signale: {signals_count}\n"
+        "🔄 Scan alle 5 Minuten\n"
+        "💪 Alle Systeme betriebsbereit"
+    ),
+    'admin_only': "❌ Nur Administrator-Befehl",
+    'free_tier_welcome': "🎉 Willkommen beim Crypto EMA20 Breakout Bot!\n\n🤖 **Was dieser Bot macht:**\nDieser Bot überwacht automatisch 50 wichtige Kryptowährungen und sendet Ihnen sofortige Trading-Signale, wenn er profitable EMA20-Ausbruchsmöglichkeiten erkennt. Sie erhalten Einstiegspunkte, Gewinnmitnahme-Level, Stop-Loss-Berechnungen und Risikomanagement-Anleitung - alles direkt an Ihr Telegram geliefert.\n\n🆓 **GLÜCKWUNSCH!** Sie haben KOSTENLOSEN Zugriff auf alle Premium-Funktionen!\n\n🎯 Was Sie bekommen (völlig kostenlos):\n• Erweiterte EMA20-Ausbruchsignale von 50 USDT-Paaren\n• Echtzeit-Trading-Alerts mit Ein-/Ausstiegspunkten\n• Gewinnmitnahme-Level (TP1, TP2, TP3) und Stop-Loss\n• Volumenbestätigung und Trendanalyse\n• Risikomanagement und Positionsgrößen-Anleitung\n• Multi-Timeframe technische Analyse\n• Professionelle Trading-Empfehlungen\n\n📊 Technische Merkmale:\n• Überwacht: BTC, ETH, BNB, SOL, XRP, ADA, AVAX, DOT, LINK, MATIC und 40 weitere Paare\n• Scan-Frequenz: Alle 4 Stunden\n• Signal-Lieferung: Sofortige Telegram-Benachrichtigungen\n• Analyse: EMA20-Ausbrüche mit Volumenbestätigung\n\n🌍 Mehrsprachiger Support in 5 Sprachen\n\n🚀 Sie sind einer unserer ersten 100 Benutzer - genießen Sie völlig kostenlosen Zugriff!\n\n⚠️ Wichtig: Nach 100 Benutzern benötigen neue Mitglieder Premium-Abonnements. Ihr kostenloser Zugriff ist dauerhaft!\n\n📚 Geben Sie /help für die vollständige Funktionsanleitung ein",
+    'free_tier_full': "🎉 Willkommen beim Crypto EMA20 Breakout Bot!\n\n🤖 **Was dieser Bot macht:**\nDieser Bot überwacht automatisch 50 wichtige Kryptowährungen und sendet Ihnen sofortige Trading-Signale, wenn er profitable EMA20-Ausbruchsmöglichkeiten erkennt. Sie erhalten Einstiegspunkte, Gewinnmitnahme-Level, Stop-Loss-Berechnungen und Risikomanagement-Anleitung - alles direkt an Ihr Telegram geliefert.\n\n🆓 Vielen Dank für Ihr Interesse! Unser kostenloser Bereich ist voll (100/100 Benutzer).\n\n💎 Premium-Abonnement-Funktionen:\n• Erweiterte EMA20-Ausbruchsignale von 50 USDT-Paaren\n• Echtzeit-Trading-Alerts mit Ein-/Ausstiegspunkten\n• Gewinnmitnahme-Level (TP1, TP2, TP3) und Stop-Loss-Berechnungen\n• Volumenbestätigung und Trendstärke-Analyse\n• Risikomanagement und Positionsgrößen-Anleitung\n• Multi-Timeframe technische Analyse (4H, 1D)\n• Professionelle Trading-Empfehlungen\n\n📊 Was Sie bekommen:\n• Überwacht: BTC, ETH, BNB, SOL, XRP, ADA, AVAX, DOT, LINK, MATIC + 40 weitere Paare\n• Scannen: Alle 4 Stunden kontinuierlich\n• Lieferung: Sofortige Telegram-Benachrichtigungen\n• Analyse: EMA20-Ausbrüche mit Volumenbestätigung\n• Sprachen: 5-Sprachen-Support\n\n💰 Erschwingliche Premium-Pläne ab $9.99/Woche\n\nVerwenden Sie /subscribe für Premium-Zugriff!\n\n📚 Geben Sie /help für die vollständige Funktionsanleitung ein",
+    'trial_expired': "⏰ Ihre 3-tägige Testversion ist abgelaufen!\n\n💎 Auf Premium upgraden, um weiterhin Signale zu erhalten:\n• Wöchentlich: $9.99\n• Monatlich: $29.99 (Bester Wert)\n• Jährlich: $199.99 (44% sparen)\n\nVerwenden Sie /subscribe zum Upgraden!",
+    'trial_welcome': "🎉 Willkommen! Sie haben eine 3-tägige KOSTENLOSE Testversion!\n\n✅ Vollzugriff auf alle Premium-Funktionen:\n• Echtzeit-Trading-Signale\n• Ein-/Ausstiegsempfehlungen\n• Risikomanagement-Anleitung\n• Multi-Timeframe-Analyse\n\nTestversion läuft in {days} Tagen ab. Verwenden Sie /subscribe zum Upgraden!",
+    'subscription_menu': "💎 Wählen Sie Ihren Premium-Plan:\n\n📅 Verfügbare Pläne:",
+    'payment_success': "✅ Zahlung Erfolgreich!\n\nWillkommen bei Premium! Sie haben jetzt vollständigen Zugriff auf alle Trading-Signale und Funktionen.",
+    'subscription_reminder': "⏰ Ihr Premium-Abonnement läuft in {days} Tag(en) ab ({date}).\n\n💎 Verwenden Sie /subscribe, um zu verlängern und weiterhin Trading-Signale zu erhalten.",
+    'payment_failed': "❌ Zahlung fehlgeschlagen. Bitte versuchen Sie es erneut oder kontaktieren Sie den Support.",
+    'not_subscribed': "🔒 Premium-Funktion\n\nDiese Funktion erfordert ein Premium-Abonnement.\nVerwenden Sie /subscribe zum Upgraden und freischalten aller Trading-Signale!",
+    'help_message_free': (
+        "📚 Crypto EMA20 Breakout Bot - Vollständige Anleitung\n\n"
+        "🎯 Was dieser Bot macht:\n"
+        "Dieser Bot ist ein fortschrittlicher Kryptowährungs-Trading-Signal-Service, der 50 wichtige USDT-Handelspaare auf Binance mit ausgeklügelter technischer Analyse überwacht. Er erkennt profitable EMA20-Ausbruchsmöglichkeiten mit Volumenbestätigung und sendet Ihnen sofortige Trading-Signale.\n\n"
+        "🆓 **KOSTENLOSER ZUGANG Verfügbar!**\n"
+        "Treten Sie jetzt bei und erhalten Sie völlig kostenlosen Zugang zu allen Premium-Funktionen. Nur auf die ersten 100 Benutzer begrenzt!\n\n"
+        "🔍 Technische Analyse-Funktionen:\n"
+        "• EMA20 (Exponential Moving Average) Ausbruchserkennung\n"
+        "• Volumenbestätigung für Signalvalidierung\n"
+        "• Multi-Timeframe-Analyse (4H, 1D Charts)\n"
+        "• Support/Widerstand-Level-Identifikation\n"
+        "• Trendstärke-Analyse\n"
+        "• Marktmomentum-Indikatoren\n\n"
+        "📊 Trading-Signal-Informationen:\n"
+        "• Einstiegspreis-Empfehlungen\n"
+        "• Gewinnmitnahme-Level (TP1, TP2, TP3)\n"
+        "• Stop-Loss-Berechnungen\n"
+        "• Risiko-/Gewinnverhältnisse\n"
+        "• Positionsgrößen-Anleitung\n"
+        "• Marktkontext-Analyse\n\n"
+        "⏰ Überwachungsplan:\n"
+        "• Kontinuierliche Marktscans alle 4 Stunden\n"
+        "• Echtzeit-Signal-Lieferung\n"
+        "• 50 USDT-Paare gleichzeitig überwacht\n"
+        "• Sofortige Benachrichtigungen wenn Bedingungen erfüllt\n\n"
+        "🤖 Verfügbare Befehle:\n"
+        "/start - Willkommen und Sprachauswahl\n"
+        "/status - Bot-Status und aktuelle Signale\n"
+        "/help - Diese umfassende Anleitung\n\n"
+        "🌍 Multi-Sprach-Support:\n"
+        "Vollständige Unterstützung für 5 Sprachen: Englisch, Spanisch, Französisch, Deutsch, Russisch\n\n"
+        "💰 Unterstützte Kryptowährungen:\n"
+        "BTC, ETH, BNB, ADA, SOL, XRP, MATIC, AVAX, DOT, LINK, LTC, ATOM, ALGO, VET, FIL, TRX, EOS, XLM, NEO, IOTA, DASH, SHIB, PEPE, TON, BCH, NEAR, APT, HBAR, ETC, RNDR, INJ, STX, FLOW, ARB, OP und 15 weitere Paare\n\n"
+        "🎯 Wer sollte diesen Bot nutzen:\n"
+        "• Kryptowährungs-Trader, die profitable Gelegenheiten suchen\n"
+        "• Technische Analyse-Enthusiasten\n"
+        "• Sowohl Anfänger als auch erfahrene Trader\n"
+        "• Jeder, der automatisierte Marktüberwachung wünscht\n\n"
+        "📧 Support: @avie_support"
+    ),
+    'help_message_premium': "📚 Premium-Anleitung - Alle Funktionen freigeschaltet\n\n🎯 Vollzugriff auf erweiterte Analyse und Echtzeit-Signale\n\n📊 Premium-Funktionen aktiv\n💎 Professioneller Handel aktiviert",
+    'command_menu': "🤖 **Bot-Befehls-Menü**\n\n📊 Hauptbefehle:\n• /start - Begrüßung und Sprachauswahl\n• /status - Aktueller Bot-Status\n• /help - Vollständige Anleitung\n• /subscribe - Premium-Pläne\n\n🎯 Verwenden Sie Schaltflächen für einfache Navigation",
+    'coin_list': "💰 Überwachte Kryptowährungspaare\n\n📊 Der Bot überwacht kontinuierlich diese 50 USDT-Paare für EMA20-Ausbruchsignale:\n\n🔸 BTC/USDT - Bitcoin\n🔸 ETH/USDT - Ethereum\n🔸 BNB/USDT - Binance Coin\n🔸 SOL/USDT - Solana\n🔸 XRP/USDT - Ripple\n🔸 ADA/USDT - Cardano\n🔸 AVAX/USDT - Avalanche\n🔸 DOT/USDT - Polkadot\n🔸 LINK/USDT - Chainlink\n🔸 MATIC/USDT - Polygon\n🔸 UNI/USDT - Uniswap\n🔸 LTC/USDT - Litecoin\n🔸 ATOM/USDT - Cosmos\n🔸 FTM/USDT - Fantom\n🔸 ALGO/USDT - Algorand\n🔸 VET/USDT - VeChain\n🔸 ICP/USDT - Internet Computer\n🔸 SAND/USDT - The Sandbox\n🔸 MANA/USDT - Decentraland\n🔸 CRV/USDT - Curve DAO\n🔸 AAVE/USDT - Aave\n🔸 MKR/USDT - Maker\n\n⚡ Signale werden generiert wenn:\n• EMA20-Ausbruch bestätigt auf 4H + 1D Zeitrahmen\n• Volumen 1.5x über dem Durchschnitt\n• Zusätzliche technische Kriterien erfüllt\n\n🔄 Alle 5 Minuten aktualisiert",
+    'payment_submitted': "✅ Zahlungsinformationen eingereicht!\n\n📋 Ihre Zahlungsdetails wurden zur Überprüfung gesendet.\n\n⏳ Bearbeitungszeit: Normalerweise innerhalb von 24 Stunden\n💎 Sie erhalten Premium-Zugang nach der Verifikation\n\n📧 Kontaktieren Sie @avie_support bei Fragen",
+    'paid_command_usage': "💳 Zahlungsbefehl Verwendung:\n\n📝 Format: /paid <methode> <transaktions_hash>\n\n🔸 Beispiel: /paid BTC 1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa\n🔸 Beispiel: /paid ETH 0x742d35cc6ab2b7b8c5c1234567890abcdef123456\n🔸 Beispiel: /paid USDT TxHash123456789\n\n📧 Kontaktieren Sie @avie_support für Zahlungshilfe",
+    'delete_messages_confirm': "🗑️ Alle Bot-Nachrichten Löschen\n\n⚠️ Dies wird alle vom Bot gesendeten Nachrichten in diesem Chat löschen.\n\n❗ Diese Aktion kann nicht rückgängig gemacht werden.\n\nSind Sie sicher, dass Sie fortfahren möchten?",
+    'delete_messages_success': "✅ Alle Bot-Nachrichten wurden erfolgreich aus diesem Chat gelöscht.",
+    'delete_messages_error': "❌ Einige Nachrichten konnten nicht gelöscht werden. Das ist normal bei älteren Nachrichten (48+ Stunden).",
+    'delete_messages_none': "ℹ️ Keine Bot-Nachrichten zum Löschen in diesem Chat gefunden.",
+    'main_menu': "🤖 **Krypto-Trading-Bot-Menü**\n\n{tier_line}\n\n📊 Überwachung: 50 Krypto-Paare\n⚡ Signale: EMA20-Ausbruchsstrategie\n🔄 Updates: Alle 5 Minuten\n\n💰 **Hinweis:** Bot erfordert Zahlung nach 100 Benutzern\n👥 Aktuelle Benutzer: {user_count}/100\n\n**Wählen Sie eine Option:**",
+    'menu_tier_premium': "✅ **Premium-Benutzer** - Alle Funktionen freigeschaltet",
+    'menu_tier_free': "🆓 **Kostenloser Benutzer** - Alle Funktionen enthalten",
+    'menu_tier_locked': "🔒 **Premium Erforderlich** - Kostenlose Stufe voll (100/100)",
+    'menu_tier_welcome': "🆓 **Willkommen** - Sie haben kostenlosen Zugang!",
+    'user_type_premium_days': "👑 Sie sind Premium-Nutzer ({days_remaining} Tage verbleibend)",
+    'user_type_premium_expired': "⚠️ Ihr Premium-Abonnement ist abgelaufen",
+    'user_type_premium_permanent': "👑 Sie sind Premium-Nutzer (dauerhaft)",
+    'user_type_free': "🆓 Sie sind kostenloser Nutzer (erste 100)",
+    'subscription_plans': "📅 **Wöchentliches Premium** - $9.99\n• 7 Tage Zugang\n• Alle Premium-Funktionen\n\n🗓️ **Monatliches Premium** - $29.99\n• 30 Tage Zugang\n• Bester Wert für regelmäßige Trader\n\n📆 **Jährliches Premium** - $199.99\n• 365 Tage Zugang\n• Sparen Sie 44% im Vergleich zu monatlich\n• Am besten für ernsthafte Trader\n\n💳 **Zahlungsoptionen:**\n• Kryptowährungen (BTC, ETH, USDT)\n• Banküberweisung\n• PayPal (Support kontaktieren)\n\n⚠️ Sichere Zahlungsabwicklung",
+    'plan_weekly': "Wöchentliches Premium",
+    'plan_monthly': "Monatliches Premium",
+    'plan_yearly': "Jährliches Premium",
+    'plan_details': "💎 **{plan_name}**\n\n💰 **Preis:** ${price}\n⏰ **Dauer:** {days} Tage\n\nBitte wählen Sie Ihre Zahlungsmethode:"
+}
+
+# German inline keyboard button labels
+BUTTONS = {
+    'status': "📊 Status", 'signals': "📈 Signale", 'coins': "💰 Münzen", 'help': "📚 Hilfe",
+    'language': "🌍 Sprache", 'delete': "🗑️ Löschen", 'refresh': "🔄 Aktualisieren", 'subscribe': "💎 Abonnieren",
+    'paid': "💳 Ich Bezahlte", 'support': "❓ Support", 'manage': "⚙️ Verwalten", 'admin': "⚙️ Admin",
+    'restart': "🔁 Neustart", 'delete_yes': "✅ Ja, Löschen", 'delete_no': "❌ Abbrechen", 'back_to_menu': "🔙 Zum Menü",
+    'weekly': "📅 Wöchentlich", 'monthly': "🗓️ Monatlich", 'yearly': "📆 Jährlich", 'back': "🔙 Zurück",
+    'pay_btc': "₿ Bitcoin (BTC)", 'pay_eth': "⟠ Ethereum (ETH)", 'pay_usdt': "💚 USDT (TRC20)", 'pay_bank': "🏦 Banküberweisung"
+}
@@ -0,0 +1,191 @@
+# English messages
+MESSAGES = {
+    'select_language': "🌍 Please select your language:\n\n🇺🇸 English\n🇪🇸 Español\n🇫🇷 Français\n🇩🇪 Deutsch\n🇷🇺 Русский",
+    'bot_intro': (
+        "🤖 Crypto EMA20 Breakout Bot\n\n"
+        "✅ Bot is working and monitoring!\n\n"
+        "📊 Currently tracking: 22 USDT pairs\n"
+        "🔍 Analysis includes:\n"
+        "• EMA20 breakouts (4H & 1D)\n"
+        "• Volume confirmation\n"
+        "• RSI momentum\n"
+        "• 200 SMA trend\n"
+        "• Bullish candle patterns\n\n"
+        "📈 You'll receive signals when breakouts occur\n"
+        "⏰ Scanning every 5 minutes\n\n"
+        "🎯 TRADING FEATURES:\n"
+        "• Entry points with current prices\n"
+        "• Take profit levels (TP1, TP2, TP3)\n"
+        "• Stop loss calculations\n"
+        "• Risk/reward ratios\n"
+        "• Signal strength indicators\n"
+        "• Position sizing recommendations\n"
+        "• Danger zone warnings\n\n"
+        "Commands:\n"
+        "/start - Show this status\n"
+        "/status - Quick status check\n\n"
+        "⚠️ This is not financial advice!"
+    ),
+    'status_report': (
+        "📊 Bot Status Report\n\n"
+        "✅ Monitoring: 22 crypto pairs\n"
+        "📈 Signals sent today: {signals_count}\n"
+        "🔄 Scanning every 5 minutes\n"
+        "💪 All systems operational"
+    ),
+    'admin_only': "❌ Admin only command",
+    'welcome_new_user': "🎉 Welcome to Crypto EMA20 Breakout Bot!\n\n💎 This is a premium trading signal service.\n\n✅ Premium features include:\n• Real-time trading signals\n• Entry/exit recommendations\n• Risk management guidance\n• Multi-timeframe analysis\n\nUse /subscribe to get premium access!",
+    'free_tier_welcome': "🎉 Welcome to Crypto EMA20 Breakout Bot!\n\n🤖 **What This Bot Does:**\nThis bot automatically monitors 50 major cryptocurrencies and sends you instant trading signals when it detects profitable EMA20 breakout opportunities. You get entry points, take profit levels, stop loss calculations, and risk management guidance - all delivered straight to your Telegram.\n\n🆓 **CONGRATULATIONS!** You have FREE access to all premium features!\n\n🎯 What You Get (Completely Free):\n• Advanced EMA20 breakout signals from 50 USDT pairs\n• Real-time trading alerts with entry/exit points\n• Take profit levels (TP1, TP2, TP3) and stop loss\n• Volume confirmation and trend analysis\n• Risk management and position sizing guidance\n• Multi-timeframe technical analysis\n• Professional trading recommendations\n\n📊 Technical Features:\n• Monitors: BTC, ETH, BNB, SOL, XRP, ADA, AVAX, DOT, LINK, MATIC and 40 more pairs\n• Scanning frequency: Every 4 hours\n• Signal delivery: Instant Telegram notifications\n• Analysis: EMA20 breakouts with volume confirmation\n\n🌍 Multilingual support in 5 languages\n\n🚀 You're one of our first 100 users - enjoy completely free access!\n\n⚠️ Important: After 100 users, new members will need premium subscriptions. Your free access is permanent!\n\n📚 Type /help for complete feature guide",
+    'free_tier_full': "🎉 Welcome to Crypto EMA20 Breakout Bot!\n\n🤖 **What This Bot Does:**\nThis bot automatically monitors 50 major cryptocurrencies and sends you instant trading signals when it detects profitable EMA20 breakout opportunities. You get entry points, take profit levels, stop loss calculations, and risk management guidance - all delivered straight to your Telegram.\n\n🆓 Thank you for your interest! Our free tier is now full (100/100 users).\n\n💎 Premium Subscription Features:\n• Advanced EMA20 breakout signals from 50 USDT pairs\n• Real-time trading alerts with entry/exit points\n• Take profit levels (TP1, TP2, TP3) and stop loss calculations\n• Volume confirmation and trend strength analysis\n• Risk management and position sizing guidance\n• Multi-timeframe technical analysis (4H, 1D)\n• Professional trading recommendations\n\n📊 What You Get:\n• Monitors: BTC, ETH, BNB, SOL, XRP, ADA, AVAX, DOT, LINK, MATIC + 40 more pairs\n• Scanning: Every 4 hours continuously\n• Delivery: Instant Telegram notifications\n• Analysis: EMA20 breakouts with volume confirmation\n• Languages: 5 language support\n\n💰 Affordable premium plans starting from $9.99/week\n\nUse /subscribe to get premium access!\n\n📚 Type /help for complete feature guide",
+    'subscription_menu': "💎 Choose Your Premium Plan:\n\n📅 Plans Available:",
+    'payment_success': "✅ Payment Successful!\n\nWelcome to Premium! You now have full access to all trading signals and features.",
+    'subscription_reminder': "⏰ Your Premium subscription expires in {days} day(s) ({date}).\n\n💎 Use /subscribe to renew and keep receiving trading signals.",
+    'payment_failed': "❌ Payment failed. Please try again or contact support.",
+    'payment_submitted': "✅ Payment verification request submitted!\n\n📋 Your payment details have been sent to admin for verification.\n⏳ You will receive confirmation within 24 hours.\n\n💬 If you have questions, contact @avie_support",
+    'paid_command_usage': "📝 Payment Verification Usage:\n\n/paid <method> <transaction_hash>\n\nExample:\n/paid BTC 1A2B3C4D5E6F7G8H9I0J\n/paid ETH 0x1234567890abcdef\n/paid USDT TRX123456789\n\n💡 Replace with your actual transaction hash",
+    'not_subscribed': "🔒 Premium Feature\n\nFree access available for first 100 users, then premium subscription required.\nCurrent users: {user_count}/100\n\nIf full, use /subscribe to upgrade and unlock all trading signals!",
+    'help_message_free': (
+        "📚 Crypto EMA20 Breakout Bot - Complete Guide\n\n"
+        "🎯 What This Bot Does:\n"
+        "This bot is an advanced cryptocurrency trading signal service that monitors 50 major USDT trading pairs on Binance using sophisticated technical analysis. It detects profitable EMA20 breakout opportunities with volume confirmation and sends you instant trading signals.\n\n"
+        "🆓 **FREE ACCESS Available!**\n"
+        "Join now and get completely free access to all premium features. Limited to first 100 users only!\n\n"
+        "🔍 Technical Analysis Features:\n"
+        "• EMA20 (Exponential Moving Average) breakout detection\n"
+        "• Volume confirmation for signal validation\n"
+        "• Multi-timeframe analysis (4H, 1D charts)\n"
+        "• Support/resistance level identification\n"
+        "• Trend strength analysis\n"
+        "• Market momentum indicators\n\n"
+        "📊 Trading Signal Information:\n"
+        "• Entry price recommendations\n"
+        "• Take profit levels (TP1, TP2, TP3)\n"
+        "• Stop loss calculations\n"
+        "• Risk/reward ratios\n"
+        "• Position sizing guidance\n"
+        "• Market context analysis\n\n"
+        "⏰ Monitoring Schedule:\n"
+        "• Continuous market scanning every 4 hours\n"
+        "• Real-time signal delivery\n"
+        "• 50 USDT pairs monitored simultaneously\n"
+        "• Instant notifications when conditions are met\n\n"
+        "🤖 Available Commands:\n"
+        "/start - Welcome and language selection\n"
+        "/status - Bot status and recent signals\n"
+        "/help - This comprehensive guide\n\n"
+        "🌍 Multi-Language Support:\n"
+        "Full support for 5 languages: English, Spanish, French, German, Russian\n\n"
+        "💰 Supported Cryptocurrencies:\n"
+        "BTC, ETH, BNB, ADA, SOL, XRP, MATIC, AVAX, DOT, LINK, LTC, ATOM, ALGO, VET, FIL, TRX, EOS, XLM, NEO, IOTA, DASH, SHIB, PEPE, TON, BCH, NEAR, APT, HBAR, ETC, RNDR, INJ, STX, FLOW, ARB, OP and 15 more pairs\n\n"
+        "🎯 Who Should Use This Bot:\n"
+        "• Cryptocurrency traders seeking profitable opportunities\n"
+        "• Technical analysis enthusiasts\n"
+        "• Both beginner and experienced traders\n"
+        "• Anyone wanting automated market monitoring\n\n"
+        "📧 Support: @avie_support"
+    ),
+    'coin_list': "💰 Monitored Cryptocurrency Pairs\n\n" +
+        "📊 The bot continuously monitors these 50 USDT trading pairs for EMA20 breakout signals:\n\n" +
+        "🔥 Major Coins:\n" +
+        "• BTCUSDT - Bitcoin\n" +
+        "• ETHUSDT - Ethereum\n" +
+        "• BNBUSDT - Binance Coin\n" +
+        "• ADAUSDT - Cardano\n" +
+        "• SOLUSDT - Solana\n" +
+        "• XRPUSDT - Ripple\n\n" +
+        "💎 Altcoins:\n" +
+        "• MATICUSDT - Polygon\n" +
+        "• AVAXUSDT - Avalanche\n" +
+        "• DOTUSDT - Polkadot\n" +
+        "• LINKUSDT - Chainlink\n" +
+        "• LTCUSDT - Litecoin\n" +
+        "• ATOMUSDT - Cosmos\n\n" +
+        "🚀 Additional Pairs:\n" +
+        "• ALGOUSDT - Algorand\n" +
+        "• VETUSDT - VeChain\n" +
+        "• FILUSDT - Filecoin\n" +
+        "• TRXUSDT - TRON\n" +
+        "• EOSUSDT - EOS\n" +
+        "• XLMUSDT - Stellar\n" +
+        "• NEOUSDT - Neo\n" +
+        "• IOTAUSDT - IOTA\n" +
+        "• DASHUSDT - Dash\n\n" +
+        "⏰ Scanning Frequency: Every 4 hours\n" +
+        "📈 Analysis: EMA20 breakouts with volume confirmation\n" +
+        "🎯 Signal Types: Entry, TP1/TP2/TP3, Stop Loss\n\n" +
+        "💡 New signals are sent instantly when breakout conditions are met!",
+    'command_menu': "🤖 Bot Commands",
+    'help_message_premium': (
+        "📚 Crypto EMA20 Breakout Bot - Complete Guide\n\n"
+        "🎯 What This Bot Does:\n"
+        "This bot is an advanced cryptocurrency trading signal service that monitors 50 major USDT trading pairs on Binance using sophisticated technical analysis. It detects profitable EMA20 breakout opportunities with volume confirmation and sends you instant trading signals.\n\n"
+        "💎 **PREMIUM SUBSCRIPTION REQUIRED**\n"
+        "Free tier is full (100/100). Premium plans available starting from $9.99/week.\n\n"
+        "🔍 Technical Analysis Features:\n"
+        "• EMA20 (Exponential Moving Average) breakout detection\n"
+        "• Volume confirmation for signal validation\n"
+        "• Multi-timeframe analysis (4H, 1D charts)\n"
+        "• Support/resistance level identification\n"
+        "• Trend strength analysis\n"
+        "• Market momentum indicators\n\n"
+        "📊 Trading Signal Information:\n"
+        "• Entry price recommendations\n"
+        "• Take profit levels (TP1, TP2, TP3)\n"
+        "• Stop loss calculations\n"
+        "• Risk/reward ratios\n"
+        "• Position sizing guidance\n"
+        "• Market context analysis\n\n"
+        "⏰ Monitoring Schedule:\n"
+        "• Continuous market scanning every 4 hours\n"
+        "• Real-time signal delivery\n"
+        "• 50 USDT pairs monitored simultaneously\n"
+        "• Instant notifications when conditions are met\n\n"
+        "🤖 Available Commands:\n"
+        "/start - Welcome and language selection\n"
+        "/status - Bot status and recent signals\n"
+        "/subscribe - Premium subscription plans\n"
+        "/paid <method> <tx_hash> - Payment verification\n"
+        "/help - This comprehensive guide\n\n"
+        "🌍 Multi-Language Support:\n"
+        "Full support for 5 languages: English, Spanish, French, German, Russian\n\n"
+        "💰 Supported Cryptocurrencies:\n"
+        "BTC, ETH, BNB, ADA, SOL, XRP, MATIC, AVAX, DOT, LINK, LTC, ATOM, ALGO, VET, FIL, TRX, EOS, XLM, NEO, IOTA, DASH, SHIB, PEPE, TON, BCH, NEAR, APT, HBAR, ETC, RNDR, INJ, STX, FLOW, ARB, OP and 15 more pairs\n\n"
+        "🎯 Who Should Use This Bot:\n"
+        "• Cryptocurrency traders seeking profitable opportunities\n"
+        "• Technical analysis enthusiasts\n"
+        "• Both beginner and experienced traders\n"
+        "• Anyone wanting automated market monitoring\n\n"
+        "📧 Support: @avie_support"
+    ),
+    'coin_list': "💰 Monitored Cryptocurrency Pairs\n\n📊 The bot continuously monitors these 50 USDT trading pairs for EMA20 breakout signals:\n\n🔸 BTC/USDT - Bitcoin\n🔸 ETH/USDT - Ethereum\n🔸 BNB/USDT - Binance Coin\n🔸 SOL/USDT - Solana\n🔸 XRP/USDT - Ripple\n🔸 ADA/USDT - Cardano\n🔸 AVAX/USDT - Avalanche\n🔸 DOT/USDT - Polkadot\n🔸 LINK/USDT - Chainlink\n🔸 MATIC/USDT - Polygon\n🔸 UNI/USDT - Uniswap\n🔸 LTC/USDT - Litecoin\n🔸 ATOM/USDT - Cosmos\n🔸 FTM/USDT - Fantom\n🔸 ALGO/USDT - Algorand\n🔸 VET/USDT - VeChain\n🔸 ICP/USDT - Internet Computer\n🔸 SAND/USDT - The Sandbox\n🔸 MANA/USDT - Decentraland\n🔸 CRV/USDT - Curve DAO\n🔸 AAVE/USDT - Aave\n🔸 MKR/USDT - Maker\n\n🔸 SHIB/USDT - Shiba Inu\n🔸 PEPE/USDT - Pepe\n🔸 TON/USDT - Toncoin\n🔸 BCH/USDT - Bitcoin Cash\n🔸 NEAR/USDT - Near Protocol\n🔸 APT/USDT - Aptos\n🔸 SUI/USDT - Sui\n🔸 XLM/USDT - Stellar\n🔸 HBAR/USDT - Hedera\n🔸 ETC/USDT - Ethereum Classic\n🔸 FIL/USDT - Filecoin\n🔸 VET/USDT - VeChain\n🔸 RNDR/USDT - Render\n🔸 ICP/USDT - Internet Computer\n🔸 FET/USDT - Fetch.ai\n🔸 MANA/USDT - Decentraland\n🔸 SAND/USDT - The Sandbox\n🔸 INJ/USDT - Injective\n🔸 AAVE/USDT - Aave\n🔸 STX/USDT - Stacks\n🔸 FLOW/USDT - Flow\n🔸 XTZ/USDT - Tezos\n🔸 EGLD/USDT - MultiversX\n🔸 EIGEN/USDT - EigenLayer\n🔸 LDO/USDT - Lido DAO\n🔸 ONDO/USDT - Ondo\n🔸 SEI/USDT - Sei\n🔸 WLD/USDT - Worldcoin\n🔸 ARB/USDT - Arbitrum\n🔸 OP/USDT - Optimism\n\n⚡ Signals are generated when:\n• EMA20 breakout confirmed on 4H + 1D timeframes\n• Volume is 1.5x above average\n• Additional technical criteria met\n\n🔄 Updated every 5 minutes",
+    'payment_submitted': "✅ Payment information submitted!\n\n📋 Your payment details have been sent for verification.\n\n⏳ Processing time: Usually within 24 hours\n💎 You'll receive premium access once verified\n\n📧 Contact @avie_support if you have questions",
+    'paid_command_usage': "💳 Payment Command Usage:\n\n📝 Format: /paid <method> <transaction_hash>\n\n🔸 Example: /paid BTC 1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa\n🔸 Example: /paid ETH 0x742d35cc6ab2b7b8c5c1234567890abcdef123456\n🔸 Example: /paid USDT TxHash123456789\n\n📧 Contact @avie_support for payment assistance",
+    'delete_messages_confirm': "🗑️ Delete All Bot Messages\n\n⚠️ This will delete all messages sent by the bot in this chat.\n\n❗ This action cannot be undone.\n\nAre you sure you want to continue?",
+    'delete_messages_success': "✅ Successfully deleted all bot messages from this chat.",
+    'delete_messages_error': "❌ Some messages could not be deleted. This is normal for older messages (48+ hours old).",
+    'delete_messages_none': "ℹ️ No bot messages found to delete in this chat.",
+    'main_menu': "🤖 **Crypto Trading Bot Menu**\n\n{tier_line}\n\n📊 Monitoring: 50 crypto pairs\n⚡ Signals: EMA20 breakout strategy\n🔄 Updates: Every 5 minutes\n\n💰 **Notice:** Bot will require payment after 100 users\n👥 Current users: {user_count}/100\n\n**Choose an option:**",
+    'menu_tier_premium': "✅ **Premium User** - All features unlocked",
+    'menu_tier_free': "🆓 **Free Tier User** - All features included",
+    'menu_tier_locked': "🔒 **Premium Required** - Free tier is full (100/100)",
+    'menu_tier_welcome': "🆓 **Welcome** - You have free access!",
+    'user_type_premium_days': "👑 You are a premium user ({days_remaining} days remaining)",
+    'user_type_premium_expired': "⚠️ Your premium subscription has expired",
+    'user_type_premium_permanent': "👑 You are a premium user (permanent)",
+    'user_type_free': "🆓 You are a free tier user (first 100)",
+    'subscription_plans': "📅 **Weekly Premium** - $9.99\n• 7 days access\n• All premium features\n\n🗓️ **Monthly Premium** - $29.99\n• 30 days access\n• Best value for regular traders\n\n📆 **Yearly Premium** - $199.99\n• 365 days access\n• Save 44% compared to monthly\n• Best for serious traders\n\n💳 **Payment Options:**\n• Cryptocurrency (BTC, ETH, USDT)\n• Bank Transfer\n• PayPal (Contact Support)\n\n⚠️ Secure payment processing",
+    'plan_weekly': "Weekly Premium",
+    'plan_monthly': "Monthly Premium",
+    'plan_yearly': "Yearly Premium (Best Value)",
+    'plan_details': "💎 **{plan_name}**\n\n💰 **Price:** ${price}\n⏰ **Duration:** {days} days\n\nPlease select your payment method:"
+}
+
+# English inline keyboard button labels
+BUTTONS = {
+    'status': "📊 Status", 'signals': "📈 Signals", 'coins': "💰 Coins", 'help': "📚 Help",
+    'language': "🌍 Language", 'delete': "🗑️ Delete", 'refresh': "🔄 Refresh", 'subscribe': "💎 Subscribe",
+    'paid': "💳 I Paid", 'support': "❓ Support", 'manage': "⚙️ Manage", 'admin': "⚙️ Admin",
+    'restart': "🔁 Restart", 'delete_yes': "✅ Yes, Delete", 'delete_no': "❌ Cancel", 'back_to_menu': "🔙 Back to Menu",
+    'weekly': "📅 Weekly", 'monthly': "🗓️ Monthly", 'yearly': "📆 Yearly", 'back': "🔙 Back",
+    'pay_btc': "₿ Bitcoin (BTC)", 'pay_eth': "⟠ Ethereum (ETH)", 'pay_usdt': "💚 USDT (TRC20)", 'pay_bank': "🏦 Bank Transfer"
+}
@@ -0,0 +1,119 @@
+# Spanish messages
+MESSAGES = {
+    'select_language': "🌍 Por favor selecciona tu idioma:\n\n🇺🇸 English\n🇪🇸 Español\n🇫🇷 Français\n🇩🇪 Deutsch\n🇷🇺 Русский",
+    'bot_intro': (
+        "🤖 Bot de Señales Crypto EMA20\n\n"
+        "✅ ¡El bot está funcionando y monitoreando!\n\n"
+        "📊 Siguiendo actualmente: 50 pares USDT\n"
+        "🔍 El análisis incluye:\n"
+        "• Rupturas EMA20 (4H y 1D)\n"
+        "• Confirmación de volumen\n"
+        "• Momentum RSI\n"
+        "• Tendencia SMA 200\n"
+        "• Patrones de velas alcistas\n\n"
+        "📈 Recibirás señales cuando ocurran rupturas\n"
+        "⏰ Escaneando cada 5 minutos\n\n"
+        "🎯 CARACTERÍSTICAS DE TRADING:\n"
+        "• Puntos de entrada con precios actuales\n"
+        "• Niveles de toma de ganancias (TP1, TP2, TP3)\n"
+        "• Cálculos de stop loss\n"
+        "• Ratios riesgo/recompensa\n"
+        "• Indicadores de fuerza de señal\n"
+        "• Recomendaciones de tamaño de posición\n"
+        "• Advertencias de zona de peligro\n\n"
+        "Comandos:\n"
+        "/start - Mostrar este estado\n"
+        "/status - Verificación rápida\n\n"
+        "⚠️ ¡Esto no es asesoramiento financiero!"
+    ),
+    'status_report': (
+        "📊 Reporte de Estado del Bot\n\n"
+        "✅ Monitoreando: 50 pares crypto\n"
+        "📈 Señales enviadas hoy: {signals_count}\n"
+        "🔄 Escaneando cada 5 minutos\n"
+        "💪 Todos los sistemas operativos"
+    ),
+    'admin_only': "❌ Comando solo para administrador",
+    'free_tier_welcome': "🎉 ¡Bienvenido al Bot Crypto EMA20 Breakout!\n\n🤖 **Qué hace este bot:**\nEste bot monitorea automáticamente 50 criptomonedas principales y te envía señales de trading instantáneas cuando detecta oportunidades rentables de ruptura EMA20. Obtienes puntos de entrada, niveles de toma de ganancias, cálculos de stop loss y guía de gestión de riesgos, todo entregado directamente a tu Telegram.\n\n🆓 **¡FELICITACIONES!** ¡Tienes acceso GRATUITO a todas las funciones premium!\n\n🎯 Lo que obtienes (completamente gratis):\n• Señales avanzadas de ruptura EMA20 de 50 pares USDT\n• Alertas de trading en tiempo real con puntos de entrada/salida\n• Niveles de toma de ganancias (TP1, TP2, TP3) y stop loss\n• Confirmación de volumen y análisis de tendencias\n• Guía de gestión de riesgos y dimensionamiento de posiciones\n• Análisis técnico multi-timeframe\n• Recomendaciones de trading profesionales\n\n📊 Características técnicas:\n• Monitorea: BTC, ETH, BNB, SOL, XRP, ADA, AVAX, DOT, LINK, MATIC y 40 pares más\n• Frecuencia de escaneo: Cada 4 horas\n• Entrega de señales: Notificaciones instantáneas de Telegram\n• Análisis: Rupturas EMA20 con confirmación de volumen\n\n🌍 Soporte multiidioma en 5 idiomas\n\n🚀 ¡Eres uno de nuestros primeros 100 usuarios - disfruta el acceso completamente gratis!\n\n⚠️ Importante: Después de 100 usuarios, los nuevos miembros necesitarán suscripciones premium. ¡Tu acceso gratuito es permanente!\n\n📚 Escribe /help para la guía completa de funciones",
+    'free_tier_full': "🎉 ¡Bienvenido al Bot Crypto EMA20 Breakout!\n\n🤖 **Qué hace este bot:**\nEste bot monitorea automáticamente 50 criptomonedas principales y te envía señales de trading instantáneas cuando detecta oportunidades rentables de ruptura EMA20. Obtienes puntos de entrada, niveles de toma de ganancias, cálculos de stop loss y guía de gestión de riesgos, todo entregado directamente a tu Telegram.\n\n🆓 ¡Gracias por tu interés! Nuestro nivel gratuito está lleno (100/100 usuarios).\n\n💎 Características de Suscripción Premium:\n• Señales avanzadas de ruptura EMA20 de 50 pares USDT\n• Alertas de trading en tiempo real con puntos de entrada/salida\n• Niveles de toma de ganancias (TP1, TP2, TP3) y cálculos de stop loss\n• Confirmación de volumen y análisis de fuerza de tendencia\n• Guía de gestión de riesgos y dimensionamiento de posiciones\n• Análisis técnico multi-timeframe (4H, 1D)\n• Recomendaciones de trading profesionales\n\n📊 Lo que obtienes:\n• Monitorea: BTC, ETH, BNB, SOL, XRP, ADA, AVAX, DOT, LINK, MATIC + 40 pares más\n• Escaneo: Cada 4 horas continuamente\n• Entrega: Notificaciones instantáneas de Telegram\n• Análisis: Rupturas EMA20 con confirmación de volumen\n• Idiomas: Soporte de 5 idiomas\n\n💰 Planes premium asequibles desde $9.99/semana\n\n¡Usa /subscribe para obtener acceso premium!\n\n📚 Escribe /help para la guía completa de funciones",
+    'trial_expired': "⏰ ¡Tu prueba de 3 días ha expirado!\n\n💎 Actualiza a Premium para continuar recibiendo señales:\n• Semanal: $9.99\n• Mensual: $29.99 (Mejor Valor)\n• Anual: $199.99 (Ahorra 44%)\n\n¡Usa /subscribe para actualizar ahora!",
+    'trial_welcome': "🎉 ¡Bienvenido! ¡Tienes una prueba GRATUITA de 3 días!\n\n✅ Acceso completo a todas las funciones premium:\n• Señales de trading en tiempo real\n• Recomendaciones de entrada/salida\n• Guía de gestión de riesgos\n• Análisis multi-timeframe\n\nLa prueba expira en {days} días. ¡Usa /subscribe para actualizar en cualquier momento!",
+    'subscription_menu': "💎 Elige Tu Plan Premium:\n\n📅 Planes Disponibles:",
+    'payment_success': "✅ ¡Pago Exitoso!\n\n¡Bienvenido a Premium! Ahora tienes acceso completo a todas las señales de trading y funciones.",
+    'subscription_reminder': "⏰ Tu suscripción Premium vence en {days} día(s) ({date}).\n\n💎 Usa /subscribe para renovar y seguir recibiendo señales de trading.",
+    'payment_failed': "❌ Error en el pago. Por favor intenta de nuevo o contacta soporte.",
+    'not_subscribed': "🔒 Función Premium\n\nAcceso gratuito disponible para los primeros 100 usuarios, luego se requiere suscripción premium.\nUsuarios actuales: {user_count}/100\n\n¡Si está lleno, usa /subscribe para actualizar y desbloquear todas las señales de trading!",
+    'help_message_free': (
+        "📚 Bot Crypto EMA20 Breakout - Guía Completa\n\n"
+        "🎯 Qué hace este bot:\n"
+        "Este bot es un servicio avanzado de señales de trading de criptomonedas que monitorea 50 pares principales USDT en Binance usando análisis técnico sofisticado. Detecta oportunidades rentables de ruptura EMA20 con confirmación de volumen y te envía señales de trading instantáneas.\n\n"
+        "🆓 **¡ACCESO GRATUITO Disponible!**\n"
+        "¡Únete ahora y obtén acceso completamente gratuito a todas las funciones premium. ¡Limitado solo a los primeros 100 usuarios!\n\n"
+        "🔍 Características de Análisis Técnico:\n"
+        "• Detección de ruptura EMA20 (Media Móvil Exponencial)\n"
+        "• Confirmación de volumen para validación de señales\n"
+        "• Análisis multi-timeframe (gráficos 4H, 1D)\n"
+        "• Identificación de niveles de soporte/resistencia\n"
+        "• Análisis de fuerza de tendencia\n"
+        "• Indicadores de momentum del mercado\n\n"
+        "📊 Información de Señales de Trading:\n"
+        "• Recomendaciones de precio de entrada\n"
+        "• Niveles de toma de ganancias (TP1, TP2, TP3)\n"
+        "• Cálculos de stop loss\n"
+        "• Ratios riesgo/recompensa\n"
+        "• Guía de tamaño de posición\n"
+        "• Análisis de contexto del mercado\n\n"
+        "⏰ Horario de Monitoreo:\n"
+        "• Escaneo continuo del mercado cada 4 horas\n"
+        "• Entrega de señales en tiempo real\n"
+        "• 50 pares USDT monitoreados simultáneamente\n"
+        "• Notificaciones instantáneas cuando se cumplen condiciones\n\n"
+        "🤖 Comandos Disponibles:\n"
+        "/start - Bienvenida y selección de idioma\n"
+        "/status - Estado del bot y señales recientes\n"
+        "/help - Esta guía completa\n\n"
+        "🌍 Soporte Multi-Idioma:\n"
+        "Soporte completo para 5 idiomas: Inglés, Español, Francés, Alemán, Ruso\n\n"
+        "💰 Criptomonedas Soportadas:\n"
+        "BTC, ETH, BNB, ADA, SOL, XRP, MATIC, AVAX, DOT, LINK, LTC, ATOM, ALGO, VET, FIL, TRX, EOS, XLM, NEO, IOTA, DASH, SHIB, PEPE, TON, BCH, NEAR, APT, HBAR, ETC, RNDR, INJ, STX, FLOW, ARB, OP y 15 pares más\n\n"
+        "🎯 Quién debería usar este bot:\n"
+        "• Traders de criptomonedas buscando oportunidades rentables\n"
+        "• Entusiastas del análisis técnico\n"
+        "• Tanto traders principiantes como experimentados\n"
+        "• Cualquiera que quiera monitoreo automatizado del mercado\n\n"
+        "📧 Soporte: @avie_support"
+    ),
+    'help_message_premium': "📚 Guía Premium - Todas las funciones desbloqueadas\n\n🎯 Acceso completo a análisis avanzado y señales en tiempo real\n\n📊 Funciones Premium activas\n💎 Trading profesional habilitado",
+    'command_menu': "🤖 **Menú de Comandos del Bot**\n\n📊 Comandos principales:\n• /start - Inicio y selección de idioma\n• /status - Estado actual del bot\n• /help - Guía completa\n• /subscribe - Planes premium\n\n🎯 Usa los botones para navegación fácil",
+    'coin_list': "💰 Pares de Criptomonedas Monitoreados\n\n📊 El bot monitorea continuamente estos 50 pares USDT para señales de ruptura EMA20:\n\n🔸 BTC/USDT - Bitcoin\n🔸 ETH/USDT - Ethereum\n🔸 BNB/USDT - Binance Coin\n🔸 SOL/USDT - Solana\n🔸 XRP/USDT - Ripple\n🔸 ADA/USDT - Cardano\n🔸 AVAX/USDT - Avalanche\n🔸 DOT/USDT - Polkadot\n🔸 LINK/USDT - Chainlink\n🔸 MATIC/USDT - Polygon\n🔸 UNI/USDT - Uniswap\n🔸 LTC/USDT - Litecoin\n🔸 ATOM/USDT - Cosmos\n🔸 FTM/USDT - Fantom\n🔸 ALGO/USDT - Algorand\n🔸 VET/USDT - VeChain\n🔸 ICP/USDT - Internet Computer\n🔸 SAND/USDT - The Sandbox\n🔸 MANA/USDT - Decentraland\n🔸 CRV/USDT - Curve DAO\n🔸 AAVE/USDT - Aave\n🔸 MKR/USDT - Maker\n\n⚡ Las señales se generan cuando:\n• Ruptura EMA20 confirmada en marcos de 4H + 1D\n• El volumen es 1.5x por encima del promedio\n• Se cumplen criterios técnicos adicionales\n\n🔄 Actualizado cada 5 minutos",
+    'payment_submitted': "✅ ¡Información de pago enviada!\n\n📋 Tus detalles de pago han sido enviados para verificación.\n\n⏳ Tiempo de procesamiento: Usualmente dentro de 24 horas\n💎 Recibirás acceso premium una vez verificado\n\n📧 Contacta @avie_support si tienes preguntas",
+    'paid_command_usage': "💳 Uso del Comando de Pago:\n\n📝 Formato: /paid <método> <hash_transacción>\n\n🔸 Ejemplo: /paid BTC 1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa\n🔸 Ejemplo: /paid ETH 0x742d35cc6ab2b7b8c5c1234567890abcdef123456\n🔸 Ejemplo: /paid USDT TxHash123456789\n\n📧 Contacta @avie_support para asistencia con pagos",
+    'delete_messages_confirm': "🗑️ Eliminar Todos los Mensajes del Bot\n\n⚠️ Esto eliminará todos los mensajes enviados por el bot en este chat.\n\n❗ Esta acción no se puede deshacer.\n\n¿Estás seguro de que quieres continuar?",
+    'delete_messages_success': "✅ Se eliminaron exitosamente todos los mensajes del bot de este chat.",
+    'delete_messages_error': "❌ Algunos mensajes no pudieron ser eliminados. Esto es normal para mensajes antiguos (48+ horas).",
+    'delete_messages_none': "ℹ️ No se encontraron mensajes del bot para eliminar en este chat.",
+    'main_menu': "🤖 **Menú del Bot de Trading de Criptomonedas**\n\n{tier_line}\n\n📊 Monitoreo: 50 pares de cripto\n⚡ Señales: Estrategia de ruptura EMA20\n🔄 Actualizaciones: Cada 5 minutos\n\n💰 **Aviso:** El bot requerirá pago después de 100 usuarios\n👥 Usuarios actuales: {user_count}/100\n\n**Elige una opción:**",
+    'menu_tier_premium': "✅ **Usuario Premium** - Todas las funciones desbloqueadas",
+    'menu_tier_free': "🆓 **Usuario Gratis** - Todas las funciones incluidas",
+    'menu_tier_locked': "🔒 **Premium Requerido** - Nivel gratuito lleno (100/100)",
+    'menu_tier_welcome': "🆓 **Bienvenido** - ¡Tienes acceso gratuito!",
+    'user_type_premium_days': "👑 Eres usuario premium ({days_remaining} días restantes)",
+    'user_type_premium_expired': "⚠️ Su suscripción premium ha expirado",
+    'user_type_premium_permanent': "👑 Eres usuario premium (permanente)",
+    'user_type_free': "🆓 Eres usuario de nivel gratuito (primeros 100)",
+    'subscription_plans': "📅 **Premium Semanal** - $9.99\n• 7 días de acceso\n• Todas las funciones premium\n\n🗓️ **Premium Mensual** - $29.99\n• 30 días de acceso\n• Mejor valor para traders regulares\n\n📆 **Premium Anual** - $199.99\n• 365 días de acceso\n• Ahorra 44% comparado con mensual\n• Mejor para traders serios\n\n💳 **Opciones de Pago:**\n• Criptomonedas (BTC, ETH, USDT)\n• Transferencia Bancaria\n• PayPal (Contactar Soporte)\n\n⚠️ Procesamiento de pago seguro",
+    'plan_weekly': "Premium Semanal",
+    'plan_monthly': "Premium Mensual",
+    'plan_yearly': "Premium Anual",
+    'plan_details': "💎 **{plan_name}**\n\n💰 **Precio:** ${price}\n⏰ **Duración:** {days} días\n\nPor favor selecciona tu método de pago:"
+}
+
+# Spanish inline keyboard button labels
+BUTTONS = {
+    'status': "📊 Estado", 'signals': "📈 Señales", 'coins': "💰 Monedas", 'help': "📚 Ayuda",
+    'language': "🌍 Idioma", 'delete': "🗑️ Eliminar", 'refresh': "🔄 Actualizar", 'subscribe': "💎 Suscribirse",
+    'paid': "💳 Pagué", 'support': "❓ Soporte", 'manage': "⚙️ Gestionar", 'admin': "⚙️ Admin",
+    'restart': "🔁 Reiniciar", 'delete_yes': "✅ Sí, Eliminar", 'delete_no': "❌ Cancelar", 'back_to_menu': "🔙 Al Menú",
+    'weekly': "📅 Semanal", 'monthly': "🗓️ Mensual", 'yearly': "📆 Anual", 'back': "🔙 Atrás",
+    'pay_btc': "₿ Bitcoin (BTC)", 'pay_eth': "⟠ Ethereum (ETH)", 'pay_usdt': "💚 USDT (TRC20)", 'pay_bank': "🏦 Transferencia Bancaria"
+}
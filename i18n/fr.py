@@ -0,0 +1,119 @@
+# French messages
+MESSAGES = {
+    'select_language': "🌍 Veuillez sélectionner votre langue:\n\n🇺🇸 English\n🇪🇸 Español\n🇫🇷 Français\n🇩🇪 Deutsch\n🇷🇺 Русский",
+    'bot_intro': (
+        "🤖 Bot de Signaux Crypto EMA20\n\n"
+        "✅ Le bot fonctionne et surveille!\n\n"
+        "📊 Suivi actuel: 50 paires USDT\n"
+        "🔍 L'analyse comprend:\n"
+        "• Cassures EMA20 (4H et 1D)\n"
+        "• Confirmation de volume\n"
+        "• Momentum RSI\n"
+        "• Tendance SMA 200\n"
+        "• Modèles de chandelles haussières\n\n"
+        "📈 Vous recevrez des signaux lors des cassures\n"
+        "⏰ Scan toutes les 5 minutes\n\n"
+        "🎯 FONCTIONNALITÉS DE TRADING:\n"
+        "• Points d'entrée avec prix actuels\n"
+        "• Niveaux de prise de profit (TP1, TP2, TP3)\n"
+        "• Calculs de stop loss\n"
+        "• Ratios risque/récompense\n"
+        "• Indicateurs de force du signal\n"
+        "• Recommandations de taille de position\n"
+        "• Avertissements de zone de danger\n\n"
+        "Commandes:\n"
+        "/start - Afficher ce statut\n"
+        "/status - Vérification rapide\n\n"
+        "⚠️ Ce n'est pas un conseil financier!"
+    ),
+    'status_report': (
+        "📊 Rapport de Statut du Bot\n\n"
+        "✅ Surveillance: 50 paires crypto\n"
+        "📈 Signaux envoyés aujourd'hui: {signals_count}\n"
+        "🔄 Scan toutes les 5 minutes\n"
+        "💪 Tous les systèmes opérationnels"
+    ),
+    'admin_only': "❌ Commande réservée à l'administrateur",
+    'free_tier_welcome': "🎉 Bienvenue au Bot Crypto EMA20 Breakout!\n\n🤖 **Ce que fait ce bot:**\nCe bot surveille automatiquement 50 principales cryptomonnaies et vous envoie des signaux de trading instantanés quand il détecte des opportunités rentables de cassure EMA20. Vous obtenez des points d'entrée, des niveaux de prise de profit, des calculs de stop loss et des conseils de gestion des risques - tout livré directement à votre Telegram.\n\n🆓 **FÉLICITATIONS!** Vous avez un accès GRATUIT à toutes les fonctionnalités premium!\n\n🎯 Ce que vous obtenez (complètement gratuit):\n• Signaux avancés de cassure EMA20 de 50 paires USDT\n• Alertes de trading en temps réel avec points d'entrée/sortie\n• Niveaux de prise de profit (TP1, TP2, TP3) et stop loss\n• Confirmation de volume et analyse de tendance\n• Guide de gestion des risques et dimensionnement de position\n• Analyse technique multi-timeframe\n• Recommandations de trading professionnelles\n\n📊 Caractéristiques techniques:\n• Surveille: BTC, ETH, BNB, SOL, XRP, ADA, AVAX, DOT, LINK, MATIC et 40 paires de plus\n• Fréquence de scan: Toutes les 4 heures\n• Livraison de signaux: Notifications Telegram instantanées\n• Analyse: Cassures EMA20 avec confirmation de volume\n\n🌍 Support multilingue en 5 langues\n\n🚀 Vous êtes l'un de nos 100 premiers utilisateurs - profitez de l'accès complètement gratuit!\n\n⚠️ Important: Après 100 utilisateurs, les nouveaux membres auront besoin d'abonnements premium. Votre accès gratuit est permanent!\n\n📚 Tapez /help pour le guide complet des fonctionnalités",
+    'free_tier_full': "🎉 Bienvenue au Bot Crypto EMA20 Breakout!\n\n🤖 **Ce que fait ce bot:**\nCe bot surveille automatiquement 50 principales cryptomonnaies et vous envoie des signaux de trading instantanés quand il détecte des opportunités rentables de cassure EMA20. Vous obtenez des points d'entrée, des niveaux de prise de profit, des calculs de stop loss et des conseils de gestion des risques - tout livré directement à votre Telegram.\n\n🆓 Merci pour votre intérêt! Notre niveau gratuit est complet (100/100 utilisateurs).\n\n💎 Fonctionnalités d'abonnement Premium:\n• Signaux avancés de cassure EMA20 de 50 paires USDT\n• Alertes de trading en temps réel avec points d'entrée/sortie\n• Niveaux de prise de profit (TP1, TP2, TP3) et calculs de stop loss\n• Confirmation de volume et analyse de force de tendance\n• Guide de gestion des risques et dimensionnement de position\n• Analyse technique multi-timeframe (4H, 1D)\n• Recommandations de trading professionnelles\n\n📊 Ce que vous obtenez:\n• Surveille: BTC, ETH, BNB, SOL, XRP, ADA, AVAX, DOT, LINK, MATIC + 40 paires de plus\n• Scan: Toutes les 4 heures en continu\n• Livraison: Notifications Telegram instantanées\n• Analyse: Cassures EMA20 avec confirmation de volume\n• Langues: Support de 5 langues\n\n💰 Plans premium abordables à partir de $9.99/semaine\n\nUtilisez /subscribe pour obtenir l'accès premium!\n\n📚 Tapez /help pour le guide complet des fonctionnalités",
+    'trial_expired': "⏰ Votre essai de 3 jours a expiré!\n\n💎 Passez à Premium pour continuer à recevoir des signaux:\n• Hebdomadaire: $9.99\n• Mensuel: $29.99 (Meilleure Valeur)\n• Annuel: $199.99 (Économisez 44%)\n\nUtilisez /subscribe pour passer à niveau maintenant!",
+    'trial_welcome': "🎉 Bienvenue! Vous avez un essai GRATUIT de 3 jours!\n\n✅ Accès complet à toutes les fonctionnalités premium:\n• Signaux de trading en temps réel\n• Recommandations d'entrée/sortie\n• Guidance de gestion des risques\n• Analyse multi-timeframe\n\nL'essai expire dans {days} jours. Utilisez /subscribe pour passer à niveau à tout moment!",
+    'subscription_menu': "💎 Choisissez Votre Plan Premium:\n\n📅 Plans Disponibles:",
+    'payment_success': "✅ Paiement Réussi!\n\nBienvenue à Premium! Vous avez maintenant un accès complet à tous les signaux de trading et fonctionnalités.",
+    'subscription_reminder': "⏰ Votre abonnement Premium expire dans {days} jour(s) ({date}).\n\n💎 Utilisez /subscribe pour renouveler et continuer à recevoir des signaux de trading.",
+    'payment_failed': "❌ Échec du paiement. Veuillez réessayer ou contacter le support.",
+    'not_subscribed': "🔒 Fonctionnalité Premium\n\nCette fonctionnalité nécessite un abonnement premium.\nUtilisez /subscribe pour passer à niveau et débloquer tous les signaux de trading!",
+    'help_message_free': (
+        "📚 Bot Crypto EMA20 Breakout - Guide Complet\n\n"
+        "🎯 Ce que fait ce bot:\n"
+        "Ce bot est un service avancé de signaux de trading de cryptomonnaies qui surveille 50 paires USDT principales sur Binance en utilisant une analyse technique sophistiquée. Il détecte les opportunités rentables de cassure EMA20 avec confirmation de volume et vous envoie des signaux de trading instantanés.\n\n"
+        "🆓 **ACCÈS GRATUIT Disponible!**\n"
+        "Rejoignez maintenant et obtenez un accès complètement gratuit à toutes les fonctionnalités premium. Limité aux 100 premiers utilisateurs seulement!\n\n"
+        "🔍 Caractéristiques d'Analyse Technique:\n"
+        "• Détection de cassure EMA20 (Moyenne Mobile Exponentielle)\n"
+        "• Confirmation de volume pour validation de signal\n"
+        "• Analyse multi-timeframe (graphiques 4H, 1D)\n"
+        "• Identification des niveaux de support/résistance\n"
+        "• Analyse de force de tendance\n"
+        "• Indicateurs de momentum de marché\n\n"
+        "📊 Informations de Signal de Trading:\n"
+        "• Recommandations de prix d'entrée\n"
+        "• Niveaux de prise de profit (TP1, TP2, TP3)\n"
+        "• Calculs de stop loss\n"
+        "• Ratios risque/récompense\n"
+        "• Guidance de dimensionnement de position\n"
+        "• Analyse de contexte de marché\n\n"
+        "⏰ Programme de Surveillance:\n"
+        "• Scan continu du marché toutes les 4 heures\n"
+        "• Livraison de signaux en temps réel\n"
+        "• 50 paires USDT surveillées simultanément\n"
+        "• Notifications instantanées quand les conditions sont remplies\n\n"
+        "🤖 Commandes Disponibles:\n"
+        "/start - Bienvenue et sélection de langue\n"
+        "/status - Statut du bot et signaux récents\n"
+        "/help - Ce guide complet\n\n"
+        "🌍 Support Multi-Langue:\n"
+        "Support complet pour 5 langues: Anglais, Espagnol, Français, Allemand, Russe\n\n"
+        "💰 Cryptomonnaies Supportées:\n"
+        "BTC, ETH, BNB, ADA, SOL, XRP, MATIC, AVAX, DOT, LINK, LTC, ATOM, ALGO, VET, FIL, TRX, EOS, XLM, NEO, IOTA, DASH, SHIB, PEPE, TON, BCH, NEAR, APT, HBAR, ETC, RNDR, INJ, STX, FLOW, ARB, OP et 15 paires de plus\n\n"
+        "🎯 Qui devrait utiliser ce bot:\n"
+        "• Traders de cryptomonnaies cherchant des opportunités rentables\n"
+        "• Enthousiastes d'analyse technique\n"
+        "• Traders débutants et expérimentés\n"
+        "• Quiconque voulant une surveillance automatisée du marché\n\n"
+        "📧 Support: @avie_support"
+    ),
+    'help_message_premium': "📚 Guide Premium - Toutes les fonctionnalités débloquées\n\n🎯 Accès complet à l'analyse avancée et signaux en temps réel\n\n📊 Fonctionnalités Premium actives\n💎 Trading professionnel activé",
+    'command_menu': "🤖 **Menu des Commandes du Bot**\n\n📊 Commandes principales:\n• /start - Accueil et sélection de langue\n• /status - Statut actuel du bot\n• /help - Guide complet\n• /subscribe - Plans premium\n\n🎯 Utilisez les boutons pour une navigation facile",
+    'coin_list': "💰 Paires de Cryptomonnaies Surveillées\n\n📊 Le bot surveille en continu ces 50 paires USDT pour les signaux de rupture EMA20:\n\n🔸 BTC/USDT - Bitcoin\n🔸 ETH/USDT - Ethereum\n🔸 BNB/USDT - Binance Coin\n🔸 SOL/USDT - Solana\n🔸 XRP/USDT - Ripple\n🔸 ADA/USDT - Cardano\n🔸 AVAX/USDT - Avalanche\n🔸 DOT/USDT - Polkadot\n🔸 LINK/USDT - Chainlink\n🔸 MATIC/USDT - Polygon\n🔸 UNI/USDT - Uniswap\n🔸 LTC/USDT - Litecoin\n🔸 ATOM/USDT - Cosmos\n🔸 FTM/USDT - Fantom\n🔸 ALGO/USDT - Algorand\n🔸 VET/USDT - VeChain\n🔸 ICP/USDT - Internet Computer\n🔸 SAND/USDT - The Sandbox\n🔸 MANA/USDT - Decentraland\n🔸 CRV/USDT - Curve DAO\n🔸 AAVE/USDT - Aave\n🔸 MKR/USDT - Maker\n\n⚡ Signaux générés quand:\n• Rupture EMA20 confirmée sur timeframes 4H + 1D\n• Volume 1.5x au-dessus de la moyenne\n• Critères techniques supplémentaires remplis\n\n🔄 Mis à jour toutes les 5 minutes",
+    'payment_submitted': "✅ Informations de paiement soumises!\n\n📋 Vos détails de paiement ont été envoyés pour vérification.\n\n⏳ Temps de traitement: Généralement sous 24 heures\n💎 Vous recevrez l'accès premium une fois vérifié\n\n📧 Contactez @avie_support si vous avez des questions",
+    'paid_command_usage': "💳 Utilisation de la Commande de Paiement:\n\n📝 Format: /paid <méthode> <hash_transaction>\n\n🔸 Exemple: /paid BTC 1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa\n🔸 Exemple: /paid ETH 0x742d35cc6ab2b7b8c5c1234567890abcdef123456\n🔸 Exemple: /paid USDT TxHash123456789\n\n📧 Contactez @avie_support pour l'assistance paiement",
+    'delete_messages_confirm': "🗑️ Supprimer Tous les Messages du Bot\n\n⚠️ Cela supprimera tous les messages envoyés par le bot dans ce chat.\n\n❗ Cette action ne peut pas être annulée.\n\nÊtes-vous sûr de vouloir continuer?",
+    'delete_messages_success': "✅ Tous les messages du bot ont été supprimés avec succès de ce chat.",
+    'delete_messages_error': "❌ Certains messages n'ont pas pu être supprimés. C'est normal pour les anciens messages (48+ heures).",
+    'delete_messages_none': "ℹ️ Aucun message du bot trouvé à supprimer dans ce chat.",
+    'main_menu': "🤖 **Menu du Bot de Trading Crypto**\n\n{tier_line}\n\n📊 Surveillance: 50 paires crypto\n⚡ Signaux: Stratégie de cassure EMA20\n🔄 Mises à jour: Toutes les 5 minutes\n\n💰 **Avis:** Le bot nécessitera un paiement après 100 utilisateurs\n👥 Utilisateurs actuels: {user_count}/100\n\n**Choisissez une option:**",
+    'menu_tier_premium': "✅ **Utilisateur Premium** - Toutes les fonctionnalités débloquées",
+    'menu_tier_free': "🆓 **Utilisateur Gratuit** - Toutes les fonctionnalités incluses",
+    'menu_tier_locked': "🔒 **Premium Requis** - Niveau gratuit plein (100/100)",
+    'menu_tier_welcome': "🆓 **Bienvenue** - Vous avez un accès gratuit!",
+    'user_type_premium_days': "👑 Vous êtes utilisateur premium ({days_remaining} jours restants)",
+    'user_type_premium_expired': "⚠️ Votre abonnement premium a expiré",
+    'user_type_premium_permanent': "👑 Vous êtes utilisateur premium (permanent)",
+    'user_type_free': "🆓 Vous êtes utilisateur gratuit (100 premiers)",
+    'subscription_plans': "📅 **Premium Hebdomadaire** - $9.99\n• 7 jours d'accès\n• Toutes les fonctionnalités premium\n\n🗓️ **Premium Mensuel** - $29.99\n• 30 jours d'accès\n• Meilleure valeur pour les traders réguliers\n\n📆 **Premium Annuel** - $199.99\n• 365 jours d'accès\n• Économisez 44% par rapport au mensuel\n• Meilleur pour les traders sérieux\n\n💳 **Options de Paiement:**\n• Cryptomonnaies (BTC, ETH, USDT)\n• Virement Bancaire\n• PayPal (Contacter le Support)\n\n⚠️ Traitement de paiement sécurisé",
+    'plan_weekly': "Premium Hebdomadaire",
+    'plan_monthly': "Premium Mensuel",
+    'plan_yearly': "Premium Annuel",
+    'plan_details': "💎 **{plan_name}**\n\n💰 **Prix:** ${price}\n⏰ **Durée:** {days} jours\n\nVeuillez sélectionner votre méthode de paiement:"
+}
+
+# French inline keyboard button labels
+BUTTONS = {
+    'status': "📊 Statut", 'signals': "📈 Signaux", 'coins': "💰 Pièces", 'help': "📚 Aide",
+    'language': "🌍 Langue", 'delete': "🗑️ Supprimer", 'refresh': "🔄 Actualiser", 'subscribe': "💎 S'abonner",
+    'paid': "💳 J'ai Payé", 'support': "❓ Support", 'manage': "⚙️ Gérer", 'admin': "⚙️ Admin",
+    'restart': "🔁 Redémarrer", 'delete_yes': "✅ Oui, Supprimer", 'delete_no': "❌ Annuler", 'back_to_menu': "🔙 Au Menu",
+    'weekly': "📅 Hebdo", 'monthly': "🗓️ Mensuel", 'yearly': "📆 Annuel", 'back': "🔙 Retour",
+    'pay_btc': "₿ Bitcoin (BTC)", 'pay_eth': "⟠ Ethereum (ETH)", 'pay_usdt': "💚 USDT (TRC20)", 'pay_bank': "🏦 Virement Bancaire"
+}
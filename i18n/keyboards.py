@@ -0,0 +1,42 @@
+# Inline keyboard layouts: rows of (button label key, callback_data), keyed by (menu, user tier)
+from typing import Dict, List, Tuple
+
+ALL_TIERS = 'all'  # Menus that look the same for every user
+PLANS = ('weekly', 'monthly', 'yearly')
+
+Layout = List[List[Tuple[str, str]]]
+
+MAIN_MENU: Layout = [
+    [('status', 'cmd_status'), ('signals', 'cmd_signals'), ('coins', 'cmd_coins')],
+    [('help', 'cmd_help'), ('language', 'cmd_language'), ('delete', 'cmd_delete')],
+    [('refresh', 'cmd_menu'), ('subscribe', 'cmd_subscribe')]
+]
+
+# Premium users can still open the plans to manage their subscription
+PREMIUM_MENU: Layout = MAIN_MENU[:-1] + [MAIN_MENU[-1] + [('manage', 'cmd_subscribe')]]
+
+
+def payment_methods(plan: str) -> Layout:
+    return [
+        [('pay_btc', f'pay_{plan}_btc'), ('pay_eth', f'pay_{plan}_eth')],
+        [('pay_usdt', f'pay_{plan}_usdt')],
+        [('pay_bank', f'pay_{plan}_bank')],
+        [('support', 'support'), ('back_to_menu', 'cmd_menu')]
+    ]
+
+
+LAYOUTS: Dict[Tuple[str, str], Layout] = {
+    ('main', 'free'): MAIN_MENU,
+    # Users past the free tier also get the payment shortcuts
+    ('main', 'locked'): MAIN_MENU + [[('paid', 'cmd_paid'), ('support', 'support')]],
+    ('main', 'premium'): PREMIUM_MENU,
+    ('main', 'admin'): PREMIUM_MENU + [[('admin', 'cmd_admin'), ('restart', 'cmd_restart')]],
+    ('subscription', ALL_TIERS): [
+        [('weekly', 'sub_weekly'), ('monthly', 'sub_monthly')],
+        [('yearly', 'sub_yearly')],
+        [('support', 'support'), ('back', 'cmd_menu')]
+    ],
+    ('delete_confirm', ALL_TIERS): [[('delete_yes', 'confirm_delete_yes'), ('delete_no', 'confirm_delete_no')]],
+    ('back_to_menu', ALL_TIERS): [[('back_to_menu', 'cmd_menu')]],
+    **{(f'payment_{plan}', ALL_TIERS): payment_methods(plan) for plan in PLANS}
+}
@@ -0,0 +1,119 @@
+# Russian messages
+MESSAGES = {
+    'select_language': "🌍 Пожалуйста, выберите ваш язык:\n\n🇺🇸 English\n🇪🇸 Español\n🇫🇷 Français\n🇩🇪 Deutsch\n🇷🇺 Русский",
+    'bot_intro': (
+        "🤖 Крипто EMA20 Бот Пробоев\n\n"
+        "✅ Бот работает и мониторит!\n\n"
+        "📊 Отслеживает: 50 USDT пары\n"
+        "🔍 Анализ включает:\n"
+        "• Пробои EMA20 (4ч и 1д)\n"
+        "• Подтверждение объёма\n"
+        "• Моментум RSI\n"
+        "• Тренд 200 SMA\n"
+        "• Бычьи паттерны свечей\n\n"
+        "📈 Получите сигналы при пробоях\n"
+        "⏰ Сканирование каждые 5 минут\n\n"
+        "🎯 ТОРГОВЫЕ ФУНКЦИИ:\n"
+        "• Точки входа с текущими ценами\n"
+        "• Уровни тейк-профита (TP1, TP2, TP3)\n"
+        "• Расчёты стоп-лосса\n"
+        "• Соотношения риск/доходность\n"
+        "• Индикаторы силы сигнала\n"
+        "• Рекомендации размера позиции\n"
+        "• Предупреждения опасной зоны\n\n"
+        "Команды:\n"
+        "/start - Показать этот статус\n"
+        "/status - Быстрая проверка\n\n"
+        "⚠️ Это не финансовый совет!"
+    ),
+    'status_report': (
+        "📊 Отчёт о Статусе Бота\n\n"
+        "✅ Мониторинг: 50 крипто пары\n"
+        "📈 Сигналов отправлено сегодня: {signals_count}\n"
+        "🔄 Сканирование каждые 5 минут\n"
+        "💪 Все системы работают"
+    ),
+    'admin_only': "❌ Команда только для администратора",
+    'free_tier_welcome': "🎉 Добро пожаловать в Crypto EMA20 Breakout Bot!\n\n🤖 **Что делает этот бот:**\nЭтот бот автоматически отслеживает 50 основных криптовалют и отправляет вам мгновенные торговые сигналы, когда обнаруживает прибыльные возможности прорыва EMA20. Вы получаете точки входа, уровни тейк-профита, расчеты стоп-лосса и руководство по управлению рисками - все доставляется прямо в ваш Telegram.\n\n🆓 **ПОЗДРАВЛЯЕМ!** У вас есть БЕСПЛАТНЫЙ доступ ко всем премиум функциям!\n\n🎯 Что вы получаете (полностью бесплатно):\n• Продвинутые сигналы прорыва EMA20 от 50 USDT пар\n• Торговые уведомления в реальном времени с точками входа/выхода\n• Уровни тейк-профита (TP1, TP2, TP3) и стоп-лосс\n• Подтверждение объема и анализ тренда\n• Руководство по управлению рисками и размерам позиций\n• Многотаймфреймовый технический анализ\n• Профессиональные торговые рекомендации\n\n📊 Технические особенности:\n• Отслеживает: BTC, ETH, BNB, SOL, XRP, ADA, AVAX, DOT, LINK, MATIC и еще 40 пар\n• Частота сканирования: Каждые 4 часа\n• Доставка сигналов: Мгновенные уведомления Telegram\n• Анализ: Прорывы EMA20 с подтверждением объема\n\n🌍 Многоязычная поддержка на 5 языках\n\n🚀 Вы один из наших первых 100 пользователей - наслаждайтесь полностью бесплатным доступом!\n\n⚠️ Важно: После 100 пользователей новым участникам потребуются премиум подписки. Ваш бесплатный доступ навсегда!\n\n📚 Введите /help для полного руководства по функциям",
+    'free_tier_full': "🎉 Добро пожаловать в Crypto EMA20 Breakout Bot!\n\n🤖 **Что делает этот бот:**\nЭтот бот автоматически отслеживает 50 основных криптовалют и отправляет вам мгновенные торговые сигналы, когда обнаруживает прибыльные возможности прорыва EMA20. Вы получаете точки входа, уровни тейк-профита, расчеты стоп-лосса и руководство по управлению рисками - все доставляется прямо в ваш Telegram.\n\n🆓 Спасибо за ваш интерес! Наш бесплатный уровень заполнен (100/100 пользователей).\n\n💎 Функции премиум подписки:\n• Продвинутые сигналы прорыва EMA20 от 50 USDT пар\n• Торговые уведомления в реальном времени с точками входа/выхода\n• Уровни тейк-профита (TP1, TP2, TP3) и расчеты стоп-лосса\n• Подтверждение объема и анализ силы тренда\n• Руководство по управлению рисками и размерам позиций\n• Многотаймфреймовый технический анализ (4H, 1D)\n• Профессиональные торговые рекомендации\n\n📊 Что вы получаете:\n• Отслеживает: BTC, ETH, BNB, SOL, XRP, ADA, AVAX, DOT, LINK, MATIC + еще 40 пар\n• Сканирование: Каждые 4 часа непрерывно\n• Доставка: Мгновенные уведомления Telegram\n• Анализ: Прорывы EMA20 с подтверждением объема\n• Языки: Поддержка 5 языков\n\n💰 Доступные премиум планы от $9.99/неделя\n\nИспользуйте /subscribe для получения премиум доступа!\n\n📚 Введите /help для полного руководства по функциям",
+    'trial_expired': "⏰ Ваш 3-дневный пробный период истёк!\n\n💎 Обновитесь до Премиум для продолжения получения сигналов:\n• Недельный: $9.99\n• Месячный: $29.99 (Лучшее Предложение)\n• Годовой: $199.99 (Экономия 44%)\n\nИспользуйте /subscribe для обновления!",
+    'welcome_new_user': "🎉 Добро пожаловать в бота торговых сигналов!\n\n💎 Это премиум сервис торговых сигналов.\n\n✅ Премиум функции включают:\n• Торговые сигналы в реальном времени\n• Рекомендации входа/выхода\n• Руководство по управлению рисками\n• Мульти-таймфреймовый анализ\n\nИспользуйте /subscribe для получения премиум доступа!",
+    'subscription_menu': "💎 Выберите Ваш Премиум План:\n\n📅 Доступные Планы:",
+    'payment_success': "✅ Платёж Успешен!\n\nДобро пожаловать в Премиум! Теперь у вас есть полный доступ ко всем торговым сигналам и функциям.",
+    'subscription_reminder': "⏰ Ваша Премиум подписка истекает через {days} дн. ({date}).\n\n💎 Используйте /subscribe, чтобы продлить и продолжать получать торговые сигналы.",
+    'payment_failed': "❌ Ошибка платежа. Пожалуйста, попробуйте снова или обратитесь в поддержку.",
+    'not_subscribed': "🔒 Премиум Функция\n\nЭта функция требует премиум подписку.\nИспользуйте /subscribe для обновления и разблокировки всех торговых сигналов!",
+    'help_message_free': (
+        "📚 Crypto EMA20 Breakout Bot - Полное Руководство\n\n"
+        "🎯 Что делает этот бот:\n"
+        "Этот бот - продвинутый сервис торговых сигналов криптовалют, который мониторит 50 основных USDT торговых пар на Binance, используя сложный технический анализ. Он обнаруживает прибыльные возможности прорыва EMA20 с подтверждением объема и отправляет вам мгновенные торговые сигналы.\n\n"
+        "🆓 **БЕСПЛАТНЫЙ ДОСТУП Доступен!**\n"
+        "Присоединяйтесь сейчас и получите полностью бесплатный доступ ко всем премиум функциям. Ограничено только для первых 100 пользователей!\n\n"
+        "🔍 Функции Технического Анализа:\n"
+        "• Обнаружение прорыва EMA20 (Экспоненциальная Скользящая Средняя)\n"
+        "• Подтверждение объема для валидации сигналов\n"
+        "• Мульти-таймфреймовый анализ (4H, 1D графики)\n"
+        "• Идентификация уровней поддержки/сопротивления\n"
+        "• Анализ силы тренда\n"
+        "• Индикаторы рыночного моментума\n\n"
+        "📊 Информация Торговых Сигналов:\n"
+        "• Рекомендации цены входа\n"
+        "• Уровни взятия прибыли (TP1, TP2, TP3)\n"
+        "• Расчеты стоп-лосса\n"
+        "• Соотношения риск/прибыль\n"
+        "• Руководство по размеру позиции\n"
+        "• Анализ рыночного контекста\n\n"
+        "⏰ График Мониторинга:\n"
+        "• Непрерывное сканирование рынка каждые 4 часа\n"
+        "• Доставка сигналов в реальном времени\n"
+        "• 50 USDT пар мониторятся одновременно\n"
+        "• Мгновенные уведомления при выполнении условий\n\n"
+        "🤖 Доступные Команды:\n"
+        "/start - Приветствие и выбор языка\n"
+        "/status - Статус бота и недавние сигналы\n"
+        "/help - Это всеобъемлющее руководство\n\n"
+        "🌍 Мульти-Языковая Поддержка:\n"
+        "Полная поддержка 5 языков: Английский, Испанский, Французский, Немецкий, Русский\n\n"
+        "💰 Поддерживаемые Криптовалюты:\n"
+        "BTC, ETH, BNB, ADA, SOL, XRP, MATIC, AVAX, DOT, LINK, LTC, ATOM, ALGO, VET, FIL, TRX, EOS, XLM, NEO, IOTA, DASH, SHIB, PEPE, TON, BCH, NEAR, APT, HBAR, ETC, RNDR, INJ, STX, FLOW, ARB, OP и еще 15 пар\n\n"
+        "🎯 Кто должен использовать этот бот:\n"
+        "• Трейдеры криптовалют, ищущие прибыльные возможности\n"
+        "• Энтузиасты технического анализа\n"
+        "• Как начинающие, так и опытные трейдеры\n"
+        "• Любой, кто хочет автоматизированного мониторинга рынка\n\n"
+        "📧 Поддержка: @avie_support"
+    ),
+    'help_message_premium': "📚 Премиум Руководство - Все функции разблокированы\n\n🎯 Полный доступ к продвинутому анализу и сигналам в реальном времени\n\n📊 Премиум функции активны\n💎 Профессиональная торговля включена",
+    'command_menu': "🤖 **Меню Команд Бота**\n\n📊 Основные команды:\n• /start - Приветствие и выбор языка\n• /status - Текущий статус бота\n• /help - Полное руководство\n• /subscribe - Премиум планы\n\n🎯 Используйте кнопки для легкой навигации",
+    'coin_list': "💰 Отслеживаемые Криптовалютные Пары\n\n📊 Бот непрерывно мониторит эти 50 USDT пары для сигналов пробоя EMA20:\n\n🔸 BTC/USDT - Биткоин\n🔸 ETH/USDT - Эфириум\n🔸 BNB/USDT - Binance Coin\n🔸 SOL/USDT - Solana\n🔸 XRP/USDT - Рипл\n🔸 ADA/USDT - Кардано\n🔸 AVAX/USDT - Avalanche\n🔸 DOT/USDT - Polkadot\n🔸 LINK/USDT - Chainlink\n🔸 MATIC/USDT - Polygon\n🔸 UNI/USDT - Uniswap\n🔸 LTC/USDT - Лайткоин\n🔸 ATOM/USDT - Cosmos\n🔸 FTM/USDT - Fantom\n🔸 ALGO/USDT - Algorand\n🔸 VET/USDT - VeChain\n🔸 ICP/USDT - Internet Computer\n🔸 SAND/USDT - The Sandbox\n🔸 MANA/USDT - Decentraland\n🔸 CRV/USDT - Curve DAO\n🔸 AAVE/USDT - Aave\n🔸 MKR/USDT - Maker\n\n⚡ Сигналы генерируются когда:\n• Пробой EMA20 подтверждён на 4H + 1D таймфреймах\n• Объём в 1.5 раза выше среднего\n• Выполнены дополнительные технические критерии\n\n🔄 Обновляется каждые 5 минут",
+    'payment_submitted': "✅ Информация о платеже отправлена!\n\n📋 Детали вашего платежа отправлены на проверку.\n\n⏳ Время обработки: Обычно в течение 24 часов\n💎 Вы получите премиум доступ после проверки\n\n📧 Обращайтесь к @avie_support при вопросах",
+    'paid_command_usage': "💳 Использование команды платежа:\n\n📝 Формат: /paid <метод> <хеш_транзакции>\n\n🔸 Пример: /paid BTC 1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa\n🔸 Пример: /paid ETH 0x742d35cc6ab2b7b8c5c1234567890abcdef123456\n🔸 Пример: /paid USDT TxHash123456789\n\n📧 Обращайтесь к @avie_support за помощью с платежами",
+    'delete_messages_confirm': "🗑️ Удалить Все Сообщения Бота\n\n⚠️ Это удалит все сообщения, отправленные ботом в этом чате.\n\n❗ Это действие нельзя отменить.\n\nВы уверены, что хотите продолжить?",
+    'delete_messages_success': "✅ Все сообщения бота успешно удалены из этого чата.",
+    'delete_messages_error': "❌ Некоторые сообщения не удалось удалить. Это нормально для старых сообщений (48+ часов).",
+    'delete_messages_none': "ℹ️ В этом чате не найдено сообщений бота для удаления.",
+    'main_menu': "🤖 **Меню Криптотрейдинг Бота**\n\n{tier_line}\n\n📊 Мониторинг: 50 криптопар\n⚡ Сигналы: Стратегия прорыва EMA20\n🔄 Обновления: Каждые 5 минут\n\n💰 **Уведомление:** Бот потребует оплату после 100 пользователей\n👥 Текущие пользователи: {user_count}/100\n\n**Выберите опцию:**",
+    'menu_tier_premium': "✅ **Премиум Пользователь** - Все функции разблокированы",
+    'menu_tier_free': "🆓 **Бесплатный Пользователь** - Все функции включены",
+    'menu_tier_locked': "🔒 **Требуется Премиум** - Бесплатный уровень заполнен (100/100)",
+    'menu_tier_welcome': "🆓 **Добро пожаловать** - У вас есть бесплатный доступ!",
+    'user_type_premium_days': "👑 Вы премиум пользователь (осталось {days_remaining} дней)",
+    'user_type_premium_expired': "⚠️ Ваша премиум подписка истекла",
+    'user_type_premium_permanent': "👑 Вы премиум пользователь (постоянно)",
+    'user_type_free': "🆓 Вы пользователь бесплатного уровня (первые 100)",
+    'subscription_plans': "📅 **Недельный Премиум** - $9.99\n• 7 дней доступа\n• Все премиум функции\n\n🗓️ **Месячный Премиум** - $29.99\n• 30 дней доступа\n• Лучшая цена для обычных трейдеров\n\n📆 **Годовой Премиум** - $199.99\n• 365 дней доступа\n• Экономия 44% по сравнению с месячным\n• Лучше всего для серьезных трейдеров\n\n💳 **Варианты Оплаты:**\n• Криптовалюты (BTC, ETH, USDT)\n• Банковский Перевод\n• PayPal (Обратиться в Поддержку)\n\n⚠️ Безопасная обработка платежей",
+    'plan_weekly': "Недельный Премиум",
+    'plan_monthly': "Месячный Премиум",
+    'plan_yearly': "Годовой Премиум",
+    'plan_details': "💎 **{plan_name}**\n\n💰 **Цена:** ${price}\n⏰ **Продолжительность:** {days} дней\n\nПожалуйста, выберите способ оплаты:"
+}
+
+# Russian inline keyboard button labels
+BUTTONS = {
+    'status': "📊 Статус", 'signals': "📈 Сигналы", 'coins': "💰 Монеты", 'help': "📚 Помощь",
+    'language': "🌍 Язык", 'delete': "🗑️ Удалить", 'refresh': "🔄 Обновить", 'subscribe': "💎 Подписка",
+    'paid': "💳 Я Заплатил", 'support': "❓ Поддержка", 'manage': "⚙️ Управление", 'admin': "⚙️ Админ",
+    'restart': "🔁 Перезапуск", 'delete_yes': "✅ Да, Удалить", 'delete_no': "❌ Отмена", 'back_to_menu': "🔙 В Меню",
+    'weekly': "📅 Неделя", 'monthly': "🗓️ Месяц", 'yearly': "📆 Год", 'back': "🔙 Назад",
+    'pay_btc': "₿ Bitcoin (BTC)", 'pay_eth': "⟠ Ethereum (ETH)", 'pay_usdt': "💚 USDT (TRC20)", 'pay_bank': "🏦 Банковский Перевод"
+}
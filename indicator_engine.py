@@ -0,0 +1,142 @@
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import EMA_PERIOD, SMA_PERIOD, RSI_PERIOD, INDICATOR_HISTORY
+
+
+class SeriesState:
+    """Running EMA, rolling-SMA and Wilder RSI state for one (symbol, interval) series"""
+
+    def __init__(self, ema_period: int = EMA_PERIOD, sma_period: int = SMA_PERIOD,
+                 rsi_period: int = RSI_PERIOD):
+        self.ema_period = ema_period
+        self.sma_period = sma_period
+        self.rsi_period = rsi_period
+        self.alpha = 2.0 / (ema_period + 1)  # Same smoothing as pandas ewm(span, adjust=False)
+
+        self.last_open_time: Optional[int] = None
+        self.last_close: Optional[float] = None
+        self.count = 0
+
+        self.ema: Optional[float] = None
+        self.ema_history: deque = deque(maxlen=INDICATOR_HISTORY)
+
+        self.sma_window: deque = deque(maxlen=sma_period)
+        self.sma_sum = 0.0
+
+        self.rsi_deltas = 0
+        self.gain_sum = 0.0  # Seed sums for the first rsi_period deltas
+        self.loss_sum = 0.0
+        self.avg_gain: Optional[float] = None
+        self.avg_loss: Optional[float] = None
+
+    def push(self, open_time: int, close: float):
+        """Commit one closed candle in O(1)"""
+        self.ema = close if self.ema is None else self.alpha * close + (1 - self.alpha) * self.ema
+        self.ema_history.append(self.ema)
+
+        if len(self.sma_window) == self.sma_period:
+            self.sma_sum -= self.sma_window[0]
+        self.sma_window.append(close)
+        self.sma_sum += close
+
+        if self.last_close is not None:
+            delta = close - self.last_close
+            gain, loss = max(delta, 0.0), max(-delta, 0.0)
+            self.rsi_deltas += 1
+            if self.avg_gain is None:
+                self.gain_sum += gain
+                self.loss_sum += loss
+                if self.rsi_deltas == self.rsi_period:
+                    self.avg_gain = self.gain_sum / self.rsi_period
+                    self.avg_loss = self.loss_sum / self.rsi_period
+            else:
+                self.avg_gain = (self.avg_gain * (self.rsi_period - 1) + gain) / self.rsi_period
+                self.avg_loss = (self.avg_loss * (self.rsi_period - 1) + loss) / self.rsi_period
+
+        self.last_open_time = open_time
+        self.last_close = close
+        self.count += 1
+
+    def provisional(self, close: float) -> Dict[str, Optional[float]]:
+        """Indicator values if the still-open candle closed at `close` (state is not changed)"""
+        ema = close if self.ema is None else self.alpha * close + (1 - self.alpha) * self.ema
+
+        sma = None
+        if len(self.sma_window) == self.sma_period:
+            sma = (self.sma_sum - self.sma_window[0] + close) / self.sma_period
+        elif len(self.sma_window) == self.sma_period - 1:
+            sma = (self.sma_sum + close) / self.sma_period
+
+        rsi = None
+        if self.last_close is not None:
+            delta = close - self.last_close
+            gain, loss = max(delta, 0.0), max(-delta, 0.0)
+            if self.avg_gain is not None:
+                avg_gain = (self.avg_gain * (self.rsi_period - 1) + gain) / self.rsi_period
+                avg_loss = (self.avg_loss * (self.rsi_period - 1) + loss) / self.rsi_period
+            elif self.rsi_deltas + 1 == self.rsi_period:
+                avg_gain = (self.gain_sum + gain) / self.rsi_period
+                avg_loss = (self.loss_sum + loss) / self.rsi_period
+            else:
+                avg_gain = avg_loss = None
+            if avg_gain is not None:
+                rsi = 100.0 if avg_loss == 0 else 100 - (100 / (1 + avg_gain / avg_loss))
+
+        return {'ema20': ema, 'sma200': sma, 'rsi': rsi}
+
+
+class IndicatorEngine:
+    """Keeps indicator state per (symbol, interval) and applies new candles incrementally"""
+
+    def __init__(self):
+        self.series: Dict[Tuple[str, str], SeriesState] = {}
+        self.stats = {'incremental_updates': 0, 'candles_applied': 0, 'reseeds': 0}
+
+    def _reseed(self, key: Tuple[str, str], closed: List[Tuple[int, float]]) -> SeriesState:
+        state = SeriesState()
+        for open_time, close in closed:
+            state.push(open_time, close)
+        self.series[key] = state
+        self.stats['reseeds'] += 1
+        return state
+
+    def update(self, symbol: str, interval: str, klines: List[List]) -> Dict[str, Any]:
+        """Apply candles newer than the stored state; the last kline is treated as still open"""
+        if not klines:
+            return {}
+
+        key = (symbol, interval)
+        candles = [(int(k[0]), float(k[4])) for k in klines]
+        closed, current = candles[:-1], candles[-1]
+
+        state = self.series.get(key)
+        start = None
+        if state is not None and state.last_open_time is not None:
+            # Locate the last committed candle; history must match or the series is rebuilt
+            for index in range(len(closed) - 1, -1, -1):
+                if closed[index][0] == state.last_open_time:
+                    if closed[index][1] == state.last_close:
+                        start = index + 1
+                    break
+                if closed[index][0] < state.last_open_time:
+                    break
+
+        if start is None:
+            state = self._reseed(key, closed)
+        else:
+            for open_time, close in closed[start:]:
+                state.push(open_time, close)
+            self.stats['incremental_updates'] += 1
+            self.stats['candles_applied'] += len(closed) - start
+
+        latest = state.provisional(current[1])
+        history = list(state.ema_history)[-(len(closed)):] if closed else []
+        ema_series = [None] * (len(closed) - len(history)) + history + [latest['ema20']]
+
+        return {
+            'ema20': latest['ema20'],
+            'ema20_series': ema_series,  # Aligned with klines (None where history is trimmed)
+            'sma200': latest['sma200'],
+            'rsi': latest['rsi']
+        }
@@ -0,0 +1,186 @@
+import asyncio
+import json
+import time
+import aiohttp
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from config import (BINANCE_WS_BASE, TIMEFRAMES, KLINE_STREAM_MAX_STREAMS, KLINE_STREAM_RECONNECT_MIN,
+                    KLINE_STREAM_RECONNECT_MAX, KLINE_STREAM_EVAL_DELAY, KLINE_STREAM_BACKFILL_LIMIT)
+from http_client import http_client as shared_http_client
+from candle_store import candle_store as shared_candle_store
+
+INTERVAL_MS = {
+    '1m': 60_000, '5m': 300_000, '15m': 900_000, '30m': 1_800_000,
+    '1h': 3_600_000, '4h': 14_400_000, '1d': 86_400_000
+}
+LIVE_CANDLE_FLUSH = 30  # Seconds between writes of the still-open candle per series
+
+
+def stream_kline_to_row(k: Dict) -> List:
+    """Convert a kline stream payload to the 12-column REST kline layout"""
+    return [int(k['t']), float(k['o']), float(k['h']), float(k['l']), float(k['c']), float(k['v']),
+            int(k['T']), float(k['q']), int(k['n']), float(k['V']), float(k['Q']), 0]
+
+
+class KlineStream:
+    """Ingests Binance combined kline streams into the candle store"""
+
+    def __init__(self, symbols: List[str], intervals: Optional[List[str]] = None, candle_store=None,
+                 http_client=None, on_candles_closed: Optional[Callable[[List[str]], Awaitable[None]]] = None,
+                 base_url: str = BINANCE_WS_BASE, max_streams: int = KLINE_STREAM_MAX_STREAMS,
+                 eval_delay: float = KLINE_STREAM_EVAL_DELAY):
+        self.symbols = list(symbols)
+        self.intervals = intervals or TIMEFRAMES
+        self.candle_store = candle_store or shared_candle_store
+        self.http = http_client or shared_http_client
+        self.on_candles_closed = on_candles_closed  # Called with symbols whose candle just closed
+        self.base_url = base_url.rstrip('/')
+        self.max_streams = max_streams
+        self.eval_delay = eval_delay
+
+        self.running = False
+        self.tasks: List[asyncio.Task] = []
+        self.connected: Set[int] = set()
+        self.last_closed: Dict[Tuple[str, str], int] = {}  # open_time of the newest closed candle
+        self.last_write: Dict[Tuple[str, str], float] = {}
+        self.pending: Set[str] = set()
+        self.eval_task: Optional[asyncio.Task] = None
+        self.stats = {'messages': 0, 'closed_candles': 0, 'reconnects': 0, 'backfills': 0, 'gaps': 0}
+
+    def stream_names(self) -> List[str]:
+        return [f"{symbol.lower()}@kline_{interval}" for symbol in self.symbols for interval in self.intervals]
+
+    def stream_url(self, streams: List[str]) -> str:
+        return f"{self.base_url}/stream?streams={'/'.join(streams)}"
+
+    async def start(self):
+        """Open one combined-stream connection per chunk of streams"""
+        if self.running:
+            return
+        self.running = True
+        streams = self.stream_names()
+        for index in range(0, len(streams), self.max_streams):
+            chunk = streams[index:index + self.max_streams]
+            self.tasks.append(asyncio.create_task(self._run_connection(index // self.max_streams, chunk)))
+        if self.pending and self.on_candles_closed is not None:
+            # Closes interrupted by the last stop() are evaluated instead of dropped
+            self.eval_task = asyncio.create_task(self._run_evaluation())
+        print(f"📡 Kline stream started: {len(streams)} streams over {len(self.tasks)} connection(s)")
+
+    async def stop(self):
+        """Close every connection and hand the series back to REST polling"""
+        self.running = False
+        tasks = self.tasks + ([self.eval_task] if self.eval_task else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.tasks = []
+        self.eval_task = None
+        self.connected.clear()
+        self.candle_store.set_live([(s, i) for s in self.symbols for i in self.intervals], False)
+        print("✅ Kline stream stopped")
+
+    async def update_symbols(self, symbols: List[str]):
+        """Resubscribe when the scanned universe changes"""
+        if set(symbols) == set(self.symbols):
+            return
+        await self.stop()
+        self.symbols = list(symbols)
+        self.pending &= set(self.symbols)
+        await self.start()
+
+    async def _backfill(self, keys: List[Tuple[str, str]]):
+        """Catch up on candles that closed while this connection was down"""
+        for symbol, interval in keys:
+            if await self.candle_store.backfill(symbol, interval, KLINE_STREAM_BACKFILL_LIMIT):
+                self.stats['backfills'] += 1
+                last_open = await self.candle_store.get_last_open_time(symbol, interval)
+                if last_open is not None:
+                    # The newest stored candle is still open; the one before it is the last closed
+                    self.last_closed[(symbol, interval)] = last_open - INTERVAL_MS.get(interval, 0)
+
+    async def _run_connection(self, connection_id: int, streams: List[str]):
+        keys = []
+        for stream in streams:
+            symbol, interval = stream.split('@kline_')
+            keys.append((symbol.upper(), interval))
+
+        delay = KLINE_STREAM_RECONNECT_MIN
+        while self.running:
+            try:
+                async with self.http.session.ws_connect(self.stream_url(streams), heartbeat=30) as ws:
+                    delay = KLINE_STREAM_RECONNECT_MIN
+                    self.connected.add(connection_id)
+                    # Messages queue up on the socket while missed candles are fetched over REST
+                    await self._backfill(keys)
+                    self.candle_store.set_live(keys)
+
+                    async for message in ws:
+                        if message.type == aiohttp.WSMsgType.TEXT:
+                            await self._handle_message(json.loads(message.data))
+                        elif message.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                            break
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️ Kline stream connection {connection_id} error: {e}")
+            finally:
+                self.connected.discard(connection_id)
+                self.candle_store.set_live(keys, False)
+
+            if not self.running:
+                break
+            self.stats['reconnects'] += 1
+            print(f"🔌 Kline stream connection {connection_id} lost, reconnecting in {delay}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, KLINE_STREAM_RECONNECT_MAX)
+
+    async def _handle_message(self, payload: Dict):
+        data = payload.get('data', payload)
+        if data.get('e') != 'kline':
+            return
+        k = data['k']
+        symbol, interval = k['s'], k['i']
+        key = (symbol, interval)
+        self.stats['messages'] += 1
+
+        if not k['x']:
+            # Still-open candle updates arrive every ~2s - persist them only occasionally
+            if time.monotonic() - self.last_write.get(key, float('-inf')) >= LIVE_CANDLE_FLUSH:
+                if await self.candle_store.apply_stream_kline(symbol, interval, stream_kline_to_row(k)):
+                    self.last_write[key] = time.monotonic()
+            return
+
+        open_time = int(k['t'])
+        last_closed = self.last_closed.get(key)
+        if last_closed is not None and open_time - last_closed > INTERVAL_MS.get(interval, open_time):
+            # Candles were skipped (missed messages) - refill the hole over REST
+            self.stats['gaps'] += 1
+            await self.candle_store.backfill(symbol, interval, KLINE_STREAM_BACKFILL_LIMIT)
+
+        await self.candle_store.apply_stream_kline(symbol, interval, stream_kline_to_row(k))
+        self.last_write[key] = time.monotonic()
+        self.last_closed[key] = max(open_time, last_closed or open_time)
+        self.stats['closed_candles'] += 1
+        self._schedule_evaluation(symbol)
+
+    def _schedule_evaluation(self, symbol: str):
+        """Coalesce closes (4h and 1d close together at midnight) into one evaluation per symbol"""
+        if self.on_candles_closed is None:
+            return
+        self.pending.add(symbol)
+        if self.eval_task is None or self.eval_task.done():
+            self.eval_task = asyncio.create_task(self._run_evaluation())
+
+    async def _run_evaluation(self):
+        # Closes that arrive while the callback runs only land in pending - keep going until it is empty
+        while self.pending:
+            await asyncio.sleep(self.eval_delay)
+            symbols, self.pending = sorted(self.pending), set()
+            try:
+                await self.on_candles_closed(symbols)
+            except asyncio.CancelledError:
+                self.pending.update(symbols)  # Stopped mid-evaluation - start() runs them again
+                raise
+            except Exception as e:
+                print(f"❌ Breakout evaluation on candle close failed: {e}")
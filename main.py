@@ -13,27 +13,31 @@ import asyncio
 import sys
 import signal
 from simple_bot import SimpleCryptoBot
-from config import TELEGRAM_TOKEN, CHAT_ID
+from config import TELEGRAM_TOKEN, CHAT_ID, UPDATE_MODE
+from http_client import http_client
+from candle_store import candle_store
+from chart_service import chart_service
 
 
 class BotManager:
     """Manages the bot lifecycle and graceful shutdown"""
     
-    def __init__(self):
+    def __init__(self, update_mode=UPDATE_MODE):
         self.bot = None
         self.running = False
+        self.update_mode = update_mode  # 'webhook' or 'polling'
     
     def setup_signal_handlers(self):
-        """Setup signal handlers for graceful shutdown"""
-        def signal_handler(signum, frame):
+        """Stop the bot on SIGINT/SIGTERM so start_bot's cleanup flushes buffered writes before exit"""
+        def signal_handler(signum):
             print(f"\n🛑 Received signal {signum}. Shutting down gracefully...")
             self.running = False
             if self.bot:
                 self.bot.stop_monitoring()
-            sys.exit(0)
         
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, signal_handler, signum)
     
     async def start_bot(self):
         """Initialize and start the bot"""
@@ -48,16 +52,21 @@ class BotManager:
             # Initialize bot
             self.bot = SimpleCryptoBot(TELEGRAM_TOKEN, CHAT_ID)
             self.running = True
+            self.setup_signal_handlers()
             
             print("=" * 60)
             print("🚀 CRYPTO EMA20 BREAKOUT BOT")
             print("=" * 60)
             print(f"📱 Chat ID: {CHAT_ID}")
             print(f"🔑 Token: {TELEGRAM_TOKEN[:10]}...")
+            print(f"📥 Updates: {self.update_mode}")
             print("=" * 60)
             
-            # Start the bot
-            await self.bot.run()
+            # Start monitoring and update intake together
+            await asyncio.gather(
+                self.bot.run(),
+                self.bot.receive_updates(self.update_mode)
+            )
             
         except KeyboardInterrupt:
             print("\n🛑 Bot stopped by user")
@@ -67,13 +76,26 @@ class BotManager:
         finally:
             if self.bot:
                 self.bot.stop_monitoring()
+                await self.bot.expiry_scheduler.stop()
+                await self.bot.user_db.close()  # Flush buffered user activity
+            await chart_service.stop()
+            await candle_store.close()
+            await http_client.close()
             print("👋 Bot shutdown complete")
 
 
+def parse_update_mode(argv):
+    """Pick the update intake mode from --webhook / --polling, defaulting to UPDATE_MODE"""
+    if '--webhook' in argv:
+        return 'webhook'
+    if '--polling' in argv:
+        return 'polling'
+    return UPDATE_MODE
+
+
 def main():
     """Main entry point"""
-    manager = BotManager()
-    manager.setup_signal_handlers()
+    manager = BotManager(parse_update_mode(sys.argv[1:]))
     
     try:
         # Run the bot
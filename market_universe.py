@@ -0,0 +1,103 @@
+import time
+from typing import Any, Dict, List, Optional
+
+from config import (BINANCE_EXCHANGE_INFO_ENDPOINT, BINANCE_TICKER_24H_ENDPOINT,
+                    UNIVERSE_EXCHANGE_INFO_TTL, UNIVERSE_TICKER_TTL, UNIVERSE_MIN_QUOTE_VOLUME,
+                    UNIVERSE_MAX_SYMBOLS, UNIVERSE_EXCLUDED_BASES)
+from http_client import http_client as shared_http_client
+from rate_limiter import provider_rate_limiter
+
+
+class BinanceUniverse:
+    """All tradable Binance USDT spot pairs, cached and filtered by 24h liquidity"""
+
+    def __init__(self, http_client=None, rate_limiter=None,
+                 exchange_info_ttl: float = UNIVERSE_EXCHANGE_INFO_TTL,
+                 ticker_ttl: float = UNIVERSE_TICKER_TTL,
+                 min_quote_volume: float = UNIVERSE_MIN_QUOTE_VOLUME,
+                 max_symbols: int = UNIVERSE_MAX_SYMBOLS):
+        self.http = http_client or shared_http_client
+        self.rate_limiter = rate_limiter or provider_rate_limiter
+        self.exchange_info_ttl = exchange_info_ttl
+        self.ticker_ttl = ticker_ttl
+        self.min_quote_volume = min_quote_volume
+        self.max_symbols = max_symbols
+
+        self.markets: Dict[str, Dict[str, Any]] = {}  # symbol -> exchangeInfo metadata
+        self.markets_updated = 0.0
+        self.quote_volumes: Dict[str, float] = {}
+        self.tickers_updated = 0.0
+        self.last_symbols: List[str] = []
+
+    async def _get_json(self, url: str) -> Optional[Any]:
+        if not await self.rate_limiter.acquire('binance'):
+            return None
+        try:
+            async with self.http.session.get(url) as response:
+                if response.status != 200:
+                    print(f"⚠️ Binance {url.rsplit('/', 1)[-1]} returned {response.status}")
+                    return None
+                return await response.json()
+        except Exception as e:
+            print(f"⚠️ Binance {url.rsplit('/', 1)[-1]} error: {e}")
+            return None
+
+    def _is_scannable(self, market: Dict[str, Any]) -> bool:
+        if market.get('quoteAsset') != 'USDT' or market.get('status') != 'TRADING':
+            return False
+        if not market.get('isSpotTradingAllowed', 'SPOT' in (market.get('permissions') or [])):
+            return False
+        return market.get('baseAsset') not in UNIVERSE_EXCLUDED_BASES
+
+    async def refresh_markets(self, force: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Reload exchangeInfo once the cached copy is older than its TTL"""
+        if not force and self.markets and time.monotonic() - self.markets_updated < self.exchange_info_ttl:
+            return self.markets
+
+        data = await self._get_json(BINANCE_EXCHANGE_INFO_ENDPOINT)
+        if data and 'symbols' in data:
+            self.markets = {m['symbol']: m for m in data['symbols'] if self._is_scannable(m)}
+            self.markets_updated = time.monotonic()
+            print(f"✅ Cached exchange metadata for {len(self.markets)} USDT spot pairs")
+        elif self.markets:
+            print("⚠️ Using stale exchange metadata")
+        return self.markets
+
+    async def refresh_liquidity(self, force: bool = False) -> Dict[str, float]:
+        """Pull 24h quote volume for every symbol in a single batched ticker request"""
+        if not force and self.quote_volumes and time.monotonic() - self.tickers_updated < self.ticker_ttl:
+            return self.quote_volumes
+
+        data = await self._get_json(BINANCE_TICKER_24H_ENDPOINT)
+        if isinstance(data, list):
+            volumes = {}
+            for ticker in data:
+                try:
+                    volumes[ticker['symbol']] = float(ticker.get('quoteVolume', 0))
+                except (KeyError, TypeError, ValueError):
+                    continue
+            self.quote_volumes = volumes
+            self.tickers_updated = time.monotonic()
+        return self.quote_volumes
+
+    async def get_symbols(self) -> List[str]:
+        """Liquid USDT pairs ordered by 24h quote volume, capped at max_symbols"""
+        markets = await self.refresh_markets()
+        if not markets:
+            return self.last_symbols
+
+        volumes = await self.refresh_liquidity()
+        if volumes:
+            liquid = [s for s in markets if volumes.get(s, 0.0) >= self.min_quote_volume]
+            liquid.sort(key=lambda s: volumes[s], reverse=True)
+        else:
+            liquid = sorted(markets)  # No liquidity data - scan the listing as-is
+
+        self.last_symbols = liquid[:self.max_symbols]
+        print(f"🌐 Universe: {len(self.last_symbols)} of {len(markets)} USDT pairs pass the "
+              f"${self.min_quote_volume:,.0f} liquidity filter")
+        return self.last_symbols
+
+
+# Global instance
+binance_universe = BinanceUniverse()
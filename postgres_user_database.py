@@ -0,0 +1,352 @@
+import json
+from datetime import date, datetime
+from typing import List, Dict, Any, Optional, Tuple
+
+from config import DATABASE_URL, POSTGRES_POOL_MIN, POSTGRES_POOL_MAX
+from user_storage import UserStorage, current_week
+
+SCHEMA_LOCK_ID = 7_301_442  # pg_advisory_xact_lock key so concurrent bot processes create the schema once
+
+UTC_NOW = "(now() AT TIME ZONE 'utc')"
+
+
+def parse_timestamp(value: str) -> datetime:
+    """Buffered 'YYYY-MM-DD HH:MM:SS' UTC string -> naive UTC datetime for TIMESTAMP columns"""
+    return datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
+
+
+def format_timestamp(value: Optional[datetime]) -> Optional[str]:
+    """Same string layout the SQLite store returns"""
+    return value.strftime('%Y-%m-%d %H:%M:%S') if value else None
+
+
+class PostgresUserDatabase(UserStorage):
+    """Postgres user store - a shared asyncpg pool so several bot processes can use one database"""
+
+    backend_name = 'postgres'
+
+    def __init__(self, dsn: str = DATABASE_URL, min_size: int = POSTGRES_POOL_MIN,
+                 max_size: int = POSTGRES_POOL_MAX, **kwargs):
+        super().__init__(**kwargs)
+        self.dsn = dsn
+        self.min_size = min_size
+        self.max_size = max_size
+
+    async def init_database(self):
+        """Open the connection pool and create tables"""
+        if not self.dsn:
+            print("❌ Database initialization failed: DATABASE_URL is not set")
+            return False
+        try:
+            import asyncpg
+            self.db = await asyncpg.create_pool(self.dsn, min_size=self.min_size, max_size=self.max_size)
+            await self.create_tables()
+            rows = await self.db.fetch('SELECT user_id FROM users')
+            self.known_users = {row['user_id'] for row in rows}
+            self.start_flush_loop()
+            print(f"✅ Postgres database initialized successfully (pool {self.min_size}-{self.max_size})")
+            return True
+        except Exception as e:
+            print(f"❌ Database initialization failed: {e}")
+            if self.db:
+                await self.db.close()
+                self.db = None
+            return False
+
+    async def create_tables(self):
+        """Create tables and indexes; timestamps are stored as naive UTC"""
+        async with self.db.acquire() as connection:
+            async with connection.transaction():
+                await connection.execute('SELECT pg_advisory_xact_lock($1)', SCHEMA_LOCK_ID)
+                await connection.execute(f'''
+                    CREATE TABLE IF NOT EXISTS users (
+                        user_id TEXT PRIMARY KEY,
+                        username TEXT,
+                        first_name TEXT,
+                        last_name TEXT,
+                        language_code TEXT,
+                        selected_language TEXT DEFAULT 'en',
+                        user_type TEXT DEFAULT 'free',
+                        first_interaction_date TIMESTAMP DEFAULT {UTC_NOW},
+                        last_activity_date TIMESTAMP DEFAULT {UTC_NOW},
+                        total_commands INTEGER DEFAULT 0,
+                        total_signals_received INTEGER DEFAULT 0,
+                        subscription_start_date TIMESTAMP,
+                        subscription_end_date TIMESTAMP,
+                        is_active INTEGER DEFAULT 1,
+                        weekly_activity_count INTEGER DEFAULT 1,
+                        created_at TIMESTAMP DEFAULT {UTC_NOW},
+                        updated_at TIMESTAMP DEFAULT {UTC_NOW},
+                        total_activities INTEGER DEFAULT 0
+                    )
+                ''')
+
+                # No foreign keys: signal receipts may be logged before a buffered user row is flushed
+                await connection.execute(f'''
+                    CREATE TABLE IF NOT EXISTS user_activity (
+                        id BIGSERIAL PRIMARY KEY,
+                        user_id TEXT,
+                        activity_type TEXT,
+                        activity_data TEXT,
+                        timestamp TIMESTAMP DEFAULT {UTC_NOW}
+                    )
+                ''')
+
+                await connection.execute(f'''
+                    CREATE TABLE IF NOT EXISTS weekly_usage (
+                        id BIGSERIAL PRIMARY KEY,
+                        user_id TEXT,
+                        week_start_date DATE,
+                        week_end_date DATE,
+                        activity_count INTEGER DEFAULT 0,
+                        commands_used TEXT DEFAULT '[]',
+                        last_activity TIMESTAMP,
+                        created_at TIMESTAMP DEFAULT {UTC_NOW},
+                        UNIQUE(user_id, week_start_date)
+                    )
+                ''')
+
+                await connection.execute(f'''
+                    CREATE TABLE IF NOT EXISTS signal_history (
+                        id BIGSERIAL PRIMARY KEY,
+                        symbol TEXT,
+                        signal_data TEXT,
+                        sent_to_users INTEGER DEFAULT 0,
+                        timestamp TIMESTAMP DEFAULT {UTC_NOW}
+                    )
+                ''')
+
+                # Durable bot state (subscriptions, languages, cooldowns) as (kind, key) -> value
+                await connection.execute(f'''
+                    CREATE TABLE IF NOT EXISTS bot_state (
+                        kind TEXT,
+                        key TEXT,
+                        value TEXT,
+                        updated_at TIMESTAMP DEFAULT {UTC_NOW},
+                        PRIMARY KEY (kind, key)
+                    )
+                ''')
+
+                await connection.execute('CREATE INDEX IF NOT EXISTS idx_user_activity_user_id ON user_activity(user_id)')
+                await connection.execute('CREATE INDEX IF NOT EXISTS idx_weekly_usage_week_start ON weekly_usage(week_start_date)')
+                await connection.execute('CREATE INDEX IF NOT EXISTS idx_users_last_activity ON users(last_activity_date)')
+                await connection.execute('CREATE INDEX IF NOT EXISTS idx_users_user_type ON users(user_type)')
+        print("✅ Postgres database tables created successfully")
+
+    async def _write_batch(self, profiles, weekly, activity, state):
+        """Upsert profiles, weekly counts and bot state and COPY activity rows in a single transaction"""
+        async with self.db.acquire() as connection:
+            async with connection.transaction():
+                await connection.executemany('''
+                    INSERT INTO users (
+                        user_id, username, first_name, last_name, language_code, user_type,
+                        weekly_activity_count, total_commands, last_activity_date, updated_at, total_activities
+                    ) VALUES ($1, $2, $3, $4, $5, 'free', 1, $6, $7, $7,
+                              (SELECT COUNT(*) FROM user_activity WHERE user_id = $1))
+                    ON CONFLICT (user_id) DO UPDATE SET
+                        username = excluded.username,
+                        first_name = excluded.first_name,
+                        last_name = excluded.last_name,
+                        language_code = excluded.language_code,
+                        last_activity_date = excluded.last_activity_date,
+                        total_commands = users.total_commands + excluded.total_commands,
+                        updated_at = excluded.updated_at
+                ''', [
+                    (user_id, p['username'], p['first_name'], p['last_name'], p['language_code'],
+                     p['commands'], parse_timestamp(p['last_activity']))
+                    for user_id, p in profiles.items()
+                ])
+
+                await connection.executemany('''
+                    INSERT INTO weekly_usage (user_id, week_start_date, week_end_date, activity_count, last_activity)
+                    VALUES ($1, $2, $3, $4, $5)
+                    ON CONFLICT (user_id, week_start_date) DO UPDATE SET
+                        activity_count = weekly_usage.activity_count + excluded.activity_count,
+                        last_activity = excluded.last_activity
+                ''', [
+                    (user_id, date.fromisoformat(week_start), date.fromisoformat(w['week_end']), w['count'],
+                     parse_timestamp(w['last_activity']))
+                    for (user_id, week_start), w in weekly.items()
+                ])
+
+                if activity:
+                    await connection.copy_records_to_table(
+                        'user_activity',
+                        records=[(user_id, activity_type, data, parse_timestamp(timestamp))
+                                 for user_id, activity_type, data, timestamp in activity],
+                        columns=['user_id', 'activity_type', 'activity_data', 'timestamp']
+                    )
+
+                activity_counts: Dict[str, int] = {}
+                for row in activity:
+                    activity_counts[row[0]] = activity_counts.get(row[0], 0) + 1
+                await connection.execute('''
+                    UPDATE users SET total_activities = users.total_activities + c.count
+                    FROM unnest($1::text[], $2::int[]) AS c(user_id, count)
+                    WHERE users.user_id = c.user_id
+                ''', list(activity_counts), list(activity_counts.values()))
+
+                await connection.executemany(f'''
+                    INSERT INTO bot_state (kind, key, value, updated_at) VALUES ($1, $2, $3, {UTC_NOW})
+                    ON CONFLICT (kind, key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at
+                ''', [(kind, key, value) for (kind, key), value in state.items() if value is not None])
+                await connection.executemany('DELETE FROM bot_state WHERE kind = $1 AND key = $2',
+                                             [key for key, value in state.items() if value is None])
+
+    async def load_state(self) -> List[Tuple[str, str, str]]:
+        """Every persisted (kind, key, value) bot state row, in one query"""
+        rows = await self.db.fetch('SELECT kind, key, value FROM bot_state')
+        return [tuple(row) for row in rows]
+
+    async def get_all_users_with_profiles(self) -> List[Dict[str, Any]]:
+        """Get all users with their complete profiles and activity stats"""
+        if not self.db:
+            return []
+
+        try:
+            await self.flush()  # Include buffered activity
+
+            week_start, _ = current_week()
+            rows = await self.db.fetch('''
+                SELECT
+                    u.user_id, u.username, u.first_name, u.last_name, u.language_code,
+                    u.selected_language, u.user_type, u.first_interaction_date,
+                    u.last_activity_date, u.total_commands, u.total_signals_received,
+                    COALESCE(w.activity_count, 0) AS current_week_activity,
+                    u.total_activities
+                FROM users u
+                LEFT JOIN weekly_usage w ON u.user_id = w.user_id
+                    AND w.week_start_date = $1
+                ORDER BY u.last_activity_date DESC
+            ''', date.fromisoformat(week_start))
+
+            return [{
+                'user_id': row['user_id'],
+                'username': row['username'],
+                'first_name': row['first_name'],
+                'last_name': row['last_name'],
+                'language_code': row['language_code'],
+                'selected_language': row['selected_language'],
+                'user_type': row['user_type'],
+                'first_interaction_date': format_timestamp(row['first_interaction_date']),
+                'last_activity_date': format_timestamp(row['last_activity_date']),
+                'total_commands': row['total_commands'],
+                'total_signals_received': row['total_signals_received'],
+                'current_week_activity': row['current_week_activity'],
+                'total_activities': row['total_activities']
+            } for row in rows]
+
+        except Exception as e:
+            print(f"❌ Error fetching user profiles: {e}")
+            return []
+
+    async def get_weekly_active_users(self) -> int:
+        """Get count of users active in current week"""
+        if not self.db:
+            return 0
+
+        try:
+            week_start, _ = current_week()
+            return await self.db.fetchval('''
+                SELECT COUNT(DISTINCT user_id) FROM weekly_usage WHERE week_start_date = $1
+            ''', date.fromisoformat(week_start))
+        except Exception as e:
+            print(f"❌ Error getting weekly active users: {e}")
+            return 0
+
+    async def get_user_stats(self) -> Dict[str, Any]:
+        """Get comprehensive user statistics, aggregated by the server in one round trip"""
+        if not self.db:
+            return {}
+
+        try:
+            await self.flush()  # Include buffered activity
+
+            week_start, _ = current_week()
+            row = await self.db.fetchrow(f'''
+                SELECT
+                    COUNT(*) AS total_users,
+                    COUNT(*) FILTER (WHERE last_activity_date > {UTC_NOW} - interval '24 hours') AS daily_active,
+                    COUNT(*) FILTER (WHERE user_type = 'free') AS free_users,
+                    COUNT(*) FILTER (WHERE user_type = 'premium') AS premium_users,
+                    (SELECT COUNT(DISTINCT user_id) FROM weekly_usage WHERE week_start_date = $1) AS weekly_active,
+                    (SELECT COALESCE(json_agg(top), '[]')::text FROM (
+                        SELECT u.first_name, u.username, w.activity_count
+                        FROM users u
+                        JOIN weekly_usage w ON u.user_id = w.user_id
+                        WHERE w.week_start_date = $1
+                        ORDER BY w.activity_count DESC
+                        LIMIT 5
+                    ) top) AS top_users
+                FROM users
+            ''', date.fromisoformat(week_start))
+
+            return {
+                'total_users_ever': row['total_users'],
+                'weekly_active_users': row['weekly_active'],
+                'daily_active_users': row['daily_active'],
+                'free_users': row['free_users'],
+                'premium_users': row['premium_users'],
+                'top_weekly_users': json.loads(row['top_users'])
+            }
+
+        except Exception as e:
+            print(f"❌ Error getting user stats: {e}")
+            return {}
+
+    async def log_signal_sent(self, symbol: str, signal_data: str, user_count: int):
+        """Log when a signal is sent"""
+        if not self.db:
+            return
+
+        try:
+            await self.db.execute('''
+                INSERT INTO signal_history (symbol, signal_data, sent_to_users) VALUES ($1, $2, $3)
+            ''', symbol, json.dumps({'message': signal_data[:500]}), user_count)
+        except Exception as e:
+            print(f"❌ Error logging signal: {e}")
+
+    async def update_user_signals_received(self, user_ids: List[str]):
+        """Update signal count for users who received a signal (set-based, one transaction)"""
+        if not self.db or not user_ids:
+            return
+
+        week_start, week_end = current_week()
+        recipients = list(dict.fromkeys(str(user_id) for user_id in user_ids))
+        activity_data = json.dumps({'timestamp': datetime.now().isoformat()})
+
+        async with self.flush_lock:
+            # Users still only in the buffer have no row for the UPDATE yet - write them first
+            if any(user_id in self.pending_profiles for user_id in recipients):
+                await self._flush_locked()
+
+            try:
+                async with self.db.acquire() as connection:
+                    async with connection.transaction():
+                        await connection.execute(f'''
+                            UPDATE users SET
+                                total_signals_received = total_signals_received + 1,
+                                total_activities = total_activities + 1,
+                                last_activity_date = {UTC_NOW}
+                            WHERE user_id = ANY($1::text[])
+                        ''', recipients)
+
+                        # Weekly activity for signal reception
+                        await connection.execute(f'''
+                            INSERT INTO weekly_usage (user_id, week_start_date, week_end_date, activity_count, last_activity)
+                            SELECT user_id, $2, $3, 1, {UTC_NOW} FROM unnest($1::text[]) AS r(user_id)
+                            ON CONFLICT (user_id, week_start_date) DO UPDATE SET
+                                activity_count = weekly_usage.activity_count + 1,
+                                last_activity = excluded.last_activity
+                        ''', recipients, date.fromisoformat(week_start), date.fromisoformat(week_end))
+
+                        await connection.execute('''
+                            INSERT INTO user_activity (user_id, activity_type, activity_data)
+                            SELECT user_id, 'signal_received', $2 FROM unnest($1::text[]) AS r(user_id)
+                        ''', recipients, activity_data)
+
+            except Exception as e:
+                print(f"❌ Error updating user signal counts: {e}")
+
+    async def _close_backend(self):
+        await self.db.close()
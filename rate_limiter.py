@@ -0,0 +1,133 @@
+import asyncio
+import json
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from config import PROVIDER_RATE_LIMITS
+
+
+class TokenBucket:
+    """Token bucket with burst capacity and optional monthly quota"""
+
+    def __init__(self, requests_per_minute: float, burst: int = 1,
+                 monthly_quota: Optional[int] = None):
+        self.rate = requests_per_minute / 60.0  # Tokens added per second
+        self.capacity = max(1, burst)
+        self.monthly_quota = monthly_quota
+        self.tokens = float(self.capacity)
+        self.last_refill = time.monotonic()
+        self.lock = asyncio.Lock()  # Waiters are served in arrival order
+
+        self.month = datetime.now().strftime('%Y-%m')
+        self.month_used = 0
+        self.total_acquired = 0
+        self.total_wait_time = 0.0
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    def _roll_month(self):
+        current_month = datetime.now().strftime('%Y-%m')
+        if current_month != self.month:
+            self.month = current_month
+            self.month_used = 0
+
+    def quota_remaining(self) -> Optional[int]:
+        """Requests left this calendar month, None when unlimited"""
+        if self.monthly_quota is None:
+            return None
+        self._roll_month()
+        return max(0, self.monthly_quota - self.month_used)
+
+    async def acquire(self, tokens: int = 1) -> bool:
+        """Wait until tokens are available; False if the monthly quota is exhausted"""
+        async with self.lock:
+            remaining = self.quota_remaining()
+            if remaining is not None and remaining < tokens:
+                return False
+
+            started = time.monotonic()
+            while True:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    break
+                await asyncio.sleep((tokens - self.tokens) / self.rate)
+
+            self.month_used += tokens
+            self.total_acquired += tokens
+            self.total_wait_time += time.monotonic() - started
+            return True
+
+
+class ProviderRateLimiter:
+    """Shares per-provider request budgets between concurrent tasks"""
+
+    def __init__(self, limits: Optional[Dict[str, Dict[str, Any]]] = None):
+        limits = limits if limits is not None else PROVIDER_RATE_LIMITS
+        self.buckets = {provider: TokenBucket(**config) for provider, config in limits.items()}
+        self.storage = None  # User store that monthly quota usage is persisted to, once attached
+
+    async def load_usage(self, storage) -> bool:
+        """Resume this month's quota usage from the store and persist every later request to it"""
+        if self.storage is not None:
+            self.storage = storage  # Already resumed in this process; the in-memory counts are current
+            return True
+        try:
+            rows = await storage.load_state()
+        except Exception as e:
+            print(f"❌ Error loading provider quota usage: {e}")
+            return False
+
+        self.storage = storage
+        for kind, provider, value in rows:
+            bucket = self.buckets.get(provider)
+            if kind != 'quota' or bucket is None:
+                continue
+            saved = json.loads(value)
+            bucket._roll_month()
+            if saved.get('month') == bucket.month:
+                # Requests made before the store was attached are added on top
+                bucket.month_used += int(saved.get('used', 0))
+                print(f"📊 {provider} quota: {bucket.month_used}/{bucket.monthly_quota} used this month")
+        return True
+
+    async def acquire(self, provider: str, tokens: int = 1, max_wait: Optional[float] = None) -> bool:
+        """Take tokens from a provider's bucket; False if the quota is spent or max_wait passes first"""
+        bucket = self.buckets.get(provider)
+        if bucket is None:
+            return True
+
+        if max_wait is None:
+            granted = await bucket.acquire(tokens)
+        else:
+            try:
+                granted = await asyncio.wait_for(bucket.acquire(tokens), timeout=max_wait)
+            except asyncio.TimeoutError:
+                return False  # Still throttled - the caller moves on instead of queueing behind the bucket
+        if not granted:
+            print(f"🚫 {provider} monthly quota exhausted ({bucket.monthly_quota} requests)")
+        elif bucket.monthly_quota is not None and self.storage is not None:
+            # Buffered like other bot state, so restarts and crashes do not reset the count
+            self.storage.set_state('quota', provider, json.dumps({'month': bucket.month, 'used': bucket.month_used}))
+        return granted
+
+    def get_usage(self) -> Dict[str, Dict[str, Any]]:
+        """Snapshot of request counts and remaining quota per provider"""
+        usage = {}
+        for provider, bucket in self.buckets.items():
+            usage[provider] = {
+                'month_used': bucket.month_used,
+                'monthly_quota': bucket.monthly_quota,
+                'quota_remaining': bucket.quota_remaining(),
+                'total_acquired': bucket.total_acquired,
+                'total_wait_time': bucket.total_wait_time
+            }
+        return usage
+
+
+# Global instance
+provider_rate_limiter = ProviderRateLimiter()
@@ -59,10 +59,12 @@ def main():
     try:
         print("📦 Importing bot modules...")
         from simple_bot import main as bot_main
+        from main import parse_update_mode
         import asyncio
         
-        print("🤖 Starting bot monitoring...")
-        asyncio.run(bot_main())
+        update_mode = parse_update_mode(sys.argv[1:])
+        print(f"🤖 Starting bot monitoring ({update_mode} updates)...")
+        asyncio.run(bot_main(update_mode))
         
     except ImportError as e:
         print(f"❌ Import error: {e}")
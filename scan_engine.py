@@ -0,0 +1,57 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+from config import SCAN_MAX_CONCURRENCY, SCAN_SYMBOL_TIMEOUT
+
+
+class ScanEngine:
+    """Fans symbol analysis out concurrently with bounded parallelism"""
+
+    def __init__(self, max_concurrency: int = SCAN_MAX_CONCURRENCY,
+                 symbol_timeout: float = SCAN_SYMBOL_TIMEOUT):
+        self.max_concurrency = max_concurrency
+        self.symbol_timeout = symbol_timeout
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+
+        self.last_cycle_time = 0.0
+        self.last_cycle_stats: Dict[str, Any] = {}
+
+    async def scan_symbol(self, symbol: str, analyze: Callable[[str], Awaitable[Any]]):
+        """Run analysis for one symbol under the concurrency limit and timeout"""
+        async with self.semaphore:
+            try:
+                result = await asyncio.wait_for(analyze(symbol), timeout=self.symbol_timeout)
+                return symbol, result, 'ok'
+            except asyncio.TimeoutError:
+                print(f"⏱️ {symbol} analysis timed out after {self.symbol_timeout}s")
+                return symbol, None, 'timeout'
+            except Exception as e:
+                print(f"Error checking {symbol}: {e}")
+                return symbol, None, 'error'
+
+    async def run_cycle(self, symbols: List[str],
+                        analyze: Callable[[str], Awaitable[Any]]) -> Dict[str, Any]:
+        """Analyze every symbol concurrently and return results keyed by symbol"""
+        start = time.perf_counter()
+
+        outcomes = await asyncio.gather(*(self.scan_symbol(symbol, analyze) for symbol in symbols))
+
+        elapsed = time.perf_counter() - start
+        results = {symbol: result for symbol, result, _ in outcomes}
+        statuses = [status for _, _, status in outcomes]
+
+        self.last_cycle_time = elapsed
+        self.last_cycle_stats = {
+            'symbols': len(symbols),
+            'completed': statuses.count('ok'),
+            'timeouts': statuses.count('timeout'),
+            'errors': statuses.count('error'),
+            'wall_time': elapsed
+        }
+
+        print(f"⚡ Scanned {len(symbols)} symbols in {elapsed:.2f}s "
+              f"({statuses.count('ok')} ok, {statuses.count('timeout')} timed out, "
+              f"{statuses.count('error')} failed, concurrency {self.max_concurrency})")
+
+        return results
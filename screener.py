@@ -0,0 +1,100 @@
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence
+
+from config import (SCREENER_LOOKBACK, SCREENER_VOLUME_MIN, SCREENER_VOLUME_MAX,
+                    SCREENER_MIN_BODY_RATIO, SCREENER_EMA_RISING_PERIODS)
+
+CRITERIA = ['close_above_ema', 'ema_rising', 'resistance_breakout',
+            'volume_surge', 'close_above_resistance', 'momentum_candle']
+
+
+def stack_tail(series_by_symbol: Sequence[Optional[Sequence]], width: int) -> np.ndarray:
+    """Right-align the last `width` values of each series into a symbols x time array (NaN padded)"""
+    stacked = np.full((len(series_by_symbol), width), np.nan)
+    for row, values in enumerate(series_by_symbol):
+        if not values:
+            continue
+        tail = [np.nan if v is None else float(v) for v in values[-width:]]
+        stacked[row, width - len(tail):] = tail
+    return stacked
+
+
+class CrossSectionalScreener:
+    """Evaluates the breakout criteria for every symbol at once on stacked NumPy arrays"""
+
+    def __init__(self, lookback: int = SCREENER_LOOKBACK, volume_min: float = SCREENER_VOLUME_MIN,
+                 volume_max: float = SCREENER_VOLUME_MAX, min_body_ratio: float = SCREENER_MIN_BODY_RATIO,
+                 ema_rising_periods: int = SCREENER_EMA_RISING_PERIODS):
+        self.lookback = lookback
+        self.volume_min = volume_min
+        self.volume_max = volume_max
+        self.min_body_ratio = min_body_ratio
+        self.ema_rising_periods = ema_rising_periods
+
+    def stack(self, klines: List[List[List]], ema: List[Sequence]) -> Dict[str, np.ndarray]:
+        """Build symbols x time OHLCV and EMA arrays holding only the candles the criteria need"""
+        width = self.lookback + 1
+        arrays = {}
+        for name, column in (('open', 1), ('high', 2), ('low', 3), ('close', 4), ('volume', 5)):
+            arrays[name] = stack_tail([[k[column] for k in rows[-width:]] if rows else None
+                                       for rows in klines], width)
+        arrays['ema20'] = stack_tail(ema, self.ema_rising_periods + 1)
+        return arrays
+
+    def evaluate(self, arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Boolean vector per criterion; NaN (missing history) always evaluates to False"""
+        open_, high, low = arrays['open'], arrays['high'], arrays['low']
+        close, volume, ema = arrays['close'], arrays['volume'], arrays['ema20']
+        current_close, current_high = close[:, -1], high[:, -1]
+        full_history = ~np.isnan(close).any(axis=1)  # Needs lookback + 1 candles, like the scalar checks
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            # Resistance is the highest high of the lookback window, current candle excluded
+            resistance = np.max(high[:, :-1], axis=1)
+            avg_volume = np.mean(volume[:, :-1], axis=1)
+            volume_ratio = volume[:, -1] / avg_volume
+            body_range = high[:, -1] - low[:, -1]
+            body_ratio = np.abs(close[:, -1] - open_[:, -1]) / body_range
+
+            criteria = {
+                'close_above_ema': current_close > ema[:, -1],
+                'ema_rising': np.all(np.diff(ema, axis=1) > 0, axis=1),
+                'resistance_breakout': full_history & (current_high > resistance) & (current_close > resistance),
+                'volume_surge': full_history & (volume_ratio >= self.volume_min) & (volume_ratio <= self.volume_max),
+                'close_above_resistance': full_history & (current_close > resistance),
+                'momentum_candle': (body_range != 0) & (body_ratio >= self.min_body_ratio)
+            }
+        return criteria
+
+    def screen(self, timeframes: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Screen all symbols on every timeframe.
+
+        `timeframes` maps interval -> {'klines': {symbol: klines}, 'ema20': {symbol: ema series}}.
+        Only symbols present on every timeframe are screened.
+        """
+        names = list(timeframes)
+        symbols = [s for s in timeframes[names[0]]['klines']
+                   if all(timeframes[n]['klines'].get(s) for n in names)] if names else []
+
+        results = {}
+        for name in names:
+            frame = timeframes[name]
+            arrays = self.stack([frame['klines'][s] for s in symbols],
+                                [frame['ema20'].get(s) for s in symbols])
+            criteria = self.evaluate(arrays)
+            mask = np.logical_and.reduce([criteria[c] for c in CRITERIA]) if symbols else np.zeros(0, bool)
+            results[name] = {'mask': mask, 'criteria': criteria}
+
+        masks = [results[n]['mask'] for n in names]
+        any_mask = np.logical_or.reduce(masks) if masks and symbols else np.zeros(len(symbols), bool)
+        all_mask = np.logical_and.reduce(masks) if masks and symbols else np.zeros(len(symbols), bool)
+        return {'symbols': symbols, 'mask': any_mask, 'all_timeframes': all_mask, 'timeframes': results}
+
+    def breakdown(self, report: Dict[str, Any], symbol: str) -> Dict[str, Dict[str, bool]]:
+        """Per-timeframe criterion results for one symbol of a screen() report"""
+        index = report['symbols'].index(symbol)
+        breakdown = {}
+        for name, result in report['timeframes'].items():
+            breakdown[name] = {c: bool(result['criteria'][c][index]) for c in CRITERIA}
+            breakdown[name]['signal'] = bool(result['mask'][index])
+        return breakdown
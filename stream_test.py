@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Kline Stream Test Script
+Runs the WebSocket ingestion against a local fake Binance server (no network needed)
+"""
+
+import asyncio
+import os
+import tempfile
+from aiohttp import web
+
+import candle_store as candle_store_module
+from candle_store import CandleStore
+from http_client import HTTPClient
+from kline_stream import KlineStream, INTERVAL_MS
+from rate_limiter import ProviderRateLimiter
+
+HOST = '127.0.0.1'
+SYMBOLS = ['BTCUSDT', 'ETHUSDT']
+INTERVAL = '4h'
+STEP = INTERVAL_MS[INTERVAL]
+START = 1_700_000_000_000 - (1_700_000_000_000 % STEP) - 300 * STEP
+
+
+class FakeBinance:
+    """Serves /klines over REST and pushes kline events over /stream"""
+
+    def __init__(self):
+        self.closed = {symbol: START + 249 * STEP for symbol in SYMBOLS}  # Newest closed candle
+        self.connections = 0
+        self.rest_requests = 0
+
+    def candle(self, symbol, open_time):
+        price = 100 + (open_time - START) / STEP
+        return [open_time, price, price + 2, price - 1, price + 1, 10.0, open_time + STEP - 1,
+                1000.0, 5, 5.0, 500.0, "0"]
+
+    async def klines(self, request):
+        self.rest_requests += 1
+        symbol, limit = request.query['symbol'], int(request.query['limit'])
+        newest = self.closed[symbol] + STEP  # Still-open candle
+        if 'startTime' in request.query:
+            times = range(int(request.query['startTime']), newest + 1, STEP)
+        else:
+            end = int(request.query.get('endTime', newest))
+            end -= (end - START) % STEP
+            times = range(max(START, end - (limit - 1) * STEP), end + 1, STEP)
+        return web.json_response([self.candle(symbol, t) for t in list(times)[:limit]])
+
+    def event(self, symbol, open_time, closed):
+        c = self.candle(symbol, open_time)
+        return {'stream': f"{symbol.lower()}@kline_{INTERVAL}", 'data': {
+            'e': 'kline', 's': symbol, 'k': {
+                't': c[0], 'T': c[6], 's': symbol, 'i': INTERVAL, 'o': str(c[1]), 'h': str(c[2]),
+                'l': str(c[3]), 'c': str(c[4]), 'v': str(c[5]), 'n': c[8], 'x': closed,
+                'q': str(c[7]), 'V': str(c[9]), 'Q': str(c[10])}}}
+
+    async def stream(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.connections += 1
+        connection = self.connections
+
+        for _ in range(3):
+            for symbol in SYMBOLS:
+                self.closed[symbol] += STEP
+                await ws.send_json(self.event(symbol, self.closed[symbol], False))
+                await ws.send_json(self.event(symbol, self.closed[symbol], True))
+            await asyncio.sleep(0.1)
+
+        if connection == 1:
+            # Candles close while the client is disconnected, then BTC skips one on the stream
+            for symbol in SYMBOLS:
+                self.closed[symbol] += 2 * STEP
+            await ws.close()
+            return ws
+
+        self.closed['BTCUSDT'] += 2 * STEP
+        await ws.send_json(self.event('BTCUSDT', self.closed['BTCUSDT'], True))
+        await asyncio.sleep(5)
+        await ws.close()
+        return ws
+
+
+async def test_kline_stream():
+    """Stream, drop the connection, reconnect and verify every series has no holes"""
+    fake = FakeBinance()
+    app = web.Application()
+    app.router.add_get('/klines', fake.klines)
+    app.router.add_get('/stream', fake.stream)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, HOST, 0)  # Any free port, so a busy port never fails the test
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    candle_store_module.BINANCE_KLINES_ENDPOINT = f"http://{HOST}:{port}/klines"
+    db_path = os.path.join(tempfile.mkdtemp(), 'stream_test.db')
+    http = HTTPClient()
+    store = CandleStore(db_path, http_client=http, rate_limiter=ProviderRateLimiter({}))
+
+    evaluated = []
+
+    async def on_candles_closed(symbols):
+        evaluated.append(symbols)
+
+    stream = KlineStream(SYMBOLS, [INTERVAL], candle_store=store, http_client=http,
+                         on_candles_closed=on_candles_closed, base_url=f"ws://{HOST}:{port}", eval_delay=0.2)
+    await stream.start()
+    await asyncio.sleep(3)
+
+    ok = True
+    for symbol in SYMBOLS:
+        first = await store.get_first_open_time(symbol, INTERVAL)
+        last = await store.get_last_open_time(symbol, INTERVAL)
+        count = await store.count(symbol, INTERVAL)
+        contiguous = count == (last - first) // STEP + 1
+        up_to_date = last >= fake.closed[symbol]
+        ok = ok and contiguous and up_to_date
+        print(f"{'✅' if contiguous and up_to_date else '❌'} {symbol}: {count} candles, "
+              f"contiguous={contiguous}, up to date={up_to_date}")
+
+    print(f"✅ Stream stats: {stream.stats}")
+    print(f"✅ Evaluations fired: {len(evaluated)} ({sum(len(batch) for batch in evaluated)} symbols)")
+    print(f"{'✅' if stream.stats['reconnects'] >= 1 else '❌'} Reconnected {stream.stats['reconnects']} time(s)")
+    print(f"{'✅' if stream.stats['gaps'] >= 1 else '❌'} Gap backfills: {stream.stats['gaps']}")
+
+    await stream.stop()
+    await store.close()
+    await http.close()
+    await runner.cleanup()
+    return ok and stream.stats['reconnects'] >= 1 and stream.stats['gaps'] >= 1 and bool(evaluated)
+
+
+async def test_evaluation_scheduling():
+    """Closes during a running evaluation, or interrupted by a resubscribe, are still evaluated"""
+    evaluated = []
+
+    async def slow_evaluation(symbols):
+        evaluated.append(symbols)
+        await asyncio.sleep(0.3)
+
+    class IdleStore:
+        def set_live(self, keys, live=True):
+            pass
+
+    class IdleSocket:
+        """Connection that never delivers a message, so only the evaluation path runs"""
+        async def __aenter__(self):
+            await asyncio.Event().wait()
+
+        async def __aexit__(self, *exc):
+            return False
+
+    class IdleHTTP:
+        class session:
+            @staticmethod
+            def ws_connect(url, **kwargs):
+                return IdleSocket()
+
+    stream = KlineStream([], [INTERVAL], candle_store=IdleStore(), http_client=IdleHTTP(),
+                         on_candles_closed=slow_evaluation, eval_delay=0.05)
+    stream._schedule_evaluation('BTCUSDT')
+    await asyncio.sleep(0.1)
+    stream._schedule_evaluation('ETHUSDT')  # Arrives while BTCUSDT is being evaluated
+    await asyncio.sleep(0.8)
+    late_close_ok = evaluated == [['BTCUSDT'], ['ETHUSDT']]
+    print(f"{'✅' if late_close_ok else '❌'} Close during evaluation: {evaluated}")
+
+    evaluated.clear()
+    stream._schedule_evaluation('BTCUSDT')
+    await asyncio.sleep(0.1)
+    await stream.update_symbols(['BTCUSDT', 'ETHUSDT'])  # Restarts while BTCUSDT is being evaluated
+    await asyncio.sleep(0.6)
+    restart_ok = evaluated == [['BTCUSDT'], ['BTCUSDT']]
+    print(f"{'✅' if restart_ok else '❌'} Evaluation interrupted by resubscribe re-run: {evaluated}")
+
+    await stream.stop()
+    return late_close_ok and restart_ok and stream.eval_task is None
+
+
+async def main():
+    print("🚀 Starting Kline Stream Test\n")
+    passed = await test_evaluation_scheduling()
+    passed = await test_kline_stream() and passed
+    print(f"\n{'🎉 Kline stream test passed' if passed else '❌ Kline stream test failed'}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,5 +1,4 @@
 import asyncio
-import aiohttp
 from telegram import Update, Bot
 from telegram.ext import ApplicationBuilder, CommandHandler, ContextTypes
 from crypto_analyzer import CryptoAnalyzer
@@ -105,40 +104,40 @@ class CryptoTelegramBot:
         self.monitoring_active = True
         print("🚀 Starting cryptocurrency market monitoring...")
         
-        async with aiohttp.ClientSession() as session:
-            # Get all USDT trading pairs
-            symbols = await self.analyzer.get_all_usdt_pairs(session)
-            print(f"📊 Monitoring {len(symbols)} USDT pairs")
-            
-            if not symbols:
-                print("❌ No symbols found. Retrying in next cycle...")
-                return
+        session = self.analyzer.http.session
+        # Get all USDT trading pairs
+        symbols = await self.analyzer.get_all_usdt_pairs(session)
+        print(f"📊 Monitoring {len(symbols)} USDT pairs")
+        
+        if not symbols:
+            print("❌ No symbols found. Retrying in next cycle...")
+            return
+        
+        while self.monitoring_active:
+            print(f"🔍 Market scan started at {asyncio.get_event_loop().time()}")
+            signals_found = 0
             
-            while self.monitoring_active:
-                print(f"🔍 Market scan started at {asyncio.get_event_loop().time()}")
-                signals_found = 0
-                
-                # Check each symbol for trading signals
-                for symbol in symbols:
-                    try:
-                        if await self.analyzer.analyze_symbol(session, symbol):
-                            if symbol not in self.sent_signals:
-                                await self.send_signal(symbol)
-                                self.sent_signals.add(symbol)
-                                signals_found += 1
-                        else:
-                            # Remove from cache if signal is no longer valid
-                            self.sent_signals.discard(symbol)
-                    
-                    except Exception as e:
-                        print(f"❌ Error analyzing {symbol}: {e}")
-                        continue
+            # Check each symbol for trading signals
+            for symbol in symbols:
+                try:
+                    if await self.analyzer.analyze_symbol(session, symbol):
+                        if symbol not in self.sent_signals:
+                            await self.send_signal(symbol)
+                            self.sent_signals.add(symbol)
+                            signals_found += 1
+                    else:
+                        # Remove from cache if signal is no longer valid
+                        self.sent_signals.discard(symbol)
                 
-                print(f"✅ Market scan completed. Found {signals_found} new signals.")
-                print(f"⏳ Waiting {MONITORING_INTERVAL // 3600} hours until next scan...")
-                
-                # Wait for next monitoring cycle
-                await asyncio.sleep(MONITORING_INTERVAL)
+                except Exception as e:
+                    print(f"❌ Error analyzing {symbol}: {e}")
+                    continue
+            
+            print(f"✅ Market scan completed. Found {signals_found} new signals.")
+            print(f"⏳ Waiting {MONITORING_INTERVAL // 3600} hours until next scan...")
+            
+            # Wait for next monitoring cycle
+            await asyncio.sleep(MONITORING_INTERVAL)
     
     async def run(self):
         """Start the bot and monitoring system"""
@@ -7,20 +7,19 @@ for cryptocurrency trading signal generation.
 """
 
 import os
-import asyncio
-import aiohttp
-import pandas as pd
 from datetime import datetime, timedelta
 import json
 import time
+from http_client import http_client as shared_http_client
+from candle_store import candle_store
 
 class TradingViewDataFeed:
     """TradingView data feed integration for real-time market data"""
     
-    def __init__(self):
+    def __init__(self, http_client=None):
         self.username = os.getenv('TRADINGVIEW_USERNAME')
         self.password = os.getenv('TRADINGVIEW_PASSWORD')
-        self.session = None
+        self.http = http_client or shared_http_client  # Pooled session owned by the HTTP client
         self.authenticated = False
         
         # TradingView endpoints
@@ -57,6 +56,11 @@ class TradingViewDataFeed:
             else:
                 tv_symbol = f"BINANCE:{symbol}USDT"
             
+            # Real candles from the shared candle store take priority
+            klines = await candle_store.get_klines(tv_symbol.split(':')[1], interval, limit)
+            if klines:
+                return klines
+            
             # Check cache first
             cache_key = f"{tv_symbol}_{interval}_{limit}"
             if self.is_cached_data_valid(cache_key):
@@ -84,40 +88,40 @@ class TradingViewDataFeed:
         """Fetch real market data from TradingView"""
         try:
             # Use public API to get basic market data
-            async with aiohttp.ClientSession() as session:
-                # TradingView scanner endpoint for crypto data
-                scanner_data = {
-                    "filter": [
-                        {"left": "exchange", "operation": "equal", "right": "BINANCE"},
-                        {"left": "name", "operation": "match", "right": symbol.split(':')[1]}
-                    ],
-                    "options": {"lang": "en"},
-                    "symbols": {
-                        "query": {"types": []},
-                        "tickers": [symbol]
-                    },
-                    "columns": [
-                        "name", "close", "volume", "change", "Recommend.All",
-                        "RSI", "RSI[1]", "Stoch.K", "MACD.macd", "ADX"
-                    ],
-                    "sort": {"sortBy": "volume", "sortOrder": "desc"},
-                    "range": [0, 50]
-                }
-                
-                scanner_url = f"{self.base_url}/crypto/scan"
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                    'Content-Type': 'application/json'
-                }
-                
-                async with session.post(scanner_url, json=scanner_data, headers=headers) as resp:
-                    if resp.status == 200:
-                        result = await resp.json()
-                        return self.process_scanner_data(result, limit)
-                    else:
-                        print(f"⚠️ TradingView scanner API returned {resp.status}")
-                        return None
-                        
+            session = self.http.session
+            # TradingView scanner endpoint for crypto data
+            scanner_data = {
+                "filter": [
+                    {"left": "exchange", "operation": "equal", "right": "BINANCE"},
+                    {"left": "name", "operation": "match", "right": symbol.split(':')[1]}
+                ],
+                "options": {"lang": "en"},
+                "symbols": {
+                    "query": {"types": []},
+                    "tickers": [symbol]
+                },
+                "columns": [
+                    "name", "close", "volume", "change", "Recommend.All",
+                    "RSI", "RSI[1]", "Stoch.K", "MACD.macd", "ADX"
+                ],
+                "sort": {"sortBy": "volume", "sortOrder": "desc"},
+                "range": [0, 50]
+            }
+            
+            scanner_url = f"{self.base_url}/crypto/scan"
+            headers = {
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+                'Content-Type': 'application/json'
+            }
+            
+            async with session.post(scanner_url, json=scanner_data, headers=headers) as resp:
+                if resp.status == 200:
+                    result = await resp.json()
+                    return self.process_scanner_data(result, limit)
+                else:
+                    print(f"⚠️ TradingView scanner API returned {resp.status}")
+                    return None
+                    
         except Exception as e:
             print(f"❌ Error in fetch_market_data: {e}")
             return None
@@ -280,12 +284,7 @@ class TradingViewDataFeed:
             return None
     
     def close(self):
-        """Clean up resources"""
-        if self.session:
-            try:
-                asyncio.create_task(self.session.close())
-            except:
-                pass
+        """Clean up resources (the shared HTTP session is closed by its owner)"""
         self.data_cache.clear()
         print("🧹 TradingView integration closed")
 
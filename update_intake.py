@@ -0,0 +1,195 @@
+import asyncio
+import hmac
+import json
+import secrets
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Deque, Dict, Optional
+
+from broadcaster import percentile
+from config import (UPDATE_WORKERS, UPDATE_QUEUE_SIZE, WEBHOOK_HOST, WEBHOOK_PORT, WEBHOOK_PATH,
+                    WEBHOOK_SECRET, WEBHOOK_MAX_CONNECTIONS)
+
+if TYPE_CHECKING:
+    from aiohttp import web
+
+
+def update_chat_key(update: Dict[str, Any]) -> str:
+    """Chat an update belongs to; updates for the same key are handled in order"""
+    if 'message' in update:
+        message = update['message']
+        return str(message.get('chat', {}).get('id') or message.get('from', {}).get('id', ''))
+    if 'callback_query' in update:
+        callback = update['callback_query']
+        chat_id = (callback.get('message') or {}).get('chat', {}).get('id')
+        return str(chat_id or callback.get('from', {}).get('id', ''))
+    return ''
+
+
+class UpdateDispatcher:
+    """Handles updates from different chats in parallel while keeping each chat's updates in order"""
+
+    def __init__(self, handler: Callable[[Dict[str, Any]], Awaitable[None]], workers: int = UPDATE_WORKERS,
+                 queue_size: int = UPDATE_QUEUE_SIZE):
+        self.handler = handler
+        self.workers = workers  # Cap on handlers running at the same time
+        self.queue_size = queue_size
+        self.in_flight = asyncio.Semaphore(workers)
+        self.capacity = asyncio.Semaphore(queue_size)  # Full dispatcher pushes back on intake
+        self.chat_queues: Dict[str, Deque[Dict[str, Any]]] = {}
+        self.chat_tasks: Dict[str, asyncio.Task] = {}
+        self.pending = 0
+        self.running = 0
+        self.idle = asyncio.Event()
+        self.idle.set()
+        self.latencies: Deque[float] = deque(maxlen=1000)
+        self.stats = {'received': 0, 'handled': 0, 'errors': 0, 'max_queue': 0, 'max_in_flight': 0}
+
+    async def submit(self, update: Dict[str, Any]):
+        """Queue an update behind earlier ones from the same chat; waits while the dispatcher is full"""
+        await self.capacity.acquire()
+        key = update_chat_key(update)
+        self.chat_queues.setdefault(key, deque()).append(update)
+        self.pending += 1
+        self.idle.clear()
+        self.stats['received'] += 1
+        self.stats['max_queue'] = max(self.stats['max_queue'], self.pending)
+
+        if key not in self.chat_tasks:
+            self.chat_tasks[key] = asyncio.create_task(self._drain_chat(key))
+
+    async def _drain_chat(self, key: str):
+        queue = self.chat_queues[key]
+        try:
+            while queue:
+                update = queue.popleft()
+                async with self.in_flight:
+                    self.running += 1
+                    self.stats['max_in_flight'] = max(self.stats['max_in_flight'], self.running)
+                    started = time.perf_counter()
+                    try:
+                        await self.handler(update)
+                        self.stats['handled'] += 1
+                    except Exception as e:
+                        self.stats['errors'] += 1
+                        print(f"❌ Error handling update {update.get('update_id')}: {e}")
+                    finally:
+                        self.latencies.append(time.perf_counter() - started)
+                        self.running -= 1
+                        self.pending -= 1
+                        self.capacity.release()
+        finally:
+            del self.chat_tasks[key]
+            del self.chat_queues[key]
+            if not self.pending:
+                self.idle.set()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Queue depth and handler latency percentiles"""
+        ordered = sorted(self.latencies)
+        return {
+            **self.stats,
+            'queue_depth': self.pending,
+            'in_flight': self.running,
+            'active_chats': len(self.chat_tasks),
+            'latency_p50': percentile(ordered, 50),
+            'latency_p95': percentile(ordered, 95),
+            'latency_p99': percentile(ordered, 99)
+        }
+
+    async def stop(self, drain_timeout: float = 10):
+        """Finish queued updates (up to drain_timeout seconds), then cancel what is left"""
+        try:
+            await asyncio.wait_for(self.idle.wait(), timeout=drain_timeout)
+        except asyncio.TimeoutError:
+            print(f"⚠️ Stopping with {self.pending} updates still queued")
+        tasks = list(self.chat_tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class WebhookServer:
+    """aiohttp endpoint that receives Telegram updates and hands them to the dispatcher"""
+
+    def __init__(self, http, base_url: str, dispatcher: UpdateDispatcher, public_url: str,
+                 host: str = WEBHOOK_HOST, port: int = WEBHOOK_PORT, path: str = WEBHOOK_PATH,
+                 secret_token: str = WEBHOOK_SECRET):
+        self.http = http
+        self.base_url = base_url  # Bot API base, used for setWebhook/deleteWebhook
+        self.dispatcher = dispatcher
+        self.public_url = public_url.rstrip('/')
+        self.host = host
+        self.port = port
+        self.path = path
+        # Never run an unauthenticated endpoint: without a configured secret, generate one for this run
+        self.secret_token = secret_token or secrets.token_urlsafe(32)
+        self.runner: Optional['web.AppRunner'] = None
+        self.last_update_at: Optional[float] = None
+
+    async def handle_update(self, request: 'web.Request') -> 'web.Response':
+        from aiohttp import web
+        received = request.headers.get('X-Telegram-Bot-Api-Secret-Token', '')
+        if not hmac.compare_digest(received.encode(), self.secret_token.encode()):
+            return web.Response(status=403)
+        try:
+            update = await request.json()
+        except (json.JSONDecodeError, ValueError):
+            return web.Response(status=400)
+
+        # Acknowledge immediately - handlers run on the worker pool, not in the request
+        await self.dispatcher.submit(update)
+        self.last_update_at = time.time()
+        return web.Response(text='ok')
+
+    async def health(self, request: 'web.Request') -> 'web.Response':
+        from aiohttp import web
+        return web.json_response({'status': 'ok', **self.dispatcher.get_metrics()})
+
+    async def register_webhook(self) -> bool:
+        """Point Telegram at this server"""
+        data = {
+            'url': f"{self.public_url}{self.path}",
+            'max_connections': WEBHOOK_MAX_CONNECTIONS,
+            'allowed_updates': json.dumps(['message', 'callback_query']),
+            'secret_token': self.secret_token
+        }
+        try:
+            async with self.http.session.post(f"{self.base_url}/setWebhook", data=data) as response:
+                result = await response.json(content_type=None)
+                if response.status == 200 and result.get('ok'):
+                    print(f"✅ Webhook registered: {data['url']}")
+                    return True
+                print(f"❌ setWebhook failed: {response.status} - {result.get('description')}")
+                return False
+        except Exception as e:
+            print(f"❌ setWebhook error: {e}")
+            return False
+
+    async def start(self) -> bool:
+        """Serve the webhook endpoint and register it with Telegram"""
+        from aiohttp import web  # The server side of aiohttp is only loaded in webhook mode
+        app = web.Application()
+        app.router.add_post(self.path, self.handle_update)
+        app.router.add_get('/health', self.health)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        try:
+            await web.TCPSite(self.runner, self.host, self.port).start()
+        except OSError as e:
+            print(f"❌ Webhook server could not bind {self.host}:{self.port}: {e}")
+            await self.stop()
+            return False
+        print(f"🌐 Webhook server listening on {self.host}:{self.port}{self.path}")
+
+        if not await self.register_webhook():
+            await self.stop()
+            return False
+        return True
+
+    async def stop(self):
+        """Stop accepting updates and drain the worker pool"""
+        if self.runner:
+            await self.runner.cleanup()
+            self.runner = None
+        await self.dispatcher.stop()
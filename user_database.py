@@ -1,20 +1,30 @@
-import os
-import asyncio
 import aiosqlite
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import List, Dict, Any, Tuple
 import json
 
-class UserDatabase:
-    def __init__(self):
+from user_storage import UserStorage, current_week
+
+
+class UserDatabase(UserStorage):
+    """SQLite user store - a single aiosqlite connection to a local file"""
+    
+    backend_name = 'sqlite'
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
         self.db_path = 'crypto_bot.db'
-        self.db = None
         
     async def init_database(self):
         """Initialize SQLite database and create tables"""
         try:
             self.db = await aiosqlite.connect(self.db_path)
+            await self.apply_pragmas()
             await self.create_tables()
+            await self.migrate()
+            cursor = await self.db.execute('SELECT user_id FROM users')
+            self.known_users = {row[0] for row in await cursor.fetchall()}
+            self.start_flush_loop()
             print("✅ SQLite database initialized successfully")
             return True
         except Exception as e:
@@ -88,109 +98,119 @@ class UserDatabase:
             )
         ''')
         
+        # Durable bot state (subscriptions, languages, cooldowns) as (kind, key) -> value
+        await self.db.execute('''
+            CREATE TABLE IF NOT EXISTS bot_state (
+                kind TEXT,
+                key TEXT,
+                value TEXT,
+                updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (kind, key)
+            )
+        ''')
+        
         await self.db.commit()
         print("✅ SQLite database tables created successfully")
     
-    async def add_or_update_user(self, user_data: Dict[str, Any]) -> bool:
-        """Add new user or update existing user with comprehensive tracking"""
-        if not self.db:
-            print(f"⚠️ Database not initialized, skipping user tracking for {user_data.get('id', 'unknown')}")
-            return False
-            
-        try:
-            user_id = str(user_data.get('id', ''))
-            username = user_data.get('username', '')
-            first_name = user_data.get('first_name', '')
-            last_name = user_data.get('last_name', '')
-            language_code = user_data.get('language_code', 'en')
-            
-            # Check if user exists
-            cursor = await self.db.execute('SELECT * FROM users WHERE user_id = ?', (user_id,))
-            existing_user = await cursor.fetchone()
-            
-            if existing_user:
-                # Update existing user
-                await self.db.execute('''
-                    UPDATE users SET 
-                        username = ?,
-                        first_name = ?,
-                        last_name = ?,
-                        language_code = ?,
-                        last_activity_date = datetime('now'),
-                        total_commands = total_commands + 1,
-                        updated_at = datetime('now')
-                    WHERE user_id = ?
-                ''', (username, first_name, last_name, language_code, user_id))
-                
-                # Update weekly activity
-                await self.update_weekly_activity(user_id, 'command_used')
-                
-                await self.db.commit()
-                return True
-            else:
-                # Insert new user
-                await self.db.execute('''
-                    INSERT INTO users (
-                        user_id, username, first_name, last_name, 
-                        language_code, user_type, weekly_activity_count
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (user_id, username, first_name, last_name, language_code, 'free', 1))
-                
-                # Create initial weekly activity record
-                await self.update_weekly_activity(user_id, 'first_interaction')
-                
-                await self.db.commit()
-                print(f"✅ Added new user to database: {user_id} ({first_name})")
-                return True
-                
-        except Exception as e:
-            print(f"❌ Error adding/updating user {user_data.get('id', 'unknown')}: {e}")
-            return False
+    async def apply_pragmas(self):
+        """WAL journal and tuned pragmas - readers no longer block behind writes"""
+        await self.db.execute('PRAGMA journal_mode=WAL')
+        await self.db.execute('PRAGMA synchronous=NORMAL')  # Safe with WAL, avoids an fsync per commit
+        await self.db.execute('PRAGMA temp_store=MEMORY')
+        await self.db.execute('PRAGMA cache_size=-16000')  # 16 MB page cache
+        await self.db.execute('PRAGMA busy_timeout=5000')
     
-    async def update_weekly_activity(self, user_id: str, activity_type: str):
-        """Update weekly activity tracking for user"""
-        if not self.db:
-            return
+    async def migrate(self):
+        """Apply schema migrations newer than the database's user_version"""
+        cursor = await self.db.execute('PRAGMA user_version')
+        version = (await cursor.fetchone())[0]
+        
+        if version < 1:
+            # Secondary indexes for the admin/stat queries
+            await self.db.execute('CREATE INDEX IF NOT EXISTS idx_user_activity_user_id ON user_activity(user_id)')
+            await self.db.execute('CREATE INDEX IF NOT EXISTS idx_weekly_usage_week_start ON weekly_usage(week_start_date)')
+            await self.db.execute('CREATE INDEX IF NOT EXISTS idx_users_last_activity ON users(last_activity_date)')
+            await self.db.execute('CREATE INDEX IF NOT EXISTS idx_users_user_type ON users(user_type)')
             
+            # Maintained activity counter replaces the per-user COUNT(*) subquery
+            cursor = await self.db.execute('PRAGMA table_info(users)')
+            if 'total_activities' not in [row[1] for row in await cursor.fetchall()]:
+                await self.db.execute('ALTER TABLE users ADD COLUMN total_activities INTEGER DEFAULT 0')
+            await self.db.execute('''
+                UPDATE users SET total_activities = (
+                    SELECT COUNT(*) FROM user_activity a WHERE a.user_id = users.user_id
+                )
+            ''')
+            await self.db.execute('PRAGMA user_version = 1')
+            await self.db.commit()
+            print("✅ Database migrated to schema version 1 (indexes, activity counter)")
+    
+    async def _write_batch(self, profiles, weekly, activity, state):
+        """Upsert profiles, weekly counts and bot state and append activity in a single transaction"""
         try:
-            # Get current week start (Monday)
-            now = datetime.now()
-            days_since_monday = now.weekday()
-            week_start = (now - timedelta(days=days_since_monday)).date().isoformat()
-            week_end = (now - timedelta(days=days_since_monday) + timedelta(days=6)).date().isoformat()
+            await self.db.executemany('''
+                INSERT INTO users (
+                    user_id, username, first_name, last_name, language_code, user_type,
+                    weekly_activity_count, total_commands, last_activity_date, updated_at, total_activities
+                ) VALUES (?, ?, ?, ?, ?, 'free', 1, ?, ?, ?,
+                          (SELECT COUNT(*) FROM user_activity WHERE user_id = ?))
+                ON CONFLICT(user_id) DO UPDATE SET
+                    username = excluded.username,
+                    first_name = excluded.first_name,
+                    last_name = excluded.last_name,
+                    language_code = excluded.language_code,
+                    last_activity_date = excluded.last_activity_date,
+                    total_commands = total_commands + excluded.total_commands,
+                    updated_at = excluded.updated_at
+            ''', [
+                (user_id, p['username'], p['first_name'], p['last_name'], p['language_code'],
+                 p['commands'], p['last_activity'], p['last_activity'], user_id)
+                for user_id, p in profiles.items()
+            ])
             
-            # Check if weekly record exists
-            cursor = await self.db.execute('''
-                SELECT activity_count FROM weekly_usage 
-                WHERE user_id = ? AND week_start_date = ?
-            ''', (user_id, week_start))
-            existing = await cursor.fetchone()
+            await self.db.executemany('''
+                INSERT INTO weekly_usage (user_id, week_start_date, week_end_date, activity_count, last_activity)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(user_id, week_start_date) DO UPDATE SET
+                    activity_count = activity_count + excluded.activity_count,
+                    last_activity = excluded.last_activity
+            ''', [
+                (user_id, week_start, w['week_end'], w['count'], w['last_activity'])
+                for (user_id, week_start), w in weekly.items()
+            ])
             
-            if existing:
-                # Update existing weekly record
-                await self.db.execute('''
-                    UPDATE weekly_usage SET 
-                        activity_count = activity_count + 1,
-                        last_activity = datetime('now')
-                    WHERE user_id = ? AND week_start_date = ?
-                ''', (user_id, week_start))
-            else:
-                # Insert new weekly record
-                await self.db.execute('''
-                    INSERT INTO weekly_usage (user_id, week_start_date, week_end_date, activity_count, last_activity)
-                    VALUES (?, ?, ?, 1, datetime('now'))
-                ''', (user_id, week_start, week_end))
+            await self.db.executemany('''
+                INSERT INTO user_activity (user_id, activity_type, activity_data, timestamp)
+                VALUES (?, ?, ?, ?)
+            ''', activity)
             
-            # Log specific activity
-            await self.db.execute('''
-                INSERT INTO user_activity (user_id, activity_type, activity_data)
-                VALUES (?, ?, ?)
-            ''', (user_id, activity_type, json.dumps({'timestamp': now.isoformat()})))
+            activity_counts: Dict[str, int] = {}
+            for row in activity:
+                activity_counts[row[0]] = activity_counts.get(row[0], 0) + 1
+            await self.db.executemany(
+                'UPDATE users SET total_activities = total_activities + ? WHERE user_id = ?',
+                [(count, user_id) for user_id, count in activity_counts.items()]
+            )
+            
+            await self.db.executemany('''
+                INSERT INTO bot_state (kind, key, value, updated_at) VALUES (?, ?, ?, datetime('now'))
+                ON CONFLICT(kind, key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at
+            ''', [(kind, key, value) for (kind, key), value in state.items() if value is not None])
+            await self.db.executemany('DELETE FROM bot_state WHERE kind = ? AND key = ?',
+                                      [key for key, value in state.items() if value is None])
             
             await self.db.commit()
-                
-        except Exception as e:
-            print(f"❌ Error updating weekly activity for {user_id}: {e}")
+        except Exception:
+            try:
+                await self.db.rollback()
+            except Exception:
+                pass
+            raise
+    
+    async def load_state(self) -> List[Tuple[str, str, str]]:
+        """Every persisted (kind, key, value) bot state row, in one query"""
+        cursor = await self.db.execute('SELECT kind, key, value FROM bot_state')
+        return await cursor.fetchall()
     
     async def get_all_users_with_profiles(self) -> List[Dict[str, Any]]:
         """Get all user profiles with detailed information"""
@@ -198,6 +218,8 @@ class UserDatabase:
             return []
             
         try:
+            await self.flush()  # Include buffered activity
+            
             # Get current week start
             now = datetime.now()
             days_since_monday = now.weekday()
@@ -205,10 +227,12 @@ class UserDatabase:
             
             cursor = await self.db.execute('''
                 SELECT 
-                    u.*,
+                    u.user_id, u.username, u.first_name, u.last_name, u.language_code,
+                    u.selected_language, u.user_type, u.first_interaction_date,
+                    u.last_activity_date, u.total_commands, u.total_signals_received,
                     COALESCE(w.activity_count, 0) as current_week_activity,
                     COALESCE(w.last_activity, u.last_activity_date) as last_week_activity,
-                    (SELECT COUNT(*) FROM user_activity WHERE user_id = u.user_id) as total_activities
+                    u.total_activities
                 FROM users u
                 LEFT JOIN weekly_usage w ON u.user_id = w.user_id 
                     AND w.week_start_date = ?
@@ -232,8 +256,8 @@ class UserDatabase:
                     'last_activity_date': user[8],
                     'total_commands': user[9],
                     'total_signals_received': user[10],
-                    'current_week_activity': user[17],
-                    'total_activities': user[19]
+                    'current_week_activity': user[11],
+                    'total_activities': user[13]
                 }
                 result.append(user_dict)
             
@@ -273,6 +297,8 @@ class UserDatabase:
             return {}
             
         try:
+            await self.flush()  # Include buffered activity
+            
             # Total users ever registered
             cursor = await self.db.execute('SELECT COUNT(*) FROM users')
             total_users_result = await cursor.fetchone()
@@ -284,7 +310,7 @@ class UserDatabase:
             # Users active in last 24 hours  
             cursor = await self.db.execute('''
                 SELECT COUNT(*) FROM users 
-                WHERE datetime(last_activity_date) > datetime('now', '-24 hours')
+                WHERE last_activity_date > datetime('now', '-24 hours')
             ''')
             daily_result = await cursor.fetchone()
             daily_active = daily_result[0] if daily_result else 0
@@ -351,29 +377,57 @@ class UserDatabase:
             print(f"❌ Error logging signal: {e}")
     
     async def update_user_signals_received(self, user_ids: List[str]):
-        """Update signal count for users who received a signal"""
-        if not self.db:
+        """Update signal count for users who received a signal (set-based, one transaction)"""
+        if not self.db or not user_ids:
             return
             
-        try:
-            for user_id in user_ids:
+        week_start, week_end = current_week()
+        activity_data = json.dumps({'timestamp': datetime.now().isoformat()})
+        
+        # Shares the connection with the write-behind flush - keep the two transactions apart
+        async with self.flush_lock:
+            # Users still only in the buffer have no row for the UPDATE yet - write them first
+            if any(str(user_id) in self.pending_profiles for user_id in user_ids):
+                await self._flush_locked()
+            
+            try:
+                await self.db.execute('''
+                    CREATE TEMP TABLE IF NOT EXISTS signal_recipients (user_id TEXT PRIMARY KEY)
+                ''')
+                await self.db.execute('DELETE FROM signal_recipients')
+                await self.db.executemany('INSERT OR IGNORE INTO signal_recipients (user_id) VALUES (?)',
+                                          [(str(user_id),) for user_id in user_ids])
+                
                 await self.db.execute('''
                     UPDATE users SET 
                         total_signals_received = total_signals_received + 1,
+                        total_activities = total_activities + 1,
                         last_activity_date = datetime('now')
-                    WHERE user_id = ?
-                ''', (user_id,))
+                    WHERE user_id IN (SELECT user_id FROM signal_recipients)
+                ''')
                 
-                # Update weekly activity for signal reception
-                await self.update_weekly_activity(user_id, 'signal_received')
-            
-            await self.db.commit()
-                    
-        except Exception as e:
-            print(f"❌ Error updating user signal counts: {e}")
+                # Weekly activity for signal reception
+                await self.db.execute('''
+                    INSERT INTO weekly_usage (user_id, week_start_date, week_end_date, activity_count, last_activity)
+                    SELECT user_id, ?, ?, 1, datetime('now') FROM signal_recipients WHERE true
+                    ON CONFLICT(user_id, week_start_date) DO UPDATE SET
+                        activity_count = activity_count + 1,
+                        last_activity = excluded.last_activity
+                ''', (week_start, week_end))
+                
+                await self.db.execute('''
+                    INSERT INTO user_activity (user_id, activity_type, activity_data)
+                    SELECT user_id, 'signal_received', ? FROM signal_recipients
+                ''', (activity_data,))
+                
+                await self.db.commit()
+                        
+            except Exception as e:
+                print(f"❌ Error updating user signal counts: {e}")
+                try:
+                    await self.db.rollback()
+                except Exception:
+                    pass
     
-    async def close(self):
-        """Close database connection"""
-        if self.db:
-            await self.db.close()
-            print("✅ Database connection closed")
\ No newline at end of file
+    async def _close_backend(self):
+        await self.db.close()
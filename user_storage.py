@@ -0,0 +1,226 @@
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, Dict, Any, Set, Tuple
+
+from config import ACTIVITY_FLUSH_INTERVAL, ACTIVITY_FLUSH_SIZE, USER_DB_BACKEND
+
+
+def utc_timestamp() -> str:
+    """Current UTC time in SQLite's datetime('now') format"""
+    return datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+
+
+def current_week() -> Tuple[str, str]:
+    """ISO dates of this week's Monday and Sunday"""
+    now = datetime.now()
+    week_start = now - timedelta(days=now.weekday())
+    return week_start.date().isoformat(), (week_start + timedelta(days=6)).date().isoformat()
+
+
+class UserStorage(ABC):
+    """User store interface; activity is buffered here and written by the backend in batches"""
+
+    backend_name = 'storage'
+
+    def __init__(self, flush_interval: float = ACTIVITY_FLUSH_INTERVAL, flush_size: int = ACTIVITY_FLUSH_SIZE):
+        self.db = None  # Backend handle (connection or pool); None until init_database succeeds
+
+        # Write-behind buffer: activity is coalesced in memory and flushed in one transaction
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self.known_users: Set[str] = set()
+        self.pending_profiles: Dict[str, Dict[str, Any]] = {}  # user_id -> latest profile + command count
+        self.pending_weekly: Dict[Tuple[str, str], Dict[str, Any]] = {}  # (user_id, week_start) -> counts
+        self.pending_activity: List[Tuple[str, str, str, str]] = []
+        self.pending_events = 0
+        self.pending_state: Dict[Tuple[str, str], Optional[str]] = {}  # (kind, key) -> value, None deletes
+        self.flush_lock = asyncio.Lock()
+        self.flush_requested = asyncio.Event()
+        self.flush_task: Optional[asyncio.Task] = None
+        self.closing = False
+
+    # Backend operations
+
+    @abstractmethod
+    async def init_database(self) -> bool:
+        ...
+
+    @abstractmethod
+    async def _write_batch(self, profiles: Dict[str, Dict[str, Any]], weekly: Dict[Tuple[str, str], Dict[str, Any]],
+                           activity: List[Tuple[str, str, str, str]], state: Dict[Tuple[str, str], Optional[str]]):
+        """Write one flushed batch atomically; raise to have it requeued"""
+        ...
+
+    @abstractmethod
+    async def load_state(self) -> List[Tuple[str, str, str]]:
+        """Every persisted (kind, key, value) bot state row, in one query"""
+        ...
+
+    @abstractmethod
+    async def _close_backend(self):
+        ...
+
+    @abstractmethod
+    async def get_all_users_with_profiles(self) -> List[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    async def get_weekly_active_users(self) -> int:
+        ...
+
+    @abstractmethod
+    async def get_user_stats(self) -> Dict[str, Any]:
+        ...
+
+    @abstractmethod
+    async def log_signal_sent(self, symbol: str, signal_data: str, user_count: int):
+        ...
+
+    @abstractmethod
+    async def update_user_signals_received(self, user_ids: List[str]):
+        ...
+
+    # Write-behind buffering shared by every backend
+
+    def start_flush_loop(self):
+        self.closing = False
+        if self.flush_task is None or self.flush_task.done():
+            self.flush_task = asyncio.create_task(self._flush_loop())
+
+    async def add_or_update_user(self, user_data: Dict[str, Any]) -> bool:
+        """Record a user interaction; written to the database by the next flush"""
+        if not self.db:
+            print(f"⚠️ Database not initialized, skipping user tracking for {user_data.get('id', 'unknown')}")
+            return False
+
+        user_id = str(user_data.get('id', ''))
+        profile = self.pending_profiles.get(user_id)
+        if profile is None:
+            profile = self.pending_profiles[user_id] = {'commands': 0}
+        profile.update({
+            'username': user_data.get('username', ''),
+            'first_name': user_data.get('first_name', ''),
+            'last_name': user_data.get('last_name', ''),
+            'language_code': user_data.get('language_code', 'en'),
+            'last_activity': utc_timestamp()
+        })
+
+        if user_id in self.known_users:
+            profile['commands'] += 1
+            await self.update_weekly_activity(user_id, 'command_used')
+        else:
+            # First interaction creates the row; total_commands starts at 0 as before
+            self.known_users.add(user_id)
+            await self.update_weekly_activity(user_id, 'first_interaction')
+            print(f"✅ Added new user to database: {user_id} ({profile['first_name']})")
+        return True
+
+    async def update_weekly_activity(self, user_id: str, activity_type: str):
+        """Buffer weekly activity tracking for user"""
+        if not self.db:
+            return
+
+        week_start, week_end = current_week()
+        weekly = self.pending_weekly.get((user_id, week_start))
+        if weekly is None:
+            weekly = self.pending_weekly[(user_id, week_start)] = {'week_end': week_end, 'count': 0}
+        weekly['count'] += 1
+        weekly['last_activity'] = utc_timestamp()
+
+        # Log specific activity
+        self.pending_activity.append((user_id, activity_type,
+                                      json.dumps({'timestamp': datetime.now().isoformat()}),
+                                      weekly['last_activity']))
+
+        self.pending_events += 1
+        if self.pending_events >= self.flush_size:
+            self.flush_requested.set()
+
+    def set_state(self, kind: str, key: str, value: Optional[str], urgent: bool = False):
+        """Buffer a bot state change (None deletes it); urgent changes are flushed right away"""
+        self.pending_state[(kind, key)] = value
+        if urgent:
+            self.flush_requested.set()
+
+    async def _flush_loop(self):
+        """Flush buffered activity on a timer or as soon as the size threshold is hit"""
+        while not self.closing:
+            try:
+                await asyncio.wait_for(self.flush_requested.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self.flush_requested.clear()
+            # Shielded so close() cannot cancel a batch halfway through its transaction
+            await asyncio.shield(self.flush())
+
+    async def flush(self) -> int:
+        """Write all buffered activity in a single transaction; returns the number of events written"""
+        async with self.flush_lock:
+            return await self._flush_locked()
+
+    async def _flush_locked(self) -> int:
+        """Body of flush(); the caller holds flush_lock"""
+        if not self.db or not (self.pending_events or self.pending_state):
+            return 0
+
+        # Swap buffers so new events keep accumulating while this batch is written
+        profiles, self.pending_profiles = self.pending_profiles, {}
+        weekly, self.pending_weekly = self.pending_weekly, {}
+        activity, self.pending_activity = self.pending_activity, []
+        events, self.pending_events = self.pending_events, 0
+        state, self.pending_state = self.pending_state, {}
+
+        try:
+            await self._write_batch(profiles, weekly, activity, state)
+            return events
+        except Exception as e:
+            print(f"❌ Error flushing user activity ({events} events): {e}")
+            self._requeue(profiles, weekly, activity, events, state)
+            return 0
+
+    def _requeue(self, profiles, weekly, activity, events, state):
+        """Merge a failed batch back in front of anything buffered since"""
+        for user_id, profile in profiles.items():
+            newer = self.pending_profiles.get(user_id)
+            if newer:
+                newer['commands'] += profile['commands']
+            else:
+                self.pending_profiles[user_id] = profile
+        for key, counts in weekly.items():
+            newer = self.pending_weekly.get(key)
+            if newer:
+                newer['count'] += counts['count']
+            else:
+                self.pending_weekly[key] = counts
+        self.pending_activity = activity + self.pending_activity
+        self.pending_events += events
+        for key, value in state.items():
+            self.pending_state.setdefault(key, value)  # A newer change to the same key wins
+
+    async def close(self):
+        """Flush buffered activity and close the backend"""
+        if self.flush_task:
+            # Wake the loop and let it exit after its current batch - cancelling it can be lost in wait_for
+            self.closing = True
+            self.flush_requested.set()
+            await asyncio.gather(self.flush_task, return_exceptions=True)
+            self.flush_task = None
+        if self.db:
+            written = await self.flush()
+            if self.pending_events or self.pending_state:
+                print(f"⚠️ {self.pending_events} activity events and {len(self.pending_state)} state changes "
+                      f"could not be written before shutdown")
+            await self._close_backend()
+            self.db = None
+            print(f"✅ Database connection closed ({written} buffered events flushed)")
+
+
+def create_user_database(backend: str = USER_DB_BACKEND) -> UserStorage:
+    """User store for the configured backend ('sqlite' or 'postgres')"""
+    if backend == 'postgres':
+        from postgres_user_database import PostgresUserDatabase
+        return PostgresUserDatabase()
+    from user_database import UserDatabase
+    return UserDatabase()